@@ -0,0 +1,90 @@
+"""
+Concurrent fetching for batches of endpoint requests.
+
+Endpoints normally fire a single blocking request from ``__init__``. The
+helpers in this module build each endpoint with ``get_request=False`` and run
+the requests on a thread pool instead, yielding them as they complete.
+
+Example:
+    >>> from nba_api.library.batch import fetch_many
+    >>> from nba_api.stats.endpoints import BoxScoreTraditionalV3
+    >>> game_ids = ['0022400061', '0022400062']
+    >>> for result in fetch_many(
+    ...     BoxScoreTraditionalV3, [{'game_id': game_id} for game_id in game_ids]
+    ... ):
+    ...     if result.error is None:
+    ...         df = result.endpoint.player_stats.get_data_frame()
+"""
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+
+class FetchResult:
+    """Outcome of a single request made by ``fetch_many``.
+
+    Attributes:
+        index (int): Position of the request in the supplied kwargs list.
+        kwargs (dict): Keyword arguments the endpoint was built with.
+        endpoint (Endpoint): The endpoint instance. Its data is only loaded
+            when ``error`` is None.
+        error (Exception): Exception raised while building or requesting the
+            endpoint, or None on success.
+    """
+
+    def __init__(self, index, kwargs, endpoint=None, error=None):
+        self.index = index
+        self.kwargs = kwargs
+        self.endpoint = endpoint
+        self.error = error
+
+    @property
+    def ok(self):
+        return self.error is None
+
+    def __repr__(self):
+        status = "ok" if self.ok else "error={!r}".format(self.error)
+        return "FetchResult(index={}, kwargs={!r}, {})".format(
+            self.index, self.kwargs, status
+        )
+
+
+def fetch_many(endpoint_class, kwargs_list, max_workers=8, raise_on_error=False):
+    """Request many instances of an endpoint concurrently.
+
+    Args:
+        endpoint_class (type): Stats or live endpoint class, e.g.
+            ``BoxScoreTraditionalV3``.
+        kwargs_list (iterable): One dict of constructor keyword arguments per
+            request. ``get_request`` must not be included.
+        max_workers (int, optional): Size of the thread pool. Defaults to 8.
+            Keep ``NBAHTTP.pool_maxsize`` at least this large so pooled
+            connections are reused rather than discarded.
+        raise_on_error (bool, optional): Re-raise the first failed request
+            instead of yielding it. Defaults to False.
+
+    Yields:
+        FetchResult: One result per request, in completion order.
+    """
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        futures = {}
+        for index, kwargs in enumerate(kwargs_list):
+            result = FetchResult(index=index, kwargs=kwargs)
+            try:
+                result.endpoint = endpoint_class(**kwargs, get_request=False)
+            except Exception as error:
+                if raise_on_error:
+                    raise
+                result.error = error
+                yield result
+                continue
+            futures[executor.submit(result.endpoint.get_request)] = result
+
+        for future in as_completed(futures):
+            result = futures[future]
+            result.error = future.exception()
+            if result.error is not None and raise_on_error:
+                raise result.error
+            yield result
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -0,0 +1,98 @@
+"""
+In-flight de-duplication of identical requests.
+
+When several threads or asyncio tasks request the same url with the same
+parameters at the same time, only the first one goes to the network. The
+others wait for its result, so a burst of N identical requests costs one
+round trip. Requests are only shared while they are in flight; use a cache
+(see ``nba_api.library.cache``) to reuse finished responses.
+
+NBAHTTP coalesces requests by default. Set ``NBAHTTP.coalesce_requests`` to
+False to disable it.
+"""
+
+import asyncio
+import threading
+import weakref
+from concurrent.futures import Future
+
+
+class RequestCoalescer:
+    """Shares the result of concurrent calls made with the same key.
+
+    Attributes:
+        coalesced (int): Calls that were answered by another call's result.
+    """
+
+    def __init__(self):
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._futures = {}
+        self._async_futures = weakref.WeakKeyDictionary()
+
+    def run(self, key, function, *args):
+        """Call ``function(*args)`` unless a call with ``key`` is in flight.
+
+        Args:
+            key (str): Identifies equivalent calls.
+            function (callable): Performs the work.
+
+        Returns:
+            The result of ``function``, possibly from another thread's call.
+            Exceptions are raised in every waiting thread.
+        """
+        with self._lock:
+            future = self._futures.get(key)
+            leader = future is None
+            if leader:
+                future = self._futures[key] = Future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return future.result()
+
+        try:
+            result = function(*args)
+        except BaseException as exception:
+            future.set_exception(exception)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._futures[key]
+
+    async def arun(self, key, function, *args):
+        """Await ``function(*args)`` unless a call with ``key`` is in flight.
+
+        Futures are tracked per event loop, so calls are only shared between
+        tasks running on the same loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            futures = self._async_futures.setdefault(loop, {})
+            future = futures.get(key)
+            leader = future is None
+            if leader:
+                future = futures[key] = loop.create_future()
+            else:
+                self.coalesced += 1
+        if not leader:
+            return await asyncio.shield(future)
+
+        try:
+            result = await function(*args)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exception:
+            future.set_exception(exception)
+            # Mark the exception as retrieved in case nobody else was waiting.
+            future.exception()
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del futures[key]
@@ -1,9 +1,19 @@
 import os
-import json
-import random
+import copy
+import time
+import asyncio
+import weakref
+from collections.abc import Mapping, Sequence
+from urllib.parse import quote_plus, urlparse
+
 import requests
 
-from urllib.parse import quote_plus
+from nba_api.library.cache import MemoryCache, get_cache_key
+from nba_api.library import jsonbackend
+from nba_api.library.coalesce import RequestCoalescer
+from nba_api.library.metrics import RequestMetrics, emit, get_wire_bytes, has_hooks
+from nba_api.library.proxy import ProxyPool
+from nba_api.library.stream import iter_result_set_rows
 
 try:
     from nba_api.library.debug.debug import DEBUG
@@ -22,6 +32,16 @@ try:
 except ImportError:
     PROXY = ""
 
+try:
+    import httpx
+
+    HTTPX = True
+    # Errors raised by async requests that a retry policy may retry.
+    ASYNC_TRANSPORT_ERRORS = (httpx.TransportError,)
+except ImportError:
+    HTTPX = False
+    ASYNC_TRANSPORT_ERRORS = ()
+
 
 if DEBUG:
     from hashlib import md5
@@ -29,20 +49,94 @@ if DEBUG:
     print("DEBUG MODE")
 
 
+def make_read_only(data):
+    """Wrap decoded JSON so it cannot be modified.
+
+    Dictionaries and lists are wrapped lazily as they are accessed, so the
+    view costs nothing for the parts of a payload that are never read.
+    """
+    if isinstance(data, dict):
+        return ReadOnlyDict(data)
+    if isinstance(data, list):
+        return ReadOnlyList(data)
+    return data
+
+
+class ReadOnlyDict(Mapping):
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, key):
+        return make_read_only(self._data[key])
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return "ReadOnlyDict({!r})".format(self._data)
+
+
+class ReadOnlyList(Sequence):
+    def __init__(self, data):
+        self._data = data
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return ReadOnlyList(self._data[index])
+        return make_read_only(self._data[index])
+
+    def __len__(self):
+        return len(self._data)
+
+    def __repr__(self):
+        return "ReadOnlyList({!r})".format(self._data)
+
+
 class NBAResponse:
-    def __init__(self, response, status_code, url):
-        self._response = response
+    def __init__(self, response, status_code, url, metrics=None):
         self._status_code = status_code
         self._url = url
+        self.metrics = RequestMetrics() if metrics is None else metrics
+        self.set_response(response)
 
     def get_response(self):
         return self._response
 
-    def get_dict(self):
-        return json.loads(self._response)
+    def set_response(self, response):
+        # The body is decoded at most once; replacing it drops the decoded copy.
+        self._response = response
+        self._dict = None
+        self._dict_error = None
+
+    def is_not_modified(self):
+        return self._status_code == 304
+
+    def get_dict(self, read_only=False):
+        """Decoded JSON body, parsed on first use and shared afterwards.
+
+        Every call returns the same object, so copy it before modifying it, or
+        pass ``read_only=True`` to get a view that cannot be modified.
+        """
+        if self._dict is None:
+            if self._dict_error is not None:
+                raise self._dict_error
+            start = time.perf_counter()
+            try:
+                self._dict = jsonbackend.loads(self._response)
+            except ValueError as error:
+                self._dict_error = error
+                raise
+            finally:
+                self.metrics.parse += time.perf_counter() - start
+        if read_only:
+            return make_read_only(self._dict)
+        return self._dict
 
     def get_json(self):
-        return json.dumps(self.get_dict())
+        return jsonbackend.dumps(self.get_dict())
 
     def valid_json(self):
         try:
@@ -66,11 +160,47 @@ class NBAHTTP:
 
     _session = None
 
+    # Response cache (see nba_api.library.cache); None disables caching.
+    _cache = None
+
+    # Request pacing (see nba_api.library.ratelimit); None disables it.
+    _rate_limiter = None
+
+    # Retries with backoff (see nba_api.library.retry); None disables them.
+    _retry_policy = None
+
+    # Lists of proxies are turned into ProxyPools kept here, so proxy health
+    # is remembered between requests.
+    _proxy_pools = {}
+
+    # Conditional GETs: ETag/Last-Modified validators and the body they belong
+    # to are kept per url, and a 304 response reuses the stored body.
+    conditional_requests = False
+    _validators = MemoryCache(max_entries=512)
+
+    # Identical requests already in flight are shared rather than re-sent.
+    coalesce_requests = True
+    _coalescer = RequestCoalescer()
+
+    # Connections kept per host by the default session; raise this when sending
+    # requests from many threads (e.g. fetch_many) so they are not discarded.
+    pool_maxsize = 10
+
+    # Async clients are pooled per event loop, then per (host, proxy), so every
+    # host gets its own bounded set of keep-alive connections.
+    _async_client = None
+    _async_clients = weakref.WeakKeyDictionary()
+    async_max_connections = 100
+    async_max_keepalive_connections = 20
+
     @classmethod
     def get_session(cls):
         session = cls._session
         if session is None:
             session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_maxsize=cls.pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
             cls._session = session
         return session
 
@@ -78,19 +208,82 @@ class NBAHTTP:
     def set_session(cls, session) -> None:
         cls._session = session
 
+    @classmethod
+    def get_cache(cls):
+        return cls._cache
+
+    @classmethod
+    def set_cache(cls, cache) -> None:
+        cls._cache = cache
+
+    @classmethod
+    def get_rate_limiter(cls):
+        return cls._rate_limiter
+
+    @classmethod
+    def set_rate_limiter(cls, rate_limiter) -> None:
+        cls._rate_limiter = rate_limiter
+
+    @classmethod
+    def get_retry_policy(cls):
+        return cls._retry_policy
+
+    @classmethod
+    def set_retry_policy(cls, retry_policy) -> None:
+        cls._retry_policy = retry_policy
+
+    @classmethod
+    def get_proxy_pool(cls, proxies):
+        key = tuple(proxies)
+        proxy_pool = cls._proxy_pools.get(key)
+        if proxy_pool is None:
+            proxy_pool = cls._proxy_pools.setdefault(key, ProxyPool(proxies))
+        return proxy_pool
+
+    @classmethod
+    def get_async_client(cls, proxy=None):
+        if cls._async_client is not None:
+            return cls._async_client
+        if not HTTPX:
+            raise Exception(
+                "Import Missing - Failed to import httpx, which is required for async requests."
+            )
+
+        clients = cls._async_clients.setdefault(asyncio.get_running_loop(), {})
+        key = (urlparse(cls.base_url).netloc if cls.base_url else None, proxy or None)
+        client = clients.get(key)
+        if client is None:
+            client = httpx.AsyncClient(
+                proxy=proxy or None,
+                limits=httpx.Limits(
+                    max_connections=cls.async_max_connections,
+                    max_keepalive_connections=cls.async_max_keepalive_connections,
+                ),
+            )
+            clients[key] = client
+        return client
+
+    @classmethod
+    def set_async_client(cls, client) -> None:
+        cls._async_client = client
+
+    @classmethod
+    async def close_async_clients(cls) -> None:
+        clients = cls._async_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
     def clean_contents(self, contents):
         return contents
 
-    def send_api_request(
-        self,
-        endpoint,
-        parameters,
-        referer=None,
-        proxy=None,
-        headers=None,
-        timeout=None,
-        raise_exception_on_error=False,
-    ):
+    def is_error_response(self, status_code, contents):
+        return (
+            status_code == 429
+            or (status_code is not None and status_code >= 500)
+            or '{"Message":"An error has occurred."}' in contents
+        )
+
+    def _prepare_request(self, endpoint, parameters, referer, proxy, headers):
         if not self.base_url:
             raise Exception("Cannot use send_api_request from _HTTP class.")
         base_url = self.base_url.format(endpoint=endpoint)
@@ -113,71 +306,540 @@ class NBAHTTP:
             request_proxy = proxy
 
         if isinstance(request_proxy, list):
-            request_proxy = random.choice(request_proxy)
-            if DEBUG:
-                print(request_proxy)
-
-        proxies = None
-        if request_proxy:
-            proxies = {
-                "http": request_proxy,
-                "https": request_proxy,
-            }
-
-        url = None
-        status_code = None
-        contents = None
+            request_proxy = self.get_proxy_pool(request_proxy)
 
         # Sort parameters by key... for some reason this matters for some requests...
         parameters = sorted(parameters.items(), key=lambda kv: kv[0])
 
+        return base_url, endpoint, parameters, request_headers, request_proxy
+
+    def _load_debug_storage(self, base_url, endpoint, parameters):
+        print(endpoint, parameters)
+        directory_name = "debug_storage"
+        parameter_string = "&".join(
+            "{}={}".format(key, "" if val is None else quote_plus(str(val)))
+            for key, val in parameters
+        )
+        url = "{}?{}".format(base_url, parameter_string)
+        print(url)
+        file_name = "{}-{}.txt".format(
+            endpoint, md5(parameter_string.encode("utf-8")).hexdigest()
+        )
+        file_path = os.path.join(
+            os.path.dirname(os.path.abspath(__file__)), "debug", directory_name
+        )
+        if not os.path.exists(file_path):
+            os.makedirs(file_path)
+        file_path = os.path.join(file_path, file_name)
+        print(file_name, os.path.isfile(file_path))
+        contents = None
+        if os.path.isfile(file_path):
+            f = open(file_path, "r")
+            contents = f.read()
+            f.close()
+            print("loading from file...")
+        return url, file_path, contents
+
+    def _load_cache(self, base_url, parameters):
+        cache = self.get_cache()
+        if cache is None:
+            return None, None
+        cache_key = get_cache_key(base_url, parameters)
+        cached = cache.get(cache_key)
+        if cached is None:
+            return cache_key, None
+        data = self.nba_response(
+            response=cached["response"],
+            status_code=cached["status_code"],
+            url=cached["url"],
+            metrics=RequestMetrics(source="cache"),
+        )
+        return cache_key, data
+
+    def _save_cache(self, cache_key, endpoint, data, status_code, url):
+        if cache_key is None or status_code != 200 or not data.valid_json():
+            return
+        cache = self.get_cache()
+        ttl = None
+        if cache.policy is not None:
+            ttl = cache.policy.get_ttl(endpoint, self.parameters, data)
+            if ttl == 0:
+                return
+        cache.set(
+            cache_key,
+            {"response": data.get_response(), "status_code": status_code, "url": url},
+            ttl=ttl,
+        )
+
+    def _build_response(
+        self,
+        contents,
+        status_code,
+        url,
+        file_path,
+        raise_exception_on_error,
+        cache_key=None,
+        endpoint=None,
+        metrics=None,
+    ):
+        contents = self.clean_contents(contents)
         if DEBUG and DEBUG_STORAGE:
-            print(endpoint, parameters)
-            directory_name = "debug_storage"
-            parameter_string = "&".join(
-                "{}={}".format(key, "" if val is None else quote_plus(str(val)))
-                for key, val in parameters
-            )
-            url = "{}?{}".format(base_url, parameter_string)
+            f = open(file_path, "w")
+            f.write(contents)
+            f.close()
             print(url)
-            file_name = "{}-{}.txt".format(
-                endpoint, md5(parameter_string.encode("utf-8")).hexdigest()
-            )
-            file_path = os.path.join(
-                os.path.dirname(os.path.abspath(__file__)), "debug", directory_name
+
+        if metrics is None:
+            metrics = RequestMetrics(source="debug_storage")
+        metrics.status_code = status_code
+        data = self.nba_response(
+            response=contents, status_code=status_code, url=url, metrics=metrics
+        )
+        self._save_cache(cache_key, endpoint, data, status_code, url)
+        self._emit_metrics(data, endpoint)
+
+        if raise_exception_on_error and not data.valid_json():
+            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+
+        return data
+
+    @staticmethod
+    def _emit_metrics(data, endpoint):
+        data.metrics.endpoint = endpoint
+        data.metrics.url = data.get_url()
+        if not has_hooks():
+            return
+        # Parse now so hooks see the parse time; the endpoint reuses the result.
+        data.valid_json()
+        emit(data.metrics)
+
+    def _get_validators(self, base_url, parameters):
+        if not self.conditional_requests:
+            return None, None
+        validator_key = get_cache_key(base_url, parameters)
+        return validator_key, self._validators.get(validator_key)
+
+    @staticmethod
+    def _add_validators(validators, request_headers):
+        if validators is None:
+            return request_headers
+        request_headers = dict(request_headers or {})
+        if validators["etag"]:
+            request_headers["If-None-Match"] = validators["etag"]
+        if validators["last_modified"]:
+            request_headers["If-Modified-Since"] = validators["last_modified"]
+        return request_headers
+
+    def _update_validators(
+        self, validator_key, validators, status_code, response_headers, contents
+    ):
+        if validator_key is None:
+            return contents
+        if status_code == 304 and validators is not None:
+            return validators["response"]
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        if status_code == 200 and (etag or last_modified):
+            self._validators.set(
+                validator_key,
+                {"etag": etag, "last_modified": last_modified, "response": contents},
             )
-            if not os.path.exists(file_path):
-                os.makedirs(file_path)
-            file_path = os.path.join(file_path, file_name)
-            print(file_name, os.path.isfile(file_path))
-            if os.path.isfile(file_path):
-                f = open(file_path, "r")
-                contents = f.read()
-                f.close()
-                print("loading from file...")
+        return contents
 
-        if not contents:
+    def _select_proxy(self, request_proxy):
+        if not isinstance(request_proxy, ProxyPool):
+            return None, request_proxy
+        proxy = request_proxy.select()
+        if DEBUG:
+            print(proxy)
+        return request_proxy, proxy
+
+    @staticmethod
+    def _get_proxies(request_proxy):
+        if not request_proxy:
+            return None
+        return {
+            "http": request_proxy,
+            "https": request_proxy,
+        }
+
+    def _fetch(self, base_url, parameters, request_headers, request_proxy, timeout):
+        proxy_pool, request_proxy = self._select_proxy(request_proxy)
+        validator_key, validators = self._get_validators(base_url, parameters)
+        request_headers = self._add_validators(validators, request_headers)
+
+        proxies = self._get_proxies(request_proxy)
+
+        metrics = RequestMetrics()
+        metrics.attempts = 1
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is not None:
+            metrics.queue_wait += rate_limiter.acquire()
+
+        # Stream the response so the time to the headers and the time to read
+        # the body can be measured separately.
+        start = time.perf_counter()
+        try:
             response = self.get_session().get(
                 url=base_url,
                 params=parameters,
                 headers=request_headers,
                 proxies=proxies,
                 timeout=timeout,
+                stream=True,
             )
-            url = response.url
-            status_code = response.status_code
-            contents = response.text
+            headers_received = time.perf_counter()
+            body = response.content
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            if rate_limiter is not None:
+                rate_limiter.report_failure()
+            if proxy_pool is not None:
+                proxy_pool.report_failure(request_proxy)
+            raise
+        downloaded = time.perf_counter()
+        text = response.text
+        decoded = time.perf_counter()
+
+        metrics.ttfb = headers_received - start
+        metrics.download = downloaded - headers_received
+        metrics.decode = decoded - downloaded
+        metrics.decoded_bytes = (
+            len(body) if isinstance(body, bytes) else len(text.encode("utf-8"))
+        )
+        metrics.wire_bytes = get_wire_bytes(response, default=metrics.decoded_bytes)
+
+        contents = self._update_validators(
+            validator_key, validators, response.status_code, response.headers, text
+        )
+        if response.status_code == 304 and validators is not None:
+            metrics.source = "not_modified"
+        if rate_limiter is not None:
+            rate_limiter.report(self.is_error_response(response.status_code, contents))
+        if proxy_pool is not None:
+            proxy_pool.report(request_proxy, response.status_code, downloaded - start)
+        return response.url, response.status_code, contents, metrics
+
+    async def _afetch(
+        self, base_url, parameters, request_headers, request_proxy, timeout
+    ):
+        # Match requests, which skips None values and str()s everything else.
+        params = [(key, str(val)) for key, val in parameters if val is not None]
+        proxy_pool, request_proxy = self._select_proxy(request_proxy)
+        validator_key, validators = self._get_validators(base_url, parameters)
+        request_headers = self._add_validators(validators, request_headers)
+        client = self.get_async_client(proxy=request_proxy)
+
+        metrics = RequestMetrics()
+        metrics.attempts = 1
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is not None:
+            metrics.queue_wait += await rate_limiter.aacquire()
+
+        connect_events = {}
+
+        async def trace(event_name, info):
+            # httpcore reports connection setup (DNS, TCP and TLS) as events.
+            if event_name.startswith("connection."):
+                connect_events[event_name] = time.perf_counter()
+
+        request = client.build_request(
+            "GET",
+            url=base_url,
+            params=params,
+            headers=request_headers,
+            timeout=timeout,
+            extensions={"trace": trace},
+        )
+        start = time.perf_counter()
+        try:
+            response = await client.send(request, stream=True)
+            headers_received = time.perf_counter()
+            try:
+                body = await response.aread()
+            finally:
+                await response.aclose()
+        except ASYNC_TRANSPORT_ERRORS:
+            if rate_limiter is not None:
+                rate_limiter.report_failure()
+            if proxy_pool is not None:
+                proxy_pool.report_failure(request_proxy)
+            raise
+        downloaded = time.perf_counter()
+        text = response.text
+        decoded = time.perf_counter()
+
+        connect_started = connect_events.get("connection.connect_tcp.started")
+        connected = connect_events.get(
+            "connection.start_tls.complete",
+            connect_events.get("connection.connect_tcp.complete"),
+        )
+        if connect_started is not None and connected is not None:
+            metrics.connect = connected - connect_started
+            metrics.ttfb = headers_received - start - metrics.connect
+        else:
+            metrics.ttfb = headers_received - start
+        metrics.download = downloaded - headers_received
+        metrics.decode = decoded - downloaded
+        metrics.decoded_bytes = len(body)
+        metrics.wire_bytes = response.num_bytes_downloaded
+
+        contents = self._update_validators(
+            validator_key, validators, response.status_code, response.headers, text
+        )
+        if response.status_code == 304 and validators is not None:
+            metrics.source = "not_modified"
+        if rate_limiter is not None:
+            rate_limiter.report(self.is_error_response(response.status_code, contents))
+        if proxy_pool is not None:
+            proxy_pool.report(request_proxy, response.status_code, downloaded - start)
+        return str(response.url), response.status_code, contents, metrics
+
+    def _fetch_with_retries(
+        self, base_url, parameters, request_headers, request_proxy, timeout
+    ):
+        args = (base_url, parameters, request_headers, request_proxy, timeout)
+        retry_policy = self.get_retry_policy()
+        if retry_policy is None:
+            return self._fetch(*args)
+
+        retry_policy.record_request()
+        attempt = 0
+        retry_wait = 0.0
+        while True:
+            error = None
+            status_code = None
+            try:
+                url, status_code, contents, metrics = self._fetch(*args)
+                metrics.attempts = attempt + 1
+                metrics.queue_wait += retry_wait
+                if not self.is_error_response(status_code, contents):
+                    return url, status_code, contents, metrics
+            except (
+                requests.exceptions.Timeout,
+                requests.exceptions.ConnectionError,
+            ) as exception:
+                error = exception
+
+            delay = retry_policy.get_delay(
+                attempt, base_url, error=error, status_code=status_code
+            )
+            if delay is None:
+                if error is not None:
+                    raise error
+                return url, status_code, contents, metrics
+            time.sleep(delay)
+            retry_wait += delay
+            attempt += 1
+
+    async def _afetch_with_retries(
+        self, base_url, parameters, request_headers, request_proxy, timeout
+    ):
+        args = (base_url, parameters, request_headers, request_proxy, timeout)
+        retry_policy = self.get_retry_policy()
+        if retry_policy is None:
+            return await self._afetch(*args)
+
+        retry_policy.record_request()
+        attempt = 0
+        retry_wait = 0.0
+        while True:
+            error = None
+            status_code = None
+            try:
+                url, status_code, contents, metrics = await self._afetch(*args)
+                metrics.attempts = attempt + 1
+                metrics.queue_wait += retry_wait
+                if not self.is_error_response(status_code, contents):
+                    return url, status_code, contents, metrics
+            except ASYNC_TRANSPORT_ERRORS as exception:
+                error = exception
+
+            delay = retry_policy.get_delay(
+                attempt, base_url, error=error, status_code=status_code
+            )
+            if delay is None:
+                if error is not None:
+                    raise error
+                return url, status_code, contents, metrics
+            await asyncio.sleep(delay)
+            retry_wait += delay
+            attempt += 1
+
+    def send_api_request(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        raise_exception_on_error=False,
+    ):
+        base_url, endpoint, parameters, request_headers, request_proxy = (
+            self._prepare_request(endpoint, parameters, referer, proxy, headers)
+        )
+
+        cache_key, data = self._load_cache(base_url, parameters)
+        if data is not None:
+            self._emit_metrics(data, endpoint)
+            return data
+
+        url = None
+        status_code = None
+        contents = None
+        file_path = None
+        metrics = None
 
-        contents = self.clean_contents(contents)
         if DEBUG and DEBUG_STORAGE:
-            f = open(file_path, "w")
-            f.write(contents)
-            f.close()
-            print(url)
+            url, file_path, contents = self._load_debug_storage(
+                base_url, endpoint, parameters
+            )
 
-        data = self.nba_response(response=contents, status_code=status_code, url=url)
+        if not contents:
+            fetch_args = (base_url, parameters, request_headers, request_proxy, timeout)
+            if self.coalesce_requests:
+                url, status_code, contents, metrics = self._coalescer.run(
+                    get_cache_key(base_url, parameters),
+                    self._fetch_with_retries,
+                    *fetch_args,
+                )
+                # Coalesced callers share the fetch but parse on their own.
+                metrics = copy.copy(metrics)
+            else:
+                url, status_code, contents, metrics = self._fetch_with_retries(
+                    *fetch_args
+                )
+
+        return self._build_response(
+            contents,
+            status_code,
+            url,
+            file_path,
+            raise_exception_on_error,
+            cache_key=cache_key,
+            endpoint=endpoint,
+            metrics=metrics,
+        )
+
+    async def asend_api_request(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        raise_exception_on_error=False,
+    ):
+        base_url, endpoint, parameters, request_headers, request_proxy = (
+            self._prepare_request(endpoint, parameters, referer, proxy, headers)
+        )
 
-        if raise_exception_on_error and not data.valid_json():
-            raise Exception("InvalidResponse: Response is not in a valid JSON format.")
+        cache_key, data = self._load_cache(base_url, parameters)
+        if data is not None:
+            self._emit_metrics(data, endpoint)
+            return data
 
-        return data
+        url = None
+        status_code = None
+        contents = None
+        file_path = None
+        metrics = None
+
+        if DEBUG and DEBUG_STORAGE:
+            url, file_path, contents = self._load_debug_storage(
+                base_url, endpoint, parameters
+            )
+
+        if not contents:
+            fetch_args = (base_url, parameters, request_headers, request_proxy, timeout)
+            if self.coalesce_requests:
+                url, status_code, contents, metrics = await self._coalescer.arun(
+                    get_cache_key(base_url, parameters),
+                    self._afetch_with_retries,
+                    *fetch_args,
+                )
+                metrics = copy.copy(metrics)
+            else:
+                url, status_code, contents, metrics = await self._afetch_with_retries(
+                    *fetch_args
+                )
+
+        return self._build_response(
+            contents,
+            status_code,
+            url,
+            file_path,
+            raise_exception_on_error,
+            cache_key=cache_key,
+            endpoint=endpoint,
+            metrics=metrics,
+        )
+
+    def stream_api_request(
+        self,
+        endpoint,
+        parameters,
+        referer=None,
+        proxy=None,
+        headers=None,
+        timeout=None,
+        batch_size=None,
+    ):
+        """Send a request and yield its rowSet rows while the body downloads.
+
+        The response is parsed incrementally (see ``nba_api.library.stream``)
+        and never held in memory as a whole. It is not cached, coalesced or
+        retried, since rows have already been handed out by the time an error
+        could be noticed.
+
+        Yields:
+            tuple: ``(name, headers, row)``, or ``(name, headers, rows)`` when
+            ``batch_size`` is set.
+        """
+        base_url, endpoint, parameters, request_headers, request_proxy = (
+            self._prepare_request(endpoint, parameters, referer, proxy, headers)
+        )
+        proxy_pool, request_proxy = self._select_proxy(request_proxy)
+
+        rate_limiter = self.get_rate_limiter()
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+
+        start = time.perf_counter()
+        try:
+            response = self.get_session().get(
+                url=base_url,
+                params=parameters,
+                headers=request_headers,
+                proxies=self._get_proxies(request_proxy),
+                timeout=timeout,
+                stream=True,
+            )
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError):
+            if rate_limiter is not None:
+                rate_limiter.report_failure()
+            if proxy_pool is not None:
+                proxy_pool.report_failure(request_proxy)
+            raise
+
+        try:
+            status_code = response.status_code
+            if rate_limiter is not None:
+                rate_limiter.report(self.is_error_response(status_code, ""))
+            if proxy_pool is not None:
+                proxy_pool.report(
+                    request_proxy, status_code, time.perf_counter() - start
+                )
+            if status_code != 200:
+                raise Exception(
+                    "InvalidResponse: Streaming request failed with status code "
+                    "{}.".format(status_code)
+                )
+
+            raw = response.raw
+            raw.decode_content = True
+            for result in iter_result_set_rows(raw, batch_size=batch_size):
+                yield result
+        finally:
+            response.close()
@@ -0,0 +1,156 @@
+"""
+Pluggable JSON decoding and encoding.
+
+Decoding large stats.nba.com payloads with the standard library is one of the
+most expensive steps of a request. When orjson, ujson or pysimdjson is
+installed (tried in that order) it is used to decode responses instead. Any
+payload the fast library rejects, such as one containing ``NaN``, is decoded
+again with the standard library, so results never differ in what is accepted.
+
+The automatically selected backend only decodes. ``get_json`` and
+``get_normalized_json`` keep producing the standard library's output format
+unless a backend is selected explicitly, in which case its (compact) encoder is
+used as well.
+
+Example:
+    >>> from nba_api.library import jsonbackend
+    >>> jsonbackend.get_backend().name
+    'orjson'
+    >>> jsonbackend.set_backend('orjson')  # also encode with orjson
+    >>> jsonbackend.set_backend('json')  # standard library only
+    >>> jsonbackend.set_backend(None)  # back to automatic selection
+
+Note that orjson decodes integers larger than 64 bits as floats.
+"""
+
+import json
+
+try:
+    import orjson
+
+    ORJSON = True
+except ImportError:
+    ORJSON = False
+
+try:
+    import ujson
+
+    UJSON = True
+except ImportError:
+    UJSON = False
+
+try:
+    import simdjson
+
+    SIMDJSON = True
+except ImportError:
+    SIMDJSON = False
+
+
+class JSONBackend:
+    """A JSON library's ``loads`` and, optionally, ``dumps``.
+
+    Args:
+        name (str): Name of the library.
+        loads (callable): Decodes a str or bytes.
+        dumps (callable, optional): Encodes an object to a str. Defaults to
+            None, which encodes with the standard library.
+    """
+
+    def __init__(self, name, loads, dumps=None):
+        self.name = name
+        self._loads = loads
+        self._dumps = dumps
+
+    def loads(self, data):
+        try:
+            return self._loads(data)
+        except ValueError:
+            if self._loads is json.loads:
+                raise
+            return json.loads(data)
+
+    def dumps(self, obj):
+        if self._dumps is None:
+            return json.dumps(obj)
+        try:
+            return self._dumps(obj)
+        except TypeError:
+            return json.dumps(obj)
+
+    def __repr__(self):
+        return "JSONBackend(name={!r})".format(self.name)
+
+
+def _orjson_dumps(obj):
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+
+def _ujson_dumps(obj):
+    return ujson.dumps(obj, ensure_ascii=False, escape_forward_slashes=False)
+
+
+def get_available_backends():
+    """Names of the installed backends, fastest first."""
+    available = [
+        name
+        for name, installed in (
+            ("orjson", ORJSON),
+            ("ujson", UJSON),
+            ("simdjson", SIMDJSON),
+        )
+        if installed
+    ]
+    return available + ["json"]
+
+
+def create_backend(name, encode=True):
+    """Build the backend for one of ``get_available_backends()``.
+
+    Args:
+        name (str): ``"orjson"``, ``"ujson"``, ``"simdjson"`` or ``"json"``.
+        encode (bool, optional): Also use the library to encode. Defaults to
+            True.
+    """
+    if name == "json":
+        return JSONBackend("json", json.loads)
+    if name not in get_available_backends():
+        raise Exception("Import Missing - Failed to import {}.".format(name))
+    if name == "orjson":
+        return JSONBackend("orjson", orjson.loads, _orjson_dumps if encode else None)
+    if name == "ujson":
+        return JSONBackend("ujson", ujson.loads, _ujson_dumps if encode else None)
+    # pysimdjson only decodes.
+    return JSONBackend("simdjson", simdjson.loads)
+
+
+_backend = None
+
+
+def get_backend():
+    global _backend
+    if _backend is None:
+        _backend = create_backend(get_available_backends()[0], encode=False)
+    return _backend
+
+
+def set_backend(backend):
+    """Select the JSON backend.
+
+    Args:
+        backend: A backend name, a ``JSONBackend``, or None to pick the
+            fastest installed library again.
+    """
+    global _backend
+    if backend is None or isinstance(backend, JSONBackend):
+        _backend = backend
+    else:
+        _backend = create_backend(backend)
+
+
+def loads(data):
+    return get_backend().loads(data)
+
+
+def dumps(obj):
+    return get_backend().dumps(obj)
@@ -0,0 +1,148 @@
+"""
+Per-request timing and size measurements.
+
+Every ``NBAResponse`` carries a ``RequestMetrics`` describing how it was
+obtained: time spent queued, connecting, waiting for the first byte,
+downloading, decoding and parsing, and its size on the wire and once
+decompressed. Hooks registered with ``add_hook`` receive the metrics of every
+request, which makes it easy to export them to a log or monitoring system.
+
+Example:
+    >>> from nba_api.library import metrics
+    >>> from nba_api.stats.endpoints import PlayerGameLog
+    >>> metrics.add_hook(lambda m: print(m.endpoint, m.total, m.wire_bytes))
+    >>> game_log = PlayerGameLog(player_id=2544)
+    >>> game_log.nba_response.metrics.get_dict()
+
+``connect`` is only measured for async requests. ``requests`` does not
+report when a connection is established, so for synchronous requests the
+connect time is included in ``ttfb``.
+"""
+
+import threading
+
+_hooks = []
+_hooks_lock = threading.Lock()
+
+
+class RequestMetrics:
+    """Timings (in seconds) and sizes (in bytes) of a single request.
+
+    Attributes:
+        endpoint (str): Endpoint name, lowercased.
+        url (str): Request url, including parameters.
+        status_code (int): Response status code.
+        source (str): ``"network"``, ``"not_modified"`` (a 304 answered from
+            stored validators), ``"cache"`` or ``"debug_storage"``.
+        attempts (int): Requests sent, including retries.
+        queue_wait (float): Time waiting for the rate limiter and between
+            retries.
+        connect (float): Time establishing the connection (DNS, TCP and TLS),
+            or None if it was reused or not measured.
+        ttfb (float): Time from sending the request to receiving the response
+            headers.
+        download (float): Time reading the response body.
+        decode (float): Time decoding the body to text.
+        parse (float): Time spent decoding the JSON body.
+        wire_bytes (int): Body size as transferred, before decompression.
+        decoded_bytes (int): Body size after decompression.
+    """
+
+    def __init__(self, endpoint=None, source="network"):
+        self.endpoint = endpoint
+        self.url = None
+        self.status_code = None
+        self.source = source
+        self.attempts = 0
+        self.queue_wait = 0.0
+        self.connect = None
+        self.ttfb = None
+        self.download = None
+        self.decode = None
+        self.parse = 0.0
+        self.wire_bytes = None
+        self.decoded_bytes = None
+
+    @property
+    def total(self):
+        return sum(
+            value or 0.0
+            for value in (
+                self.queue_wait,
+                self.connect,
+                self.ttfb,
+                self.download,
+                self.decode,
+                self.parse,
+            )
+        )
+
+    def get_dict(self):
+        return {
+            "endpoint": self.endpoint,
+            "url": self.url,
+            "status_code": self.status_code,
+            "source": self.source,
+            "attempts": self.attempts,
+            "queue_wait": self.queue_wait,
+            "connect": self.connect,
+            "ttfb": self.ttfb,
+            "download": self.download,
+            "decode": self.decode,
+            "parse": self.parse,
+            "total": self.total,
+            "wire_bytes": self.wire_bytes,
+            "decoded_bytes": self.decoded_bytes,
+        }
+
+    def __repr__(self):
+        return "RequestMetrics(endpoint={!r}, source={!r}, total={:.3f})".format(
+            self.endpoint, self.source, self.total
+        )
+
+
+def add_hook(hook):
+    """Call ``hook(metrics)`` with the ``RequestMetrics`` of every request."""
+    with _hooks_lock:
+        _hooks.append(hook)
+
+
+def remove_hook(hook):
+    with _hooks_lock:
+        if hook in _hooks:
+            _hooks.remove(hook)
+
+
+def clear_hooks():
+    with _hooks_lock:
+        del _hooks[:]
+
+
+def has_hooks():
+    return bool(_hooks)
+
+
+def emit(metrics):
+    with _hooks_lock:
+        hooks = list(_hooks)
+    for hook in hooks:
+        hook(metrics)
+
+
+def get_wire_bytes(response, default=None):
+    """Bytes read from the network for a ``requests`` response.
+
+    Falls back to the ``Content-Length`` header, then to ``default``.
+    """
+    raw = getattr(response, "raw", None)
+    try:
+        wire_bytes = raw.tell()
+    except Exception:
+        wire_bytes = None
+    if isinstance(wire_bytes, int):
+        return wire_bytes
+    headers = getattr(response, "headers", None)
+    try:
+        return int(headers.get("Content-Length"))
+    except Exception:
+        return default
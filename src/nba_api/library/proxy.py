@@ -0,0 +1,166 @@
+"""
+Health-aware proxy selection for NBAHTTP.
+
+A ``ProxyPool`` tracks, for every proxy, an exponentially weighted moving
+average (EWMA) of its latency and its consecutive failures. Selection is
+weighted towards fast, healthy proxies. A proxy that fails is put on a
+cooldown that doubles with every further failure, and is skipped until the
+cooldown ends.
+
+Pass a pool anywhere a proxy is accepted:
+
+Example:
+    >>> from nba_api.library.proxy import ProxyPool
+    >>> from nba_api.stats.endpoints import PlayerGameLog
+    >>> pool = ProxyPool(['http://10.0.0.1:3128', 'http://10.0.0.2:3128'])
+    >>> game_log = PlayerGameLog(player_id=2544, proxy=pool)
+    >>> pool.get_stats()
+
+A plain list of proxies is turned into a pool kept on the HTTP class, so its
+health is remembered between requests. Connections are reused per proxy: the
+shared ``requests.Session`` keeps a connection pool per proxy, and async
+clients are pooled per proxy.
+"""
+
+import random
+import threading
+import time
+
+
+class ProxyStats:
+    """Health of a single proxy.
+
+    Attributes:
+        proxy (str): Proxy url.
+        latency (float): EWMA of successful request durations in seconds, or
+            None before the first success.
+        requests (int): Requests sent through the proxy.
+        failures (int): Total failed requests.
+        consecutive_failures (int): Failures since the last success.
+        cooldown_until (float): ``time.monotonic()`` value until which the
+            proxy is skipped.
+    """
+
+    def __init__(self, proxy):
+        self.proxy = proxy
+        self.latency = None
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.cooldown_until = 0.0
+
+    def get_dict(self):
+        return {
+            "proxy": self.proxy,
+            "latency": self.latency,
+            "requests": self.requests,
+            "failures": self.failures,
+            "consecutive_failures": self.consecutive_failures,
+            "cooling_down": self.cooldown_until > time.monotonic(),
+        }
+
+
+class ProxyPool:
+    """Weighted, health-aware proxy selection.
+
+    A proxy's weight is ``1 / (latency * (1 + consecutive_failures))``.
+    Proxies without a measured latency use the average latency of the pool,
+    so new proxies get tried.
+
+    Args:
+        proxies (list): Proxy urls.
+        alpha (float, optional): EWMA smoothing factor, the weight of the
+            newest sample. Defaults to 0.3.
+        cooldown (float, optional): Seconds a proxy is skipped after its
+            first failure. Defaults to 30.
+        max_cooldown (float, optional): Upper bound on the doubling
+            cooldown. Defaults to 600.
+        ban_status_codes (tuple, optional): Status codes treated as the proxy
+            being blocked. Defaults to ``(403, 407, 429)``.
+    """
+
+    def __init__(
+        self,
+        proxies,
+        alpha=0.3,
+        cooldown=30,
+        max_cooldown=600,
+        ban_status_codes=(403, 407, 429),
+    ):
+        if not proxies:
+            raise ValueError("ProxyPool requires at least one proxy.")
+        self.alpha = alpha
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.ban_status_codes = ban_status_codes
+        self._stats = {proxy: ProxyStats(proxy) for proxy in proxies}
+        self._lock = threading.Lock()
+
+    def select(self):
+        """Pick a proxy for the next request.
+
+        Returns:
+            str: A proxy url. If every proxy is cooling down, the one whose
+            cooldown ends first.
+        """
+        with self._lock:
+            now = time.monotonic()
+            available = [
+                stats for stats in self._stats.values() if stats.cooldown_until <= now
+            ]
+            if not available:
+                stats = min(self._stats.values(), key=lambda s: s.cooldown_until)
+                stats.requests += 1
+                return stats.proxy
+
+            latencies = [s.latency for s in available if s.latency is not None]
+            default_latency = sum(latencies) / len(latencies) if latencies else 1.0
+            weights = [
+                1.0
+                / (
+                    max(s.latency if s.latency is not None else default_latency, 1e-3)
+                    * (1 + s.consecutive_failures)
+                )
+                for s in available
+            ]
+            stats = random.choices(available, weights=weights)[0]
+            stats.requests += 1
+            return stats.proxy
+
+    def report_success(self, proxy, latency):
+        with self._lock:
+            stats = self._stats.get(proxy)
+            if stats is None:
+                return
+            if stats.latency is None:
+                stats.latency = latency
+            else:
+                stats.latency = self.alpha * latency + (1 - self.alpha) * stats.latency
+            stats.consecutive_failures = 0
+            stats.cooldown_until = 0.0
+
+    def report_failure(self, proxy):
+        with self._lock:
+            stats = self._stats.get(proxy)
+            if stats is None:
+                return
+            stats.failures += 1
+            stats.consecutive_failures += 1
+            cooldown = min(
+                self.max_cooldown,
+                self.cooldown * 2 ** (stats.consecutive_failures - 1),
+            )
+            stats.cooldown_until = time.monotonic() + cooldown
+
+    def report(self, proxy, status_code, latency):
+        if status_code in self.ban_status_codes:
+            self.report_failure(proxy)
+        else:
+            self.report_success(proxy, latency)
+
+    def get_stats(self):
+        with self._lock:
+            return [stats.get_dict() for stats in self._stats.values()]
+
+    def __len__(self):
+        return len(self._stats)
@@ -0,0 +1,113 @@
+"""
+Client-side request pacing for NBAHTTP.
+
+stats.nba.com tends to hang or drop connections rather than reject clients
+that send requests too quickly. A ``RateLimiter`` spaces requests out with a
+token bucket and adapts its rate: every timeout, dropped connection or error
+payload halves the rate, and every successful response slowly raises it back
+towards the configured maximum.
+
+Limiters are set per HTTP class, so the stats and live APIs can be paced
+independently. One limiter is shared by every thread and asyncio task using
+that class.
+
+Example:
+    >>> from nba_api.library.ratelimit import RateLimiter
+    >>> from nba_api.live.nba.library.http import NBALiveHTTP
+    >>> from nba_api.stats.library.http import NBAStatsHTTP
+    >>> NBAStatsHTTP.set_rate_limiter(RateLimiter(rate=1.0, burst=3))
+    >>> NBALiveHTTP.set_rate_limiter(RateLimiter(rate=10.0, burst=10))
+"""
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Adaptive token bucket.
+
+    Args:
+        rate (float): Maximum sustained requests per second.
+        burst (int, optional): Requests that may be sent back to back after
+            an idle period. Defaults to 1.
+        min_rate (float, optional): Floor for the adaptive rate. Defaults to
+            ``rate / 16``.
+        backoff_factor (float, optional): Multiplier applied to the current
+            rate after a failure. Defaults to 0.5.
+        recovery_step (float, optional): Fraction of ``rate`` added back after
+            each success. Defaults to 0.05.
+
+    Attributes:
+        current_rate (float): Requests per second currently allowed.
+    """
+
+    def __init__(
+        self, rate, burst=1, min_rate=None, backoff_factor=0.5, recovery_step=0.05
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be greater than 0.")
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = rate / 16 if min_rate is None else min_rate
+        self.backoff_factor = backoff_factor
+        self.recovery_step = recovery_step
+        self.current_rate = rate
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self):
+        # Take a token now and return how long the caller must wait for it.
+        # Tokens may go negative, which queues callers fairly without holding
+        # the lock while they sleep.
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.current_rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self.current_rate
+
+    def acquire(self):
+        """Block the current thread until a request may be sent.
+
+        Returns:
+            float: Seconds waited.
+        """
+        delay = self._reserve()
+        if delay:
+            time.sleep(delay)
+        return delay
+
+    async def aacquire(self):
+        """Wait, without blocking the event loop, until a request may be sent.
+
+        Returns:
+            float: Seconds waited.
+        """
+        delay = self._reserve()
+        if delay:
+            await asyncio.sleep(delay)
+        return delay
+
+    def report_success(self):
+        with self._lock:
+            self.current_rate = min(
+                self.rate, self.current_rate + self.rate * self.recovery_step
+            )
+
+    def report_failure(self):
+        with self._lock:
+            self.current_rate = max(
+                self.min_rate, self.current_rate * self.backoff_factor
+            )
+
+    def report(self, failed):
+        if failed:
+            self.report_failure()
+        else:
+            self.report_success()
@@ -0,0 +1,152 @@
+"""
+Retries with exponential backoff for NBAHTTP.
+
+A ``RetryPolicy`` set on an HTTP class retries timeouts, dropped connections,
+``429``/``5xx`` responses and the stats.nba.com error payload. It sleeps an
+exponentially growing, jittered delay between attempts. Every NBA request is
+an idempotent GET, so any attempt is safe to repeat. A ``RetryBudget`` caps
+retries to a fraction of overall traffic so an outage does not turn into a
+retry storm.
+
+Example:
+    >>> from nba_api.library.retry import RetryBudget, RetryPolicy
+    >>> from nba_api.stats.library.http import NBAStatsHTTP
+    >>> retry_policy = RetryPolicy(max_retries=4, budget=RetryBudget(ratio=0.2))
+    >>> retry_policy.add_hook(lambda event: print(event))
+    >>> NBAStatsHTTP.set_retry_policy(retry_policy)
+"""
+
+import random
+import threading
+
+
+class RetryEvent:
+    """Details of a retry, passed to every hook.
+
+    Attributes:
+        attempt (int): Number of the attempt that failed, starting at 1.
+        delay (float): Seconds slept before the next attempt.
+        url (str): Request url, without parameters.
+        error (Exception): Exception raised by the attempt, or None.
+        status_code (int): Status code of the failed response, or None.
+    """
+
+    def __init__(self, attempt, delay, url, error=None, status_code=None):
+        self.attempt = attempt
+        self.delay = delay
+        self.url = url
+        self.error = error
+        self.status_code = status_code
+
+    def __repr__(self):
+        reason = repr(self.error) if self.error is not None else self.status_code
+        return "RetryEvent(attempt={}, delay={:.2f}, url={!r}, reason={})".format(
+            self.attempt, self.delay, self.url, reason
+        )
+
+
+class RetryBudget:
+    """Limits retries to a fraction of requests.
+
+    Every request deposits ``ratio`` tokens and every retry withdraws one, so
+    over time at most ``ratio`` retries are made per request.
+
+    Args:
+        ratio (float, optional): Retries allowed per request. Defaults to 0.2.
+        reserve (int, optional): Tokens available up front, so the first
+            failures are retried before any traffic has been seen. Defaults
+            to 10.
+        max_tokens (int, optional): Cap on saved up retries. Defaults to 100.
+    """
+
+    def __init__(self, ratio=0.2, reserve=10, max_tokens=100):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = float(min(reserve, max_tokens))
+        self._lock = threading.Lock()
+
+    def deposit(self):
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self):
+        with self._lock:
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter.
+
+    The delay before retry ``n`` (starting at 0) is drawn uniformly from
+    ``[0, min(max_backoff, backoff_factor * 2 ** n)]``, or is exactly that
+    bound when ``jitter`` is False.
+
+    Args:
+        max_retries (int, optional): Retries after the first attempt.
+            Defaults to 3.
+        backoff_factor (float, optional): Base delay in seconds. Defaults
+            to 0.5.
+        max_backoff (float, optional): Upper bound on a single delay.
+            Defaults to 30.
+        jitter (bool, optional): Randomize delays. Defaults to True.
+        budget (RetryBudget, optional): Shared retry budget. Defaults to
+            None (unlimited).
+    """
+
+    def __init__(
+        self,
+        max_retries=3,
+        backoff_factor=0.5,
+        max_backoff=30,
+        jitter=True,
+        budget=None,
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.budget = budget
+        self.hooks = []
+
+    def add_hook(self, hook):
+        """Call ``hook(event)`` with a ``RetryEvent`` before each retry."""
+        self.hooks.append(hook)
+
+    def record_request(self):
+        if self.budget is not None:
+            self.budget.deposit()
+
+    def get_delay(self, attempt, url, error=None, status_code=None):
+        """Decide whether a failed attempt is retried.
+
+        Args:
+            attempt (int): Retries already made for this request.
+            url (str): Request url.
+            error (Exception, optional): Exception raised by the attempt.
+            status_code (int, optional): Status code of the failed response.
+
+        Returns:
+            float: Seconds to wait before retrying, or None to give up.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if self.budget is not None and not self.budget.withdraw():
+            return None
+
+        delay = min(self.max_backoff, self.backoff_factor * 2**attempt)
+        if self.jitter:
+            delay = random.uniform(0, delay)
+
+        event = RetryEvent(
+            attempt=attempt + 1,
+            delay=delay,
+            url=url,
+            error=error,
+            status_code=status_code,
+        )
+        for hook in self.hooks:
+            hook(event)
+        return delay
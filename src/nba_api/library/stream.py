@@ -0,0 +1,110 @@
+"""
+Incremental parsing of tabular (``resultSets``) responses.
+
+Some stats.nba.com endpoints (``LeagueGameFinder``, ``LeagueGameLog``,
+``PlayerGameLogs``, ``ShotChartLeagueWide``...) return tens of megabytes.
+Instead of reading the whole body and decoding it into one tree, the body can
+be read incrementally and its ``rowSet`` rows handed out as soon as they are
+parsed, so memory stays bounded by the batch size.
+
+Streaming requires `ijson <https://github.com/ICRAR/ijson>`_.
+
+Example:
+    >>> from nba_api.stats.endpoints import LeagueGameLog
+    >>> game_log = LeagueGameLog(season='2023-24', get_request=False)
+    >>> for name, headers, rows in game_log.stream(batch_size=5000):
+    ...     print(name, len(rows))
+"""
+
+try:
+    import ijson
+
+    IJSON = True
+except ImportError:
+    IJSON = False
+
+# Result sets are either a list under "resultSets", or a single result set or a
+# list of them under "resultSet".
+_RESULT_SET_PREFIXES = ("resultSets.item", "resultSet", "resultSet.item")
+
+
+def iter_result_set_rows(file, batch_size=None):
+    """Parse a tabular response incrementally.
+
+    Args:
+        file: A binary file-like object with a ``read`` method.
+        batch_size (int, optional): Group rows into lists of up to this many
+            rows. Defaults to None, which yields rows one at a time.
+
+    Yields:
+        tuple: ``(name, headers, row)``, or ``(name, headers, rows)`` when
+        ``batch_size`` is set. Batches never span two result sets.
+    """
+    if not IJSON:
+        raise Exception(
+            "Import Missing - Failed to import ijson, which is required for streaming."
+        )
+
+    name = None
+    headers = None
+    batch = []
+    for kind, value in _iter_result_set_items(file):
+        if kind == "start":
+            name = None
+            headers = None
+        elif kind == "end":
+            if batch:
+                yield name, headers, batch
+                batch = []
+        elif kind == "name":
+            name = value
+        elif kind == "headers":
+            headers = value
+        elif batch_size is None:
+            yield name, headers, value
+        else:
+            batch.append(value)
+            if len(batch) >= batch_size:
+                yield name, headers, batch
+                batch = []
+
+    if batch:
+        yield name, headers, batch
+
+
+def _iter_result_set_items(file):
+    # Yields ("start", None) and ("end", None) around each result set, and
+    # ("name", name), ("headers", headers) and ("row", row) in between.
+    # Headers and rows are rebuilt from the parser's events by a builder that
+    # runs until the array starting at builder_prefix ends.
+    builder = None
+    builder_prefix = None
+    for prefix, event, value in ijson.parse(file, use_float=True):
+        if builder is not None:
+            builder.event(event, value)
+            if prefix == builder_prefix and event == "end_array":
+                kind = "headers" if builder_prefix.endswith(".headers") else "row"
+                yield kind, builder.value
+                builder = None
+        elif prefix in _RESULT_SET_PREFIXES:
+            if event == "start_map":
+                yield "start", None
+            elif event == "end_map":
+                yield "end", None
+        elif event == "string" and _is_result_set_key(prefix, "name"):
+            yield "name", value
+        elif event == "start_array" and _is_headers_or_row(prefix):
+            builder, builder_prefix = ijson.ObjectBuilder(), prefix
+            builder.event(event, value)
+
+
+def _is_result_set_key(prefix, key):
+    parent, _, prefix_key = prefix.rpartition(".")
+    return prefix_key == key and parent in _RESULT_SET_PREFIXES
+
+
+def _is_headers_or_row(prefix):
+    if _is_result_set_key(prefix, "headers"):
+        return True
+    parent, _, key = prefix.rpartition(".")
+    return key == "item" and _is_result_set_key(parent, "rowSet")
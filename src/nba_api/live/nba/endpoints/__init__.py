@@ -1,6 +1,6 @@
 __all__ = ["playbyplay", "boxscore", "scoreboard", "odds"]
 
-from .playbyplay import PlayByPlay
+from .playbyplay import PlayByPlay, PlayByPlayPoller
 from .boxscore import BoxScore
 from .scoreboard import ScoreBoard
 from .odds import Odds
\ No newline at end of file
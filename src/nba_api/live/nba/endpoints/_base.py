@@ -1,7 +1,11 @@
-import json
+from nba_api.library import jsonbackend
 
 
 class Endpoint:
+    # True when the last request returned 304 Not Modified for the data that
+    # is already loaded, in which case load_response() was skipped.
+    unchanged = False
+
     class DataSet:
         key = None
         data = {}
@@ -10,11 +14,21 @@ class Endpoint:
             self.data = data
 
         def get_json(self):
-            return json.dumps(self.data)
+            return jsonbackend.dumps(self.data)
 
         def get_dict(self):
             return self.data
 
+    def _update_response(self, nba_response):
+        self.unchanged = (
+            nba_response.is_not_modified()
+            and self.nba_response is not None
+            and self.nba_response.get_response() == nba_response.get_response()
+        )
+        self.nba_response = nba_response
+        if not self.unchanged:
+            self.load_response()
+
     def get_request_url(self):
         return self.nba_response.get_url()
 
@@ -321,14 +321,26 @@ class BoxScore(Endpoint):
             self.get_request()
 
     def get_request(self):
-        self.nba_response = NBALiveHTTP().send_api_request(
-            endpoint=self.endpoint_url.format(game_id=self.game_id),
-            parameters={},
-            proxy=self.proxy,
-            headers=self.headers,
-            timeout=self.timeout,
+        self._update_response(
+            NBALiveHTTP().send_api_request(
+                endpoint=self.endpoint_url.format(game_id=self.game_id),
+                parameters={},
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        )
+
+    async def aget_request(self):
+        self._update_response(
+            await NBALiveHTTP().asend_api_request(
+                endpoint=self.endpoint_url.format(game_id=self.game_id),
+                parameters={},
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
         )
-        self.load_response()
 
     def load_response(self):
         data_sets = self.nba_response.get_dict()
@@ -370,3 +382,97 @@ class BoxScore(Endpoint):
 
                 self.game_details.pop("awayTeam")
             self.game_details = Endpoint.DataSet(data=self.game_details)
+
+    def get_diff(self, previous):
+        """The fields that changed since an earlier state of this box score.
+
+        Args:
+            previous: An earlier ``game`` dict (``box_score.game.get_dict()``),
+                another ``BoxScore``, or None.
+
+        Returns:
+            dict: See ``get_box_score_diff``.
+        """
+        if isinstance(previous, BoxScore):
+            previous = previous.game.get_dict() if previous.game else None
+        return get_box_score_diff(previous, self.game.get_dict() if self.game else None)
+
+
+_TEAM_KEYS = ("homeTeam", "awayTeam")
+
+
+def _get_dict_diff(old, new):
+    diff = {}
+    for key, value in new.items():
+        old_value = old.get(key)
+        if key in old and value == old_value:
+            continue
+        if isinstance(value, dict) and isinstance(old_value, dict):
+            diff[key] = _get_dict_diff(old_value, value)
+        else:
+            diff[key] = value
+    for key in old.keys() - new.keys():
+        diff[key] = None
+    return diff
+
+
+def _get_keyed_diff(old, new):
+    # old and new map an id to its dict. Added entries are returned whole and
+    # removed ones as None.
+    diff = {}
+    for key, value in new.items():
+        old_value = old.get(key)
+        if old_value is None:
+            diff[key] = value
+        elif value != old_value:
+            diff[key] = _get_dict_diff(old_value, value)
+    for key in old.keys() - new.keys():
+        diff[key] = None
+    return diff
+
+
+def _get_teams(game):
+    return {
+        team["teamId"]: {key: value for key, value in team.items() if key != "players"}
+        for team in (game.get(team_key) for team_key in _TEAM_KEYS)
+        if team and "teamId" in team
+    }
+
+
+def _get_players(game):
+    return {
+        player["personId"]: player
+        for team_key in _TEAM_KEYS
+        for player in (game.get(team_key) or {}).get("players") or ()
+        if "personId" in player
+    }
+
+
+def get_box_score_diff(old, new):
+    """Compare two states of a live box score.
+
+    Only changed fields are returned. Nested objects such as ``statistics``
+    are compared field by field, and lists such as ``periods`` are returned
+    whole when they change. Teams are keyed by ``teamId`` and players by
+    ``personId``. A team or player missing from ``old`` is returned whole,
+    and fields, teams or players missing from ``new`` are returned as None.
+
+    Args:
+        old (dict): The earlier ``game`` dict of a box score, or None.
+        new (dict): The later ``game`` dict of a box score, or None.
+
+    Returns:
+        dict: ``{"game": {...}, "teams": {teamId: {...}},
+        "players": {personId: {...}}}``. Every part is empty when nothing
+        changed.
+    """
+    old = old or {}
+    new = new or {}
+    return {
+        "game": _get_dict_diff(
+            {key: value for key, value in old.items() if key not in _TEAM_KEYS},
+            {key: value for key, value in new.items() if key not in _TEAM_KEYS},
+        ),
+        "teams": _get_keyed_diff(_get_teams(old), _get_teams(new)),
+        "players": _get_keyed_diff(_get_players(old), _get_players(new)),
+    }
@@ -77,14 +77,27 @@ class Odds(Endpoint):
 
     def get_request(self):
         """Fetch the odds data from the NBA API."""
-        self.nba_response = NBALiveHTTP().send_api_request(
-            endpoint=self.endpoint_url,
-            parameters={},
-            proxy=self.proxy,
-            headers=self.headers,
-            timeout=self.timeout,
+        self._update_response(
+            NBALiveHTTP().send_api_request(
+                endpoint=self.endpoint_url,
+                parameters={},
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        )
+
+    async def aget_request(self):
+        """Fetch the odds data from the NBA API asynchronously."""
+        self._update_response(
+            await NBALiveHTTP().asend_api_request(
+                endpoint=self.endpoint_url,
+                parameters={},
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
         )
-        self.load_response()
 
     def load_response(self):
         """Process the API response and load the games data."""
@@ -75,16 +75,130 @@ class PlayByPlay(Endpoint):
             self.get_request()
 
     def get_request(self):
-        self.nba_response = NBALiveHTTP().send_api_request(
-            endpoint=self.endpoint_url.format(game_id=self.game_id),
-            parameters={},
-            proxy=self.proxy,
-            headers=self.headers,
-            timeout=self.timeout,
+        self._update_response(
+            NBALiveHTTP().send_api_request(
+                endpoint=self.endpoint_url.format(game_id=self.game_id),
+                parameters={},
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        )
+
+    async def aget_request(self):
+        self._update_response(
+            await NBALiveHTTP().asend_api_request(
+                endpoint=self.endpoint_url.format(game_id=self.game_id),
+                parameters={},
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
         )
-        self.load_response()
 
     def load_response(self):
         data_sets = self.nba_response.get_dict()
         if "game" in data_sets and "actions" in data_sets["game"]:
             self.actions = Endpoint.DataSet(data=data_sets["game"]["actions"])
+
+
+class PlayByPlayPoller:
+    """Polls a game's play-by-play and returns only what changed.
+
+    Each poll returns, in feed order, the actions whose ``orderNumber`` is
+    above the highest one seen by the previous poll (new actions) and those
+    whose ``edited`` timestamp is later than the latest one seen (edited
+    actions, including actions that moved to a new ``orderNumber``). Only
+    these two high-water marks are kept between polls, so the state does not
+    grow with the game. The feed itself always holds the whole game, and each
+    poll checks every action against the two marks, which is a pair of
+    comparisons per action. When the feed has not changed (a 304 Not
+    Modified response), nothing is compared at all.
+
+    Example:
+        >>> poller = PlayByPlayPoller('0022000180')
+        >>> for action in poller.poll():
+        ...     print(action['actionNumber'], action['description'])
+
+    Args:
+        game_id (str): The game to poll.
+        proxy (str, optional): Passed to ``PlayByPlay``.
+        headers (dict, optional): Passed to ``PlayByPlay``.
+        timeout (int, optional): Passed to ``PlayByPlay``. Defaults to 30.
+
+    Attributes:
+        play_by_play (PlayByPlay): The endpoint holding the last response.
+        last_action_number (int): Highest ``actionNumber`` seen so far.
+        last_order_number (int): Highest ``orderNumber`` seen so far.
+        last_edited (str): Latest ``edited`` timestamp seen so far.
+    """
+
+    def __init__(self, game_id, proxy=None, headers=None, timeout=30):
+        self.play_by_play = PlayByPlay(
+            game_id, proxy=proxy, headers=headers, timeout=timeout, get_request=False
+        )
+        self.last_action_number = None
+        self.last_order_number = None
+        self.last_edited = None
+
+    @property
+    def game_id(self):
+        return self.play_by_play.game_id
+
+    def poll(self):
+        """Request the feed and return the new or edited actions."""
+        self.play_by_play.get_request()
+        return self.get_changed_actions()
+
+    async def apoll(self):
+        """Like ``poll``, requesting the feed asynchronously."""
+        await self.play_by_play.aget_request()
+        return self.get_changed_actions()
+
+    def get_changed_actions(self):
+        """New or edited actions of the loaded response since the last call."""
+        if self.play_by_play.unchanged:
+            return []
+        actions = getattr(self.play_by_play, "actions", None)
+        if actions is None:
+            return []
+
+        last_order_number = self.last_order_number
+        last_edited = self.last_edited
+        changed = []
+        for action in actions.get_dict():
+            order_number = action.get("orderNumber")
+            edited = action.get("edited")
+            is_new = (
+                last_order_number is None
+                or order_number is None
+                or order_number > last_order_number
+            )
+            # The feed's timestamps share one ISO 8601 format, so they compare
+            # as strings.
+            is_edited = edited is not None and (
+                last_edited is None or edited > last_edited
+            )
+            if not (is_new or is_edited):
+                continue
+            changed.append(action)
+            self._update_marks(action.get("actionNumber"), order_number, edited)
+        return changed
+
+    def _update_marks(self, action_number, order_number, edited):
+        if action_number is not None and (
+            self.last_action_number is None or action_number > self.last_action_number
+        ):
+            self.last_action_number = action_number
+        if order_number is not None and (
+            self.last_order_number is None or order_number > self.last_order_number
+        ):
+            self.last_order_number = order_number
+        if edited is not None and (self.last_edited is None or edited > self.last_edited):
+            self.last_edited = edited
+
+    def reset(self):
+        """Forget the actions seen, so the next poll returns every action."""
+        self.last_action_number = None
+        self.last_order_number = None
+        self.last_edited = None
@@ -92,14 +92,26 @@ class ScoreBoard(Endpoint):
             self.get_request()
 
     def get_request(self):
-        self.nba_response = NBALiveHTTP().send_api_request(
-            endpoint=self.endpoint_url,
-            parameters={},
-            proxy=self.proxy,
-            headers=self.headers,
-            timeout=self.timeout,
+        self._update_response(
+            NBALiveHTTP().send_api_request(
+                endpoint=self.endpoint_url,
+                parameters={},
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
+        )
+
+    async def aget_request(self):
+        self._update_response(
+            await NBALiveHTTP().asend_api_request(
+                endpoint=self.endpoint_url,
+                parameters={},
+                proxy=self.proxy,
+                headers=self.headers,
+                timeout=self.timeout,
+            )
         )
-        self.load_response()
 
     def load_response(self):
         data_sets = self.nba_response.get_dict()
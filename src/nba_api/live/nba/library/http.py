@@ -19,6 +19,7 @@ class NBALiveHTTP(http.NBAHTTP):
     nba_response = http.NBAResponse
     base_url = "https://cdn.nba.com/static/json/liveData/{endpoint}"
     headers = STATS_HEADERS
+    conditional_requests = True
 
     def clean_contents(self, contents):
         if '{"Message":"An error has occurred."}' in contents:
@@ -0,0 +1,255 @@
+"""
+Watch every game of the day from the live feeds.
+
+``GameWatcher`` polls the scoreboard to discover games and follow their state
+from ``gameStatus``, and polls the box score and play-by-play of games in
+progress. All requests that are due at the same time are sent together as one
+concurrent burst, and each game is polled at an interval matching its state:
+often while it is live, less often at halftime, not at all before tip-off,
+and once more when it ends to pick up the final numbers.
+
+Changes are emitted as ``GameEvent`` objects, either from the ``events()``
+async iterator or to callbacks registered with ``add_callback`` while
+``run()`` is awaited. The watcher stops once every game it watches is final,
+and keeps polling the scoreboard until at least one of them is listed.
+
+Requires `httpx <https://www.python-httpx.org/>`_, like every async request.
+
+Example:
+    >>> import asyncio
+    >>> from nba_api.live.nba.watcher import GameWatcher
+    >>> async def main():
+    ...     async for event in GameWatcher().events():
+    ...         if event.kind == 'actions':
+    ...             for action in event.data:
+    ...                 print(event.game_id, action['description'])
+    >>> asyncio.run(main())
+"""
+
+import asyncio
+import time
+
+from nba_api.live.nba.endpoints import BoxScore, PlayByPlayPoller, ScoreBoard
+from nba_api.live.nba.endpoints.boxscore import get_box_score_diff
+
+PREGAME = "pregame"
+LIVE = "live"
+HALFTIME = "halftime"
+FINAL = "final"
+
+# Seconds between polls of a game's box score and play-by-play, by game state.
+# None stops polling a game in that state.
+DEFAULT_INTERVALS = {PREGAME: None, LIVE: 5, HALFTIME: 30, FINAL: None}
+
+
+def get_game_state(game):
+    """The state of a scoreboard game: pregame, live, halftime or final."""
+    status = game.get("gameStatus")
+    if status == 1:
+        return PREGAME
+    if status == 3:
+        return FINAL
+    if (game.get("gameStatusText") or "").strip().lower() in ("half", "halftime"):
+        return HALFTIME
+    return LIVE
+
+
+class GameEvent:
+    """A change seen by ``GameWatcher``.
+
+    Attributes:
+        kind (str): ``"game"`` when the game's scoreboard entry changed,
+            ``"boxscore"`` when its box score changed, ``"actions"`` for new or
+            edited play-by-play actions, or ``"error"`` for a failed request.
+        game_id (str): The game, or None for a failed scoreboard request.
+        state (str): The game's state when the event was emitted.
+        data: The scoreboard game, the box score ``game`` dict, the list of
+            actions, or the exception.
+        diff (dict): For ``"boxscore"`` events, the changed game, team and
+            player fields (see ``get_box_score_diff``). None otherwise.
+    """
+
+    def __init__(self, kind, game_id, state, data, diff=None):
+        self.kind = kind
+        self.game_id = game_id
+        self.state = state
+        self.data = data
+        self.diff = diff
+
+    def __repr__(self):
+        return "GameEvent(kind={!r}, game_id={!r}, state={!r})".format(
+            self.kind, self.game_id, self.state
+        )
+
+
+class _WatchedGame:
+    def __init__(self, game_id, proxy, headers, timeout):
+        self.game_id = game_id
+        self.state = None
+        self.scoreboard_game = None
+        self.box_score = BoxScore(
+            game_id, proxy=proxy, headers=headers, timeout=timeout, get_request=False
+        )
+        self.box_score_game = None
+        self.poller = PlayByPlayPoller(
+            game_id, proxy=proxy, headers=headers, timeout=timeout
+        )
+        self.polled = False
+        self.next_poll = None
+
+
+class GameWatcher:
+    """Polls the scoreboard, box scores and play-by-play of a game day.
+
+    Args:
+        game_ids (iterable, optional): Only watch these games. Defaults to
+            None, which watches every game on the scoreboard.
+        intervals (dict, optional): Seconds between polls of a game, by state,
+            merged into ``DEFAULT_INTERVALS``. None stops polling a game in
+            that state.
+        scoreboard_interval (float, optional): Seconds between scoreboard
+            polls. Defaults to 30.
+        proxy (str, optional): Passed to every endpoint.
+        headers (dict, optional): Passed to every endpoint.
+        timeout (int, optional): Passed to every endpoint. Defaults to 30.
+    """
+
+    def __init__(
+        self,
+        game_ids=None,
+        intervals=None,
+        scoreboard_interval=30,
+        proxy=None,
+        headers=None,
+        timeout=30,
+    ):
+        self.game_ids = None if game_ids is None else set(game_ids)
+        self.intervals = dict(DEFAULT_INTERVALS, **(intervals or {}))
+        self.scoreboard_interval = scoreboard_interval
+        self.proxy = proxy
+        self.headers = headers
+        self.timeout = timeout
+        self.scoreboard = ScoreBoard(
+            proxy=proxy, headers=headers, timeout=timeout, get_request=False
+        )
+        self.games = {}
+        self._callbacks = []
+        self._stopped = False
+
+    def add_callback(self, callback):
+        """Call ``callback(event)`` for every event while ``run()`` runs."""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        if callback in self._callbacks:
+            self._callbacks.remove(callback)
+
+    def stop(self):
+        """Stop watching after the requests in flight complete."""
+        self._stopped = True
+
+    async def run(self):
+        """Watch until every game is final, passing events to the callbacks."""
+        async for event in self.events():
+            for callback in list(self._callbacks):
+                callback(event)
+
+    async def events(self):
+        """Watch until every game is final, yielding ``GameEvent`` objects."""
+        self._stopped = False
+        next_scoreboard_poll = time.monotonic()
+        while not self._stopped:
+            now = time.monotonic()
+            requests = []
+            if now >= next_scoreboard_poll:
+                next_scoreboard_poll = now + self.scoreboard_interval
+                requests.append((self.scoreboard.aget_request(), None, "scoreboard"))
+            for game in self.games.values():
+                if game.next_poll is None or now < game.next_poll:
+                    continue
+                game.polled = True
+                interval = self.intervals.get(game.state)
+                game.next_poll = None if interval is None else now + interval
+                requests.append((game.box_score.aget_request(), game, "boxscore"))
+                requests.append((game.poller.apoll(), game, "actions"))
+
+            results = await asyncio.gather(
+                *(request for request, _, _ in requests), return_exceptions=True
+            )
+            for (_, game, kind), result in zip(requests, results):
+                if isinstance(result, Exception):
+                    yield GameEvent(
+                        "error",
+                        None if game is None else game.game_id,
+                        None if game is None else game.state,
+                        result,
+                    )
+                elif kind == "scoreboard":
+                    for event in self._get_scoreboard_events(time.monotonic()):
+                        yield event
+                elif kind == "boxscore":
+                    event = self._get_box_score_event(game)
+                    if event is not None:
+                        yield event
+                elif result:
+                    yield GameEvent("actions", game.game_id, game.state, result)
+
+            if self._stopped or self._is_finished():
+                return
+            due = [next_scoreboard_poll] + [
+                game.next_poll
+                for game in self.games.values()
+                if game.next_poll is not None
+            ]
+            await asyncio.sleep(max(0, min(due) - time.monotonic()))
+
+    def _is_finished(self):
+        # Done once at least one watched game is on the scoreboard and no game
+        # has anything left to poll or is still to be played. Until a watched
+        # game is listed, the scoreboard keeps being polled.
+        if self.scoreboard.nba_response is None or not self.games:
+            return False
+        return all(
+            game.state == FINAL and game.next_poll is None
+            for game in self.games.values()
+        )
+
+    def _get_scoreboard_events(self, now):
+        if self.scoreboard.unchanged or self.scoreboard.games is None:
+            return []
+        events = []
+        for scoreboard_game in self.scoreboard.games.get_dict():
+            game_id = scoreboard_game.get("gameId")
+            if self.game_ids is not None and game_id not in self.game_ids:
+                continue
+            game = self.games.get(game_id)
+            if game is None:
+                game = self.games[game_id] = _WatchedGame(
+                    game_id, self.proxy, self.headers, self.timeout
+                )
+            if scoreboard_game == game.scoreboard_game:
+                continue
+            game.scoreboard_game = scoreboard_game
+
+            state = get_game_state(scoreboard_game)
+            if state != game.state:
+                game.state = state
+                if self.intervals.get(state) is not None:
+                    game.next_poll = now
+                elif state == FINAL and game.polled:
+                    # One last poll for the final box score and actions.
+                    game.next_poll = now
+                else:
+                    game.next_poll = None
+            events.append(GameEvent("game", game_id, state, scoreboard_game))
+        return events
+
+    def _get_box_score_event(self, game):
+        if game.box_score.unchanged:
+            return None
+        box_score_game = game.box_score.get_dict().get("game")
+        if box_score_game is None or box_score_game == game.box_score_game:
+            return None
+        diff = get_box_score_diff(game.box_score_game, box_score_game)
+        game.box_score_game = box_score_game
+        return GameEvent("boxscore", game.game_id, game.state, box_score_game, diff)
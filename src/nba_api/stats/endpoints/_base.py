@@ -1,29 +1,421 @@
-import json
+from functools import lru_cache, partial
+
 import numpy as np
 
+from nba_api.library import jsonbackend
+from nba_api.stats.library.http import NBAStatsHTTP
+
 try:
-    from pandas import DataFrame, MultiIndex
+    from pandas import Categorical, DataFrame, MultiIndex, to_datetime
+    from pandas import array as pandas_array
 
     PANDAS = True
 except ImportError:
     PANDAS = False
 
+try:
+    import pyarrow
+
+    PYARROW = True
+except ImportError:
+    PYARROW = False
+
+try:
+    import polars
+
+    POLARS = True
+except ImportError:
+    POLARS = False
+
+
+# Header name fragments of columns that hold fractions, which are kept as
+# float64 even when every value in a data set happens to be a whole number.
+FLOAT_COLUMN_SUFFIXES = ("_PCT", "_RATING", "_RATIO")
+FLOAT_COLUMN_PREFIXES = ("PCT_", "E_", "PACE", "PIE", "USG")
+
+
+def get_column_dtype(name, values):
+    """Infer a NumPy dtype for a rowSet column.
+
+    Whole numbers become int64 (IDs, counting stats), numbers with missing
+    values or fractions become float64, and anything else, such as string
+    IDs with leading zeros like ``GAME_ID``, stays an object column.
+    """
+    types = set(map(type, values))
+    if not types or not types <= {int, float, type(None)}:
+        return object
+    if types == {type(None)}:
+        return object
+    name = name if isinstance(name, str) else ""
+    if types == {int} and not (
+        name.endswith(FLOAT_COLUMN_SUFFIXES) or name.startswith(FLOAT_COLUMN_PREFIXES)
+    ):
+        return np.int64
+    return np.float64
+
+
+def get_column_array(name, values):
+    """Convert a rowSet column to a NumPy array of its inferred dtype."""
+    try:
+        return np.array(values, dtype=get_column_dtype(name, values))
+    except (OverflowError, TypeError, ValueError):
+        return np.array(values, dtype=object)
+
+
+def get_column_arrays(headers, rows):
+    """Transpose a rowSet into one NumPy array per column."""
+    if not rows:
+        return [np.array([], dtype=object) for _ in headers]
+    return [get_column_array(name, values) for name, values in zip(headers, zip(*rows))]
+
+
+def _get_int_column(values, types):
+    if types <= {int}:
+        try:
+            return np.array(values, dtype=np.int64)
+        except OverflowError:
+            return None
+    if types <= {int, type(None)}:
+        return pandas_array(values, dtype="Int64")
+    return None
+
+
+def _get_float_column(values, types):
+    if types <= {int, float, type(None)}:
+        return np.array(values, dtype=np.float64)
+    return None
+
+
+def _get_str_column(values, types):
+    if types <= {str, type(None)}:
+        return list(values)
+    return None
+
+
+def _get_date_column(values, types):
+    if not types <= {str, type(None)}:
+        return None
+    # Most dates are ISO 8601, which parses much faster than inferring the
+    # format of every value ("APR 14, 2024").
+    for date_format in ("ISO8601", "mixed"):
+        try:
+            return to_datetime(values, format=date_format)
+        except (TypeError, ValueError):
+            pass
+    return None
+
+
+def _get_category_column(values, types):
+    if types <= {str, type(None)}:
+        return Categorical(values)
+    return None
+
+
+_TYPED_COLUMN_CONVERTERS = {
+    "int": _get_int_column,
+    "float": _get_float_column,
+    "str": _get_str_column,
+    "date": _get_date_column,
+    "category": _get_category_column,
+}
+
+
+def get_typed_column(values, column_type):
+    """Convert a rowSet column to a column type from an endpoint's schema.
+
+    Types are ``"int"`` (int64, or the nullable Int64 when values are
+    missing), ``"float"``, ``"str"``, ``"date"`` and ``"category"``.
+
+    Returns:
+        The converted column, or None when the values do not fit the type and
+        the column's type should be inferred instead.
+    """
+    converter = _TYPED_COLUMN_CONVERTERS.get(column_type)
+    if converter is None:
+        return None
+    return converter(values, set(map(type, values)))
+
+
+def get_header_signature(headers):
+    """A hashable description of multi-level headers (``columnSpan`` etc.)."""
+    return tuple(
+        (
+            level.get("name", "LEVEL_" + str(i)),
+            level.get("columnsToSkip", 0),
+            level.get("columnSpan", 1),
+            tuple(level["columnNames"]),
+        )
+        for i, level in enumerate(headers)
+    )
+
+
+@lru_cache(maxsize=256)
+def get_header_levels(signature):
+    """Expand multi-level headers to one column name per column and level.
+
+    Endpoints return the same headers for every team, player and season, so
+    the levels are computed once per header signature.
+
+    Returns:
+        tuple: ``(levels, level_names)``, with one tuple of names per level.
+    """
+    levels = []
+    level_names = []
+    for name, columns_to_skip, column_span, column_names in signature:
+        level_names.append(name)
+        levels.append(
+            ("",) * columns_to_skip
+            + tuple(
+                column_name
+                for column_name in column_names
+                for _ in range(column_span)
+            )
+        )
+    return tuple(levels), tuple(level_names)
+
+
+@lru_cache(maxsize=256)
+def _get_cached_multi_index(signature):
+    levels, level_names = get_header_levels(signature)
+    return MultiIndex.from_arrays(levels, names=level_names)
+
+
+def get_multi_index(signature):
+    """The ``MultiIndex`` of multi-level headers.
+
+    The index is built once per header signature and copied for every
+    DataFrame, which is much cheaper than building it again, so renaming one
+    DataFrame's column levels does not affect the others.
+    """
+    return _get_cached_multi_index(signature).copy()
+
+
+def get_struct_groups(paths, separator="_"):
+    """Group multi-level column names by their top level.
+
+    Returns a list of ``(name, column_index, children)`` in column order.
+    Columns without a top level name (``columnsToSkip``) stay on their own
+    with ``children`` set to None; grouped columns have ``column_index`` set
+    to None and ``children`` is a list of ``(column_index, child_name)``.
+    """
+    groups = []
+    group_children = {}
+    for i, path in enumerate(paths):
+        if len(path) == 1 or not path[0]:
+            groups.append((separator.join(name for name in path if name), i, None))
+            continue
+        children = group_children.get(path[0])
+        if children is None:
+            children = group_children[path[0]] = []
+            groups.append((path[0], None, children))
+        children.append((i, separator.join(path[1:])))
+    return groups
+
+
+def _to_arrow_array(array):
+    # from_pandas turns NaN (missing values) into nulls. Object columns mixing
+    # types are stored as strings.
+    try:
+        return pyarrow.array(array, from_pandas=True)
+    except (pyarrow.ArrowInvalid, pyarrow.ArrowTypeError):
+        return pyarrow.array([None if v is None else str(v) for v in array])
+
+
+def _to_polars_series(name, array):
+    if array.dtype == np.float64:
+        return polars.Series(name, array, nan_to_null=True)
+    if array.dtype != object:
+        return polars.Series(name, array)
+    return polars.Series(name, array.tolist(), strict=False)
+
 
 class Endpoint:
     class DataSet:
         key = None
-        data = {}
 
-        def __init__(self, data):
-            self.data = data
+        # Build DataFrames from per-column NumPy arrays instead of row lists.
+        columnar = False
+
+        # Convert columns to the types in the endpoint's expected_schema.
+        use_schema = True
+
+        # Dictionary encode the schema's "category" columns (team
+        # abbreviations, matchups, action types...) as pandas categoricals.
+        # Otherwise they are kept as strings.
+        categorical = False
+
+        def __init__(self, data=None, loader=None, schema=None):
+            """
+            Args:
+                data (dict, optional): The data set's ``headers`` and ``data``.
+                loader (callable, optional): Returns the data set's ``headers``
+                    and ``data``. Called the first time ``data`` is accessed,
+                    instead of passing ``data`` up front.
+                schema (dict, optional): Column name -> column type, applied
+                    by ``get_data_frame``. See ``get_typed_column``.
+            """
+            self._data = {} if data is None else data
+            self._loader = loader
+            self._column_arrays = None
+            self.schema = schema or {}
+
+        @property
+        def data(self):
+            if self._loader is not None:
+                self._data, self._loader = self._loader(), None
+            return self._data
+
+        @data.setter
+        def data(self, data):
+            self._data = data
+            self._loader = None
+            self._column_arrays = None
+
+        def is_loaded(self):
+            return self._loader is None
 
         def get_json(self):
-            return json.dumps(self.data)
+            return jsonbackend.dumps(self.data)
 
         def get_dict(self):
             return self.data
 
-        def get_data_frame(self):
+        def get_column_arrays(self):
+            """The data set as one NumPy array per column, in header order.
+
+            The rowSet is transposed once and the arrays are reused.
+            """
+            if self._column_arrays is None:
+                self._column_arrays = get_column_arrays(
+                    self._get_column_names(), self.data.get("data", [])
+                )
+            return self._column_arrays
+
+        def get_columns(self):
+            """The data set as a ``dict`` of column name to NumPy array."""
+            return dict(zip(self._get_column_names(), self.get_column_arrays()))
+
+        def _get_column_names(self):
+            headers = self.data.get("headers") or []
+            if not headers or isinstance(headers[0], str):
+                return headers
+            levels = self._get_header_levels()[0]
+            return [tuple(str(name) for name in column) for column in zip(*levels)]
+
+        def _get_header_levels(self):
+            return get_header_levels(get_header_signature(self.data["headers"]))
+
+        def _get_columnar_data_frame(self, columns):
+            if not self.data.get("data"):
+                return DataFrame(self.data.get("data", []), columns=columns)
+            data_frame = DataFrame(
+                dict(enumerate(self.get_column_arrays())), copy=False
+            )
+            data_frame.columns = columns
+            return data_frame
+
+        def _get_typed_data_frame(self, columns, categorical):
+            rows = self.data["data"]
+            if not rows or len(set(columns)) != len(columns):
+                return None
+            data = {}
+            for name, values in zip(columns, zip(*rows)):
+                column = None
+                column_type = self.schema.get(name)
+                if column_type == "category" and not categorical:
+                    column_type = "str"
+                if column_type is not None:
+                    column = get_typed_column(values, column_type)
+                if column is None:
+                    column = (
+                        get_column_array(name, values)
+                        if self.columnar
+                        else list(values)
+                    )
+                data[name] = column
+            return DataFrame(data, columns=columns, copy=False)
+
+        def _get_column_paths(self):
+            headers = self.data.get("headers") or []
+            if headers and not isinstance(headers[0], str):
+                return self._get_column_names()
+            return [(name,) for name in headers]
+
+        def get_arrow_table(self, multi_index="flatten", separator="_"):
+            """Build a ``pyarrow.Table`` from the column arrays, without pandas.
+
+            Args:
+                multi_index (str, optional): How multi-level headers are kept:
+                    ``"flatten"`` joins the levels into one name, ``"struct"``
+                    nests the columns of each top level in a struct column.
+                    Defaults to ``"flatten"``.
+                separator (str, optional): Joins level names. Defaults to "_".
+            """
+            if not PYARROW:
+                raise Exception("Import Missing - Failed to import pyarrow.")
+
+            paths = self._get_column_paths()
+            arrays = [_to_arrow_array(array) for array in self.get_column_arrays()]
+            if multi_index != "struct":
+                names = [
+                    separator.join(name for name in path if name) for path in paths
+                ]
+                return pyarrow.Table.from_arrays(arrays, names=names)
+
+            names = []
+            columns = []
+            for name, i, children in get_struct_groups(paths, separator):
+                names.append(name)
+                if children is None:
+                    columns.append(arrays[i])
+                else:
+                    columns.append(
+                        pyarrow.StructArray.from_arrays(
+                            [arrays[j] for j, _ in children],
+                            names=[child for _, child in children],
+                        )
+                    )
+            return pyarrow.Table.from_arrays(columns, names=names)
+
+        def get_polars_frame(self, multi_index="flatten", separator="_"):
+            """Build a ``polars.DataFrame`` from the column arrays, without pandas.
+
+            Takes the same arguments as ``get_arrow_table``.
+            """
+            if not POLARS:
+                raise Exception("Import Missing - Failed to import polars.")
+
+            paths = self._get_column_paths()
+            names = [separator.join(name for name in path if name) for path in paths]
+            data_frame = polars.DataFrame(
+                [
+                    _to_polars_series(name, array)
+                    for name, array in zip(names, self.get_column_arrays())
+                ]
+            )
+            if multi_index != "struct":
+                return data_frame
+
+            columns = []
+            for name, i, children in get_struct_groups(paths, separator):
+                if children is None:
+                    columns.append(polars.col(names[i]).alias(name))
+                else:
+                    columns.append(
+                        polars.struct(
+                            [polars.col(names[j]).alias(child) for j, child in children]
+                        ).alias(name)
+                    )
+            return data_frame.select(columns)
+
+        def get_data_frame(self, categorical=None):
+            """The data set as a pandas ``DataFrame``.
+
+            Args:
+                categorical (bool, optional): Dictionary encode the schema's
+                    ``"category"`` columns. Defaults to None, which uses
+                    ``DataSet.categorical``.
+            """
             if not PANDAS:
                 raise Exception(
                     "Import Missing - Failed to import DataFrame from pandas."
@@ -33,40 +425,85 @@ class Endpoint:
                 return DataFrame()
 
             if isinstance(self.data['headers'][0], str):
-                return DataFrame(self.data["data"], columns=self.data["headers"])
-
+                columns = self.data["headers"]
+                if self.use_schema and self.schema:
+                    if categorical is None:
+                        categorical = self.categorical
+                    data_frame = self._get_typed_data_frame(columns, categorical)
+                    if data_frame is not None:
+                        return data_frame
             else:  # Multiple levels of column names
-                levels = []
-                level_names = []
-                for i in range(
-                    len(self.data["headers"])
-                ):  # Extend column names for level to full length
-                    level = self.data["headers"][i]
-                    level_names.append(
-                        level["name"] if "name" in level else "LEVEL_" + str(i)
-                    )
-                    column_names = (
-                        [""] * level["columnsToSkip"]
-                        if "columnsToSkip" in level
-                        else []
-                    )
-                    column_names += list(
-                        np.repeat(
-                            np.array(level["columnNames"]),
-                            level["columnSpan"] if "columnSpan" in level else 1,
-                        )
-                    )
-                    levels.append(column_names)
-                midx = MultiIndex.from_arrays(
-                    levels, names=level_names
-                )  # Use MultiIndex for dataframe columns
-                return DataFrame(self.data["data"], columns=midx)
+                # Use MultiIndex for dataframe columns
+                columns = get_multi_index(get_header_signature(self.data["headers"]))
+
+            if self.columnar:
+                return self._get_columnar_data_frame(columns)
+            return DataFrame(self.data["data"], columns=columns)
+
+    async def aget_request(self):
+        self.nba_response = await NBAStatsHTTP().asend_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+        )
+        self.load_response()
+
+    def stream(self, batch_size=None):
+        """Request the endpoint and yield its rows as the response downloads.
+
+        Unlike ``get_request``, the response is never loaded as a whole, so
+        ``nba_response`` and the data sets are left untouched. Requires ijson.
+
+        Args:
+            batch_size (int, optional): Yield lists of up to this many rows.
+                Defaults to None, which yields rows one at a time.
+
+        Yields:
+            tuple: ``(data_set_name, headers, row)``, or
+            ``(data_set_name, headers, rows)`` when ``batch_size`` is set.
+        """
+        return NBAStatsHTTP().stream_api_request(
+            endpoint=self.endpoint,
+            parameters=self.parameters,
+            proxy=self.proxy,
+            headers=self.headers,
+            timeout=self.timeout,
+            batch_size=batch_size,
+        )
+
+    expected_schema = {}
+
+    def load_data_sets(self, endpoint=None):
+        """Create a DataSet for every data set in the response.
+
+        The DataSets are shared between ``self.data_sets`` and the named
+        attributes set by ``load_response``. Their data is only looked up, and
+        for V3 endpoints parsed, the first time it is used.
+
+        Args:
+            endpoint (str, optional): The endpoint name, for V3 endpoints.
+
+        Returns:
+            dict: Data set name -> DataSet.
+        """
+        data_sets = self.nba_response.get_data_sets(endpoint, lazy=True)
+        named_data_sets = {
+            name: Endpoint.DataSet(
+                loader=partial(data_sets.__getitem__, name),
+                schema=self.expected_schema.get(name),
+            )
+            for name in data_sets
+        }
+        self.data_sets = list(named_data_sets.values())
+        return named_data_sets
 
     def get_request_url(self):
         return self.nba_response.get_url()
 
     def get_available_data(self):
-        return self.get_normalized_dict().keys()
+        return self.nba_response.get_data_set_names()
 
     def get_response(self):
         return self.nba_response.get_response()
@@ -77,11 +514,14 @@ class Endpoint:
     def get_json(self):
         return self.nba_response.get_json()
 
-    def get_normalized_dict(self):
-        return self.nba_response.get_normalized_dict()
+    def get_normalized_dict(self, lazy=False):
+        return self.nba_response.get_normalized_dict(lazy=lazy)
 
     def get_normalized_json(self):
         return self.nba_response.get_normalized_json()
 
-    def get_data_frames(self):
-        return [data_set.get_data_frame() for data_set in self.data_sets]
+    def get_data_frames(self, categorical=None):
+        return [
+            data_set.get_data_frame(categorical=categorical)
+            for data_set in self.data_sets
+        ]
@@ -0,0 +1,231 @@
+"""Flatten nested V3 responses into rows from a declarative table spec.
+
+A table spec is a sequence of steps, read top to bottom like the nested loops
+a parser would otherwise write by hand:
+
+- a key, or a tuple of keys, descends into a nested object,
+- ``each(*keys)`` loops over several sibling objects (``homeTeam``,
+  ``awayTeam``),
+- ``items(*path)`` loops over the objects of a list (``players``),
+- ``fields(*names)`` adds columns read from the current object, or from the
+  object at ``path`` below it,
+- ``label()`` adds a column holding the label of the innermost ``each``.
+
+Missing objects and lists are treated as empty, and missing fields as None,
+like chained ``dict.get`` calls.
+
+Example:
+    >>> TEAM_STATS = compile_table(
+    ...     "boxScoreTraditional",
+    ...     fields("gameId"),
+    ...     each("homeTeam", "awayTeam"),
+    ...     fields("teamId", "teamTricode"),
+    ...     fields("points", "assists", path="statistics"),
+    ... )
+    >>> TEAM_STATS.headers
+    ('gameId', 'teamId', 'teamTricode', 'points', 'assists')
+    >>> TEAM_STATS(nba_dict)
+    [['0022400001', 1610612747, 'LAL', 110, 25], [...]]
+
+Each spec is compiled once, when the parser module is imported, into a Python
+function with the loops unrolled. Values of outer loops are computed once per
+iteration instead of once per row, and each ``fields`` group is read with a
+single ``operator.itemgetter`` call, falling back to ``dict.get`` only for
+objects missing one of its fields. ``tools/benchmarks/playbyplayv3.py``
+measures the gain on a full game.
+"""
+
+from operator import itemgetter
+
+_EMPTY = {}
+
+
+class _Each:
+    def __init__(self, keys, labels):
+        self.keys = keys
+        self.labels = labels
+
+
+class _Items:
+    def __init__(self, path):
+        self.path = path
+
+
+class _Fields:
+    def __init__(self, names, path):
+        self.names = names
+        self.path = path
+
+
+class _Label:
+    def __init__(self, name):
+        self.name = name
+
+
+def each(*keys, labels=None):
+    """Loop over the objects at ``keys``, optionally labelling each one."""
+    if labels is not None and len(labels) != len(keys):
+        raise ValueError("each() needs one label per key.")
+    return _Each(keys, labels)
+
+
+def items(*path):
+    """Loop over the objects in the list at ``path``."""
+    return _Items(path)
+
+
+def fields(*names, path=()):
+    """Columns read from the current object, or from the object at ``path``."""
+    if isinstance(path, str):
+        path = (path,)
+    return _Fields(names, tuple(path))
+
+
+def label(name="label"):
+    """A column holding the label of the innermost ``each``."""
+    return _Label(name)
+
+
+def _get_path_source(variable, path):
+    source = variable
+    for key in path:
+        source = "({}.get({!r}) or _EMPTY)".format(source, key)
+    return source
+
+
+class Table:
+    """A compiled table spec. Call it with a response to get its rows.
+
+    Attributes:
+        headers (tuple): The column names, in row order.
+        source (str): The generated Python source, for debugging.
+    """
+
+    def __init__(self, headers, source, extract):
+        self.headers = headers
+        self.source = source
+        self._extract = extract
+
+    def __call__(self, data):
+        return self._extract(data)
+
+    def __repr__(self):
+        return "Table({} columns)".format(len(self.headers))
+
+
+def compile_table(*steps):
+    """Compile a table spec into a ``Table``. See the module docstring."""
+    headers = []
+    lines = ["def extract(data):", "    rows = []", "    append = rows.append"]
+    indent = "    "
+    variable = "o0"
+    lines.append(indent + "o0 = data")
+    # Columns added since the last loop, and the variable holding the values
+    # of the enclosing loops.
+    columns = []
+    prefix = None
+    label_variable = None
+    count = 0
+    namespace = {"_EMPTY": _EMPTY}
+
+    def flush():
+        # Store the columns of the current loop level, computed once per
+        # iteration, ahead of the next loop.
+        nonlocal columns, prefix
+        if not columns:
+            return
+        values = "[{}]".format(", ".join(columns))
+        count_name = "p{}".format(count)
+        if prefix is None:
+            lines.append("{}{} = {}".format(indent, count_name, values))
+        else:
+            lines.append("{}{} = {} + {}".format(indent, count_name, prefix, values))
+        prefix = count_name
+        columns = []
+
+    for step in steps:
+        count += 1
+        if isinstance(step, (str, tuple)):
+            path = (step,) if isinstance(step, str) else step
+            new_variable = "o{}".format(count)
+            source = _get_path_source(variable, path)
+            lines.append("{}{} = {}".format(indent, new_variable, source))
+            variable = new_variable
+        elif isinstance(step, _Fields):
+            source = variable
+            if step.path:
+                source = "o{}".format(count)
+                lines.append(
+                    "{}{} = {}".format(
+                        indent, source, _get_path_source(variable, step.path)
+                    )
+                )
+            if len(step.names) == 1:
+                columns.append("{}.get({!r})".format(source, step.names[0]))
+            else:
+                # Read the whole group with one itemgetter call, and fall back
+                # to dict.get when a field is missing.
+                values = "v{}".format(count)
+                namespace["g{}".format(count)] = itemgetter(*step.names)
+                namespace["n{}".format(count)] = step.names
+                lines.extend(
+                    [
+                        "{}try:".format(indent),
+                        "{}    {} = g{}({})".format(indent, values, count, source),
+                        "{}except KeyError:".format(indent),
+                        "{}    {} = tuple(map({}.get, n{}))".format(
+                            indent, values, source, count
+                        ),
+                    ]
+                )
+                columns.append("*" + values)
+            headers.extend(step.names)
+        elif isinstance(step, _Label):
+            if label_variable is None:
+                raise ValueError("label() needs an enclosing each() with labels.")
+            columns.append(label_variable)
+            headers.append(step.name)
+        elif isinstance(step, (_Each, _Items)):
+            flush()
+            new_variable = "o{}".format(count)
+            if isinstance(step, _Items):
+                lines.append(
+                    "{}for {} in {}.get({!r}) or ():".format(
+                        indent,
+                        new_variable,
+                        _get_path_source(variable, step.path[:-1]),
+                        step.path[-1],
+                    )
+                )
+            elif step.labels is None:
+                objects = ", ".join(
+                    _get_path_source(variable, (key,)) for key in step.keys
+                )
+                lines.append(
+                    "{}for {} in ({},):".format(indent, new_variable, objects)
+                )
+            else:
+                label_variable = "l{}".format(count)
+                pairs = ", ".join(
+                    "({}, {!r})".format(_get_path_source(variable, (key,)), name)
+                    for key, name in zip(step.keys, step.labels)
+                )
+                lines.append(
+                    "{}for {}, {} in ({},):".format(
+                        indent, new_variable, label_variable, pairs
+                    )
+                )
+            indent += "    "
+            variable = new_variable
+        else:
+            raise ValueError("Unknown table spec step: {!r}".format(step))
+
+    if prefix is not None:
+        columns.insert(0, "*" + prefix)
+    row = "[{}]".format(", ".join(columns))
+    lines.append("{}append({})".format(indent, row))
+    lines.append("    return rows")
+
+    source = "\n".join(lines) + "\n"
+    exec(compile(source, "<table spec>", "exec"), namespace)
+    return Table(tuple(headers), source, namespace["extract"])
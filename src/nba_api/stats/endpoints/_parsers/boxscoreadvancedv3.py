@@ -13,6 +13,8 @@ Structure:
     }
 """
 
+from ._flatten import compile_table, each, fields, items
+
 # Common metadata fields
 TEAM_METADATA_FIELDS = (
     "teamId",
@@ -89,6 +91,23 @@ PLAYER_STATS_FIELDS = (
 )
 
 
+TEAM_TABLE = compile_table(
+    fields("gameId"),
+    each("homeTeam", "awayTeam"),
+    fields(*TEAM_METADATA_FIELDS),
+    fields(*TEAM_STATS_FIELDS, path="statistics"),
+)
+
+PLAYER_TABLE = compile_table(
+    fields("gameId"),
+    each("awayTeam", "homeTeam"),
+    fields(*TEAM_METADATA_FIELDS),
+    items("players"),
+    fields(*PLAYER_METADATA_FIELDS),
+    fields(*PLAYER_STATS_FIELDS, path="statistics"),
+)
+
+
 class NBAStatsBoxscoreAdvancedV3Parser:
     """
     Parser for BoxScoreAdvancedV3 endpoint.
@@ -142,24 +161,7 @@ class NBAStatsBoxscoreAdvancedV3Parser:
         Returns:
             list: List of two rows [home_team_data, away_team_data]
         """
-        game_id = self.boxscore.get("gameId")
-        data = []
-
-        for team_key in ["homeTeam", "awayTeam"]:
-            team = self.boxscore.get(team_key, {})
-
-            # Extract team metadata
-            team_metadata = tuple(team.get(field) for field in TEAM_METADATA_FIELDS)
-
-            # Extract team statistics
-            team_stats = team.get("statistics", {})
-            stats_values = tuple(team_stats.get(field) for field in TEAM_STATS_FIELDS)
-
-            # Combine into single row
-            row = (game_id,) + team_metadata + stats_values
-            data.append(list(row))
-
-        return data
+        return TEAM_TABLE(self.boxscore)
 
     def get_player_data(self):
         """
@@ -168,33 +170,7 @@ class NBAStatsBoxscoreAdvancedV3Parser:
         Returns:
             list: List of player data rows
         """
-        game_id = self.boxscore.get("gameId")
-        data = []
-
-        for team_key in ["awayTeam", "homeTeam"]:
-            team = self.boxscore.get(team_key, {})
-
-            # Extract team metadata (same for all players on this team)
-            team_metadata = tuple(team.get(field) for field in TEAM_METADATA_FIELDS)
-
-            # Process each player
-            for player in team.get("players", []):
-                # Extract player metadata
-                player_metadata = tuple(
-                    player.get(field) for field in PLAYER_METADATA_FIELDS
-                )
-
-                # Extract player statistics
-                player_stats = player.get("statistics", {})
-                stats_values = tuple(
-                    player_stats.get(field) for field in PLAYER_STATS_FIELDS
-                )
-
-                # Combine into single row
-                row = (game_id,) + team_metadata + player_metadata + stats_values
-                data.append(list(row))
-
-        return data
+        return PLAYER_TABLE(self.boxscore)
 
     def get_data_sets(self):
         """
@@ -204,12 +180,22 @@ class NBAStatsBoxscoreAdvancedV3Parser:
             dict: Dictionary with PlayerStats and TeamStats datasets
                   Order matches expected_data in boxscoreadvancedv3.py
         """
+        return {name: load() for name, load in self.get_data_set_loaders().items()}
+
+    def get_data_set_loaders(self):
+        """
+        Get a loader for each dataset, so datasets can be parsed on demand.
+
+        Returns:
+            dict: Dataset name mapped to a callable returning its headers
+                  and data
+        """
         return {
-            "PlayerStats": {
+            "PlayerStats": lambda: {
                 "headers": list(self.get_player_headers()),
                 "data": self.get_player_data(),
             },
-            "TeamStats": {
+            "TeamStats": lambda: {
                 "headers": list(self.get_team_headers()),
                 "data": self.get_team_data(),
             },
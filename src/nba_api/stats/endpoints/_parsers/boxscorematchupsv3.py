@@ -69,8 +69,12 @@ class NBAStatsBoxscoreMatchupsParserV3:
         return pl_data
 
     def get_data_sets(self):
-        results = {"PlayerStats": None}
-        player_head = self.get_players_headers()
-        pl_data = self.get_player_data()
-        results["PlayerStats"] = {"headers": player_head, "data": pl_data}
-        return results
+        return {name: load() for name, load in self.get_data_set_loaders().items()}
+
+    def get_data_set_loaders(self):
+        return {
+            "PlayerStats": lambda: {
+                "headers": self.get_players_headers(),
+                "data": self.get_player_data(),
+            }
+        }
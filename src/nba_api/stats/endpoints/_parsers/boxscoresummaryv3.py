@@ -1,5 +1,132 @@
 """Parser(s) for boxscoresummaryv3 endpoint."""
 
+from ._flatten import compile_table, each, fields, items
+
+MEETING_TEAM_FIELDS = (
+    "teamId",
+    "teamCity",
+    "teamName",
+    "teamTricode",
+    "score",
+    "wins",
+    "losses",
+)
+
+OTHER_STATS_FIELDS = (
+    "points",
+    "reboundsTotal",
+    "assists",
+    "steals",
+    "blocks",
+    "turnovers",
+    "fieldGoalsPercentage",
+    "threePointersPercentage",
+    "freeThrowsPercentage",
+    "pointsInThePaint",
+    "pointsSecondChance",
+    "pointsFastBreak",
+    "biggestLead",
+    "leadChanges",
+    "timesTied",
+    "biggestScoringRun",
+    "turnoversTeam",
+    "turnoversTotal",
+    "reboundsTeam",
+    "pointsFromTurnovers",
+    "benchPoints",
+)
+
+GAME_SUMMARY_TABLE = compile_table(
+    "boxScoreSummary",
+    fields(
+        "gameId",
+        "gameCode",
+        "gameStatus",
+        "gameStatusText",
+        "period",
+        "gameClock",
+        "gameTimeUTC",
+        "gameEt",
+        "awayTeamId",
+        "homeTeamId",
+        "duration",
+        "attendance",
+        "sellout",
+    ),
+)
+
+GAME_INFO_TABLE = compile_table(
+    "boxScoreSummary",
+    fields("gameId", "gameEt", "attendance", "duration"),
+)
+
+ARENA_INFO_TABLE = compile_table(
+    "boxScoreSummary",
+    fields("gameId"),
+    fields(
+        "arenaId",
+        "arenaName",
+        "arenaCity",
+        "arenaState",
+        "arenaCountry",
+        "arenaTimezone",
+        path="arena",
+    ),
+)
+
+OFFICIALS_TABLE = compile_table(
+    "boxScoreSummary",
+    fields("gameId"),
+    items("officials"),
+    fields("personId", "name", "nameI", "firstName", "familyName", "jerseyNum"),
+)
+
+INACTIVE_PLAYERS_TABLE = compile_table(
+    "boxScoreSummary",
+    fields("gameId"),
+    each("homeTeam", "awayTeam"),
+    fields("teamId"),
+    items("inactives"),
+    fields("personId", "firstName", "familyName", "jerseyNum"),
+)
+
+LAST_FIVE_MEETINGS_TABLE = compile_table(
+    "boxScoreSummary",
+    items("lastFiveMeetings", "meetings"),
+    fields(
+        "recencyOrder",
+        "gameId",
+        "gameTimeUTC",
+        "gameEt",
+        "gameStatus",
+        "gameStatusText",
+    ),
+    fields(*MEETING_TEAM_FIELDS, path="awayTeam"),
+    fields(*MEETING_TEAM_FIELDS, path="homeTeam"),
+)
+
+OTHER_STATS_TABLE = compile_table(
+    "boxScoreSummary",
+    fields("gameId"),
+    "postgameCharts",
+    each("homeTeam", "awayTeam"),
+    fields("teamId", "teamCity", "teamName", "teamTricode"),
+    fields(*OTHER_STATS_FIELDS, path="statistics"),
+)
+
+AVAILABLE_VIDEO_TABLE = compile_table(
+    "boxScoreSummary",
+    fields(
+        "gameId",
+        "videoAvailableFlag",
+        "ptAvailable",
+        "ptXYZAvailable",
+        "whStatus",
+        "hustleStatus",
+        "historicalStatus",
+    ),
+)
+
 
 class NBAStatsBoxscoreSummaryParserV3:
     """Parser for BoxScoreSummary v3 endpoint.
@@ -39,24 +166,7 @@ class NBAStatsBoxscoreSummaryParserV3:
         Returns:
             list: Single row containing game status, teams, timing, and attendance.
         """
-        summary = self.nba_dict["boxScoreSummary"]
-        return [
-            [
-                summary.get("gameId"),
-                summary.get("gameCode"),
-                summary.get("gameStatus"),
-                summary.get("gameStatusText"),
-                summary.get("period"),
-                summary.get("gameClock"),
-                summary.get("gameTimeUTC"),
-                summary.get("gameEt"),
-                summary.get("awayTeamId"),
-                summary.get("homeTeamId"),
-                summary.get("duration"),
-                summary.get("attendance"),
-                summary.get("sellout"),
-            ]
-        ]
+        return GAME_SUMMARY_TABLE(self.nba_dict)
 
     def get_arena_info_headers(self):
         """Return column headers for the ArenaInfo dataset.
@@ -81,19 +191,7 @@ class NBAStatsBoxscoreSummaryParserV3:
             list: Single row containing arena details. Returns None values
                   if arena object is missing from the response.
         """
-        summary = self.nba_dict["boxScoreSummary"]
-        arena = summary.get("arena", {})
-        return [
-            [
-                summary.get("gameId"),
-                arena.get("arenaId"),
-                arena.get("arenaName"),
-                arena.get("arenaCity"),
-                arena.get("arenaState"),
-                arena.get("arenaCountry"),
-                arena.get("arenaTimezone"),
-            ]
-        ]
+        return ARENA_INFO_TABLE(self.nba_dict)
 
     def get_officials_headers(self):
         """Return column headers for the Officials dataset.
@@ -118,21 +216,7 @@ class NBAStatsBoxscoreSummaryParserV3:
             list: Rows for each official. Returns empty list if officials
                   array is missing from the response.
         """
-        summary = self.nba_dict["boxScoreSummary"]
-        game_id = summary.get("gameId")
-        officials = summary.get("officials", [])
-        return [
-            [
-                game_id,
-                official.get("personId"),
-                official.get("name"),
-                official.get("nameI"),
-                official.get("firstName"),
-                official.get("familyName"),
-                official.get("jerseyNum"),
-            ]
-            for official in officials
-        ]
+        return OFFICIALS_TABLE(self.nba_dict)
 
     def get_line_score_headers(self):
         """Return column headers for the LineScore dataset.
@@ -211,27 +295,7 @@ class NBAStatsBoxscoreSummaryParserV3:
             list: Rows for each inactive player from both teams. Returns empty
                   list if no inactive players or if inactives array is missing.
         """
-        summary = self.nba_dict["boxScoreSummary"]
-        game_id = summary.get("gameId")
-        data = []
-
-        for team_key in ["homeTeam", "awayTeam"]:
-            team = summary.get(team_key, {})
-            team_id = team.get("teamId")
-            inactives = team.get("inactives", [])
-            for inactive in inactives:
-                data.append(
-                    [
-                        game_id,
-                        team_id,
-                        inactive.get("personId"),
-                        inactive.get("firstName"),
-                        inactive.get("familyName"),
-                        inactive.get("jerseyNum"),
-                    ]
-                )
-
-        return data
+        return INACTIVE_PLAYERS_TABLE(self.nba_dict)
 
     def get_last_five_meetings_headers(self):
         """Return column headers for the LastFiveMeetings dataset.
@@ -270,39 +334,7 @@ class NBAStatsBoxscoreSummaryParserV3:
                   ordered by recency. Returns empty list if lastFiveMeetings
                   is missing from the response.
         """
-        summary = self.nba_dict["boxScoreSummary"]
-        meetings = summary.get("lastFiveMeetings", {}).get("meetings", [])
-        data = []
-
-        for meeting in meetings:
-            away_team = meeting.get("awayTeam", {})
-            home_team = meeting.get("homeTeam", {})
-            data.append(
-                [
-                    meeting.get("recencyOrder"),
-                    meeting.get("gameId"),
-                    meeting.get("gameTimeUTC"),
-                    meeting.get("gameEt"),
-                    meeting.get("gameStatus"),
-                    meeting.get("gameStatusText"),
-                    away_team.get("teamId"),
-                    away_team.get("teamCity"),
-                    away_team.get("teamName"),
-                    away_team.get("teamTricode"),
-                    away_team.get("score"),
-                    away_team.get("wins"),
-                    away_team.get("losses"),
-                    home_team.get("teamId"),
-                    home_team.get("teamCity"),
-                    home_team.get("teamName"),
-                    home_team.get("teamTricode"),
-                    home_team.get("score"),
-                    home_team.get("wins"),
-                    home_team.get("losses"),
-                ]
-            )
-
-        return data
+        return LAST_FIVE_MEETINGS_TABLE(self.nba_dict)
 
     def get_available_video_headers(self):
         """Return column headers for the AvailableVideo dataset.
@@ -327,18 +359,7 @@ class NBAStatsBoxscoreSummaryParserV3:
             list: Single row indicating which video types are available
                   for this game.
         """
-        summary = self.nba_dict["boxScoreSummary"]
-        return [
-            [
-                summary.get("gameId"),
-                summary.get("videoAvailableFlag"),
-                summary.get("ptAvailable"),
-                summary.get("ptXYZAvailable"),
-                summary.get("whStatus"),
-                summary.get("hustleStatus"),
-                summary.get("historicalStatus"),
-            ]
-        ]
+        return AVAILABLE_VIDEO_TABLE(self.nba_dict)
 
     def get_game_info_headers(self):
         """Return column headers for the GameInfo dataset.
@@ -354,15 +375,7 @@ class NBAStatsBoxscoreSummaryParserV3:
         Returns:
             list: Single row with game date, attendance, and duration.
         """
-        summary = self.nba_dict["boxScoreSummary"]
-        return [
-            [
-                summary.get("gameId"),
-                summary.get("gameEt"),
-                summary.get("attendance"),
-                summary.get("duration"),
-            ]
-        ]
+        return GAME_INFO_TABLE(self.nba_dict)
 
     def get_other_stats_headers(self):
         """Return column headers for the OtherStats dataset.
@@ -410,51 +423,12 @@ class NBAStatsBoxscoreSummaryParserV3:
             list: Two rows (home and away) with comprehensive game statistics.
                   Returns rows with None values if postgameCharts is missing.
         """
-        summary = self.nba_dict["boxScoreSummary"]
-        game_id = summary.get("gameId")
-        postgame = summary.get("postgameCharts", {})
-        data = []
-
-        for team_key in ["homeTeam", "awayTeam"]:
-            team = postgame.get(team_key, {})
-            stats = team.get("statistics", {})
-            data.append(
-                [
-                    game_id,
-                    team.get("teamId"),
-                    team.get("teamCity"),
-                    team.get("teamName"),
-                    team.get("teamTricode"),
-                    stats.get("points"),
-                    stats.get("reboundsTotal"),
-                    stats.get("assists"),
-                    stats.get("steals"),
-                    stats.get("blocks"),
-                    stats.get("turnovers"),
-                    stats.get("fieldGoalsPercentage"),
-                    stats.get("threePointersPercentage"),
-                    stats.get("freeThrowsPercentage"),
-                    stats.get("pointsInThePaint"),
-                    stats.get("pointsSecondChance"),
-                    stats.get("pointsFastBreak"),
-                    stats.get("biggestLead"),
-                    stats.get("leadChanges"),
-                    stats.get("timesTied"),
-                    stats.get("biggestScoringRun"),
-                    stats.get("turnoversTeam"),
-                    stats.get("turnoversTotal"),
-                    stats.get("reboundsTeam"),
-                    stats.get("pointsFromTurnovers"),
-                    stats.get("benchPoints"),
-                ]
-            )
-
-        return data
+        return OTHER_STATS_TABLE(self.nba_dict)
 
     def get_data_sets(self):
         """Compile all datasets for the BoxScoreSummary endpoint.
 
-        Aggregates data from all getter methods into a dictionary of datasets,
+        Runs every loader from get_data_set_loaders into a dictionary of datasets,
         each containing headers and data in the format expected by the
         Endpoint.DataSet class.
 
@@ -464,53 +438,53 @@ class NBAStatsBoxscoreSummaryParserV3:
                   OtherStats, AvailableVideo). Each dataset contains 'headers'
                   and 'data' keys.
         """
-        results = {
-            "GameSummary": None,
-            "GameInfo": None,
-            "ArenaInfo": None,
-            "Officials": None,
-            "LineScore": None,
-            "InactivePlayers": None,
-            "LastFiveMeetings": None,
-            "OtherStats": None,
-            "AvailableVideo": None,
-        }
+        return {name: load() for name, load in self.get_data_set_loaders().items()}
 
-        results["GameSummary"] = {
-            "headers": self.get_game_summary_headers(),
-            "data": self.get_game_summary_data(),
-        }
-        results["GameInfo"] = {
-            "headers": self.get_game_info_headers(),
-            "data": self.get_game_info_data(),
-        }
-        results["ArenaInfo"] = {
-            "headers": self.get_arena_info_headers(),
-            "data": self.get_arena_info_data(),
-        }
-        results["Officials"] = {
-            "headers": self.get_officials_headers(),
-            "data": self.get_officials_data(),
-        }
-        results["LineScore"] = {
-            "headers": self.get_line_score_headers(),
-            "data": self.get_line_score_data(),
-        }
-        results["InactivePlayers"] = {
-            "headers": self.get_inactive_players_headers(),
-            "data": self.get_inactive_players_data(),
-        }
-        results["LastFiveMeetings"] = {
-            "headers": self.get_last_five_meetings_headers(),
-            "data": self.get_last_five_meetings_data(),
-        }
-        results["OtherStats"] = {
-            "headers": self.get_other_stats_headers(),
-            "data": self.get_other_stats_data(),
-        }
-        results["AvailableVideo"] = {
-            "headers": self.get_available_video_headers(),
-            "data": self.get_available_video_data(),
-        }
+    def get_data_set_loaders(self):
+        """Map each dataset name to a loader that parses only that dataset.
 
-        return results
+        Lets callers that need a single table (e.g. LineScore) skip parsing
+        the other eight.
+
+        Returns:
+            dict: Dataset name mapped to a callable returning a dictionary
+                  with 'headers' and 'data' keys.
+        """
+        return {
+            "GameSummary": lambda: {
+                "headers": self.get_game_summary_headers(),
+                "data": self.get_game_summary_data(),
+            },
+            "GameInfo": lambda: {
+                "headers": self.get_game_info_headers(),
+                "data": self.get_game_info_data(),
+            },
+            "ArenaInfo": lambda: {
+                "headers": self.get_arena_info_headers(),
+                "data": self.get_arena_info_data(),
+            },
+            "Officials": lambda: {
+                "headers": self.get_officials_headers(),
+                "data": self.get_officials_data(),
+            },
+            "LineScore": lambda: {
+                "headers": self.get_line_score_headers(),
+                "data": self.get_line_score_data(),
+            },
+            "InactivePlayers": lambda: {
+                "headers": self.get_inactive_players_headers(),
+                "data": self.get_inactive_players_data(),
+            },
+            "LastFiveMeetings": lambda: {
+                "headers": self.get_last_five_meetings_headers(),
+                "data": self.get_last_five_meetings_data(),
+            },
+            "OtherStats": lambda: {
+                "headers": self.get_other_stats_headers(),
+                "data": self.get_other_stats_data(),
+            },
+            "AvailableVideo": lambda: {
+                "headers": self.get_available_video_headers(),
+                "data": self.get_available_video_data(),
+            },
+        }
@@ -15,6 +15,8 @@ Structure:
     }
 """
 
+from ._flatten import compile_table, each, fields, items, label
+
 # Common metadata fields
 TEAM_METADATA_FIELDS = (
     "teamId",
@@ -83,6 +85,32 @@ STARTER_BENCH_STATS_FIELDS = (
 )
 
 
+TEAM_TABLE = compile_table(
+    fields("gameId"),
+    each("homeTeam", "awayTeam"),
+    fields(*TEAM_METADATA_FIELDS),
+    fields(*TRADITIONAL_STATS_FIELDS, path="statistics"),
+)
+
+PLAYER_TABLE = compile_table(
+    fields("gameId"),
+    each("homeTeam", "awayTeam"),
+    fields(*TEAM_METADATA_FIELDS),
+    items("players"),
+    fields(*PLAYER_METADATA_FIELDS),
+    fields(*TRADITIONAL_STATS_FIELDS, path="statistics"),
+)
+
+START_BENCH_TABLE = compile_table(
+    fields("gameId"),
+    each("homeTeam", "awayTeam"),
+    fields(*TEAM_METADATA_FIELDS),
+    each("starters", "bench", labels=("Starters", "Bench")),
+    fields(*STARTER_BENCH_STATS_FIELDS),
+    label("startersBench"),
+)
+
+
 class NBAStatsBoxscoreTraditionalParserV3:
     """
     Parser for BoxScoreTraditionalV3 endpoint.
@@ -150,24 +178,7 @@ class NBAStatsBoxscoreTraditionalParserV3:
         Returns:
             list: List of two rows [home_team_data, away_team_data]
         """
-        game_id = self.boxscore.get("gameId")
-        data = []
-
-        for team_key in ["homeTeam", "awayTeam"]:
-            team = self.boxscore.get(team_key, {})
-
-            # Team metadata
-            team_metadata = [team.get(field) for field in TEAM_METADATA_FIELDS]
-
-            # Team statistics
-            stats = team.get("statistics", {})
-            team_stats = [stats.get(field) for field in TRADITIONAL_STATS_FIELDS]
-
-            # Combine: gameId + metadata + stats
-            row = [game_id] + team_metadata + team_stats
-            data.append(row)
-
-        return data
+        return TEAM_TABLE(self.boxscore)
 
     def get_player_data(self):
         """
@@ -176,32 +187,7 @@ class NBAStatsBoxscoreTraditionalParserV3:
         Returns:
             list: List of player data rows
         """
-        game_id = self.boxscore.get("gameId")
-        data = []
-
-        for team_key in ["homeTeam", "awayTeam"]:
-            team = self.boxscore.get(team_key, {})
-
-            # Team metadata (same for all players on this team)
-            team_metadata = [team.get(field) for field in TEAM_METADATA_FIELDS]
-
-            # Process each player
-            players = team.get("players", [])
-            for player in players:
-                # Player metadata
-                player_metadata = [
-                    player.get(field) for field in PLAYER_METADATA_FIELDS
-                ]
-
-                # Player statistics
-                stats = player.get("statistics", {})
-                player_stats = [stats.get(field) for field in TRADITIONAL_STATS_FIELDS]
-
-                # Combine: gameId + team_metadata + player_metadata + stats
-                row = [game_id] + team_metadata + player_metadata + player_stats
-                data.append(row)
-
-        return data
+        return PLAYER_TABLE(self.boxscore)
 
     def get_start_bench_data(self):
         """
@@ -210,40 +196,7 @@ class NBAStatsBoxscoreTraditionalParserV3:
         Returns:
             list: List of four rows [home_starters, home_bench, away_starters, away_bench]
         """
-        game_id = self.boxscore.get("gameId")
-        data = []
-
-        for team_key in ["homeTeam", "awayTeam"]:
-            team = self.boxscore.get(team_key, {})
-
-            # Team metadata
-            team_metadata = [team.get(field) for field in TEAM_METADATA_FIELDS]
-
-            # Process starters
-            starters = team.get("starters")
-            if starters is not None:
-                starter_stats = [
-                    starters.get(field) for field in STARTER_BENCH_STATS_FIELDS
-                ]
-            else:
-                starter_stats = [None] * len(STARTER_BENCH_STATS_FIELDS)
-
-            # Combine: gameId + metadata + stats + "Starters" label
-            starter_row = [game_id] + team_metadata + starter_stats + ["Starters"]
-            data.append(starter_row)
-
-            # Process bench
-            bench = team.get("bench")
-            if bench is not None:
-                bench_stats = [bench.get(field) for field in STARTER_BENCH_STATS_FIELDS]
-            else:
-                bench_stats = [None] * len(STARTER_BENCH_STATS_FIELDS)
-
-            # Combine: gameId + metadata + stats + "Bench" label
-            bench_row = [game_id] + team_metadata + bench_stats + ["Bench"]
-            data.append(bench_row)
-
-        return data
+        return START_BENCH_TABLE(self.boxscore)
 
     def get_data_sets(self):
         """
@@ -253,16 +206,26 @@ class NBAStatsBoxscoreTraditionalParserV3:
             dict: Dictionary with PlayerStats, TeamStarterBenchStats, and TeamStats
                   Order matches expected_data in boxscoretraditionalv3.py
         """
+        return {name: load() for name, load in self.get_data_set_loaders().items()}
+
+    def get_data_set_loaders(self):
+        """
+        Return a loader for each dataset, so datasets can be parsed on demand.
+
+        Returns:
+            dict: Dataset name mapped to a callable returning its headers
+                  and data
+        """
         return {
-            "PlayerStats": {
+            "PlayerStats": lambda: {
                 "headers": self.get_player_headers(),
                 "data": self.get_player_data(),
             },
-            "TeamStarterBenchStats": {
+            "TeamStarterBenchStats": lambda: {
                 "headers": self.get_start_bench_headers(),
                 "data": self.get_start_bench_data(),
             },
-            "TeamStats": {
+            "TeamStats": lambda: {
                 "headers": self.get_team_headers(),
                 "data": self.get_team_data(),
             },
@@ -35,8 +35,12 @@ class NBAStatsISTStandingsParser:
         return teams_data
 
     def get_data_sets(self):
-        results = {"Standings": None}
-        iststandings_head = self.get_iststandings_headers()
-        iststandings_data = self.get_iststandings_data()
-        results["Standings"] = {"headers": iststandings_head, "data": iststandings_data}
-        return results
+        return {name: load() for name, load in self.get_data_set_loaders().items()}
+
+    def get_data_set_loaders(self):
+        return {
+            "Standings": lambda: {
+                "headers": self.get_iststandings_headers(),
+                "data": self.get_iststandings_data(),
+            }
+        }
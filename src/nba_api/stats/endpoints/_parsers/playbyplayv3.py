@@ -4,6 +4,40 @@ This parser extracts play-by-play data from the NBA Stats API v3 format,
 which returns nested JSON with game actions and video availability.
 """
 
+from ._flatten import compile_table, fields, items
+
+ACTION_FIELDS = (
+    "actionNumber",
+    "clock",
+    "period",
+    "teamId",
+    "teamTricode",
+    "personId",
+    "playerName",
+    "playerNameI",
+    "xLegacy",
+    "yLegacy",
+    "shotDistance",
+    "shotResult",
+    "isFieldGoal",
+    "scoreHome",
+    "scoreAway",
+    "pointsTotal",
+    "location",
+    "description",
+    "actionType",
+    "subType",
+    "videoAvailable",
+    "shotValue",
+    "actionId",
+)
+
+PLAYBYPLAY_TABLE = compile_table(
+    fields("gameId"),
+    items("actions"),
+    fields(*ACTION_FIELDS),
+)
+
 
 class NBAStatsPlayByPlayParserV3:
     """Parser for PlayByPlayV3 endpoint.
@@ -27,32 +61,7 @@ class NBAStatsPlayByPlayParserV3:
         Returns:
             tuple: Explicitly defined column names for play-by-play actions.
         """
-        return (
-            "gameId",
-            "actionNumber",
-            "clock",
-            "period",
-            "teamId",
-            "teamTricode",
-            "personId",
-            "playerName",
-            "playerNameI",
-            "xLegacy",
-            "yLegacy",
-            "shotDistance",
-            "shotResult",
-            "isFieldGoal",
-            "scoreHome",
-            "scoreAway",
-            "pointsTotal",
-            "location",
-            "description",
-            "actionType",
-            "subType",
-            "videoAvailable",
-            "shotValue",
-            "actionId",
-        )
+        return PLAYBYPLAY_TABLE.headers
 
     def get_playbyplay_data(self):
         """Extract play-by-play actions from the API response.
@@ -61,40 +70,7 @@ class NBAStatsPlayByPlayParserV3:
             list: List of action rows, each starting with gameId followed by
                   all action fields in the order defined by headers.
         """
-        game_id = self.game.get("gameId")
-        actions = self.game.get("actions", [])
-
-        data = []
-        for action in actions:
-            row = [
-                game_id,
-                action.get("actionNumber"),
-                action.get("clock"),
-                action.get("period"),
-                action.get("teamId"),
-                action.get("teamTricode"),
-                action.get("personId"),
-                action.get("playerName"),
-                action.get("playerNameI"),
-                action.get("xLegacy"),
-                action.get("yLegacy"),
-                action.get("shotDistance"),
-                action.get("shotResult"),
-                action.get("isFieldGoal"),
-                action.get("scoreHome"),
-                action.get("scoreAway"),
-                action.get("pointsTotal"),
-                action.get("location"),
-                action.get("description"),
-                action.get("actionType"),
-                action.get("subType"),
-                action.get("videoAvailable"),
-                action.get("shotValue"),
-                action.get("actionId"),
-            ]
-            data.append(row)
-
-        return data
+        return PLAYBYPLAY_TABLE(self.game)
 
     def get_videoavailable_headers(self):
         """Return column headers for the AvailableVideo dataset.
@@ -120,12 +96,21 @@ class NBAStatsPlayByPlayParserV3:
             dict: Dictionary containing PlayByPlay and AvailableVideo datasets,
                   each with 'headers' and 'data' keys.
         """
+        return {name: load() for name, load in self.get_data_set_loaders().items()}
+
+    def get_data_set_loaders(self):
+        """Return a loader for each dataset, so datasets can be parsed on demand.
+
+        Returns:
+            dict: Dataset name mapped to a callable returning its 'headers'
+                  and 'data'.
+        """
         return {
-            "PlayByPlay": {
+            "PlayByPlay": lambda: {
                 "headers": self.get_playbyplay_headers(),
                 "data": self.get_playbyplay_data(),
             },
-            "AvailableVideo": {
+            "AvailableVideo": lambda: {
                 "headers": self.get_videoavailable_headers(),
                 "data": self.get_videoavailable_data(),
             },
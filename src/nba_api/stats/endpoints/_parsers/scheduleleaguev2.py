@@ -6,17 +6,19 @@ class NBAStatsScheduleLeagueV2Parser:
         self.nba_dict = nba_dict
 
     def get_data_sets(self):
-        results = {"SeasonGames": None, "SeasonWeeks": None}
-
-        weeks_head = list(self.get_weeks_headers())
-        weeks_data = self.get_weeks_data()
-        results["SeasonWeeks"] = {"headers": weeks_head, "data": weeks_data}
-
-        games_head = list(self.get_games_headers())
-        games_data = self.get_games_data()
-        results["SeasonGames"] = {"headers": games_head, "data": games_data}
-
-        return results
+        return {name: load() for name, load in self.get_data_set_loaders().items()}
+
+    def get_data_set_loaders(self):
+        return {
+            "SeasonGames": lambda: {
+                "headers": list(self.get_games_headers()),
+                "data": self.get_games_data(),
+            },
+            "SeasonWeeks": lambda: {
+                "headers": list(self.get_weeks_headers()),
+                "data": self.get_weeks_data(),
+            },
+        }
 
     def get_weeks_headers(self):
         weeks = self.nba_dict[list(self.nba_dict.keys())[1]]["weeks"]
@@ -204,17 +206,13 @@ class NBAStatsScheduleLeagueV2IntParser(NBAStatsScheduleLeagueV2Parser):
     def __init__(self, nba_dict):
         super().__init__(nba_dict)
 
-    def get_data_sets(self):
-        results = super().get_data_sets()
-        results["BroadcasterList"] = None
-
-        broadcaster_head = list(self.get_broadcaster_list_headers())
-        broadcaster_data = self.get_broadcaster_list_data()
-        results["BroadcasterList"] = {
-            "headers": broadcaster_head,
-            "data": broadcaster_data,
+    def get_data_set_loaders(self):
+        loaders = super().get_data_set_loaders()
+        loaders["BroadcasterList"] = lambda: {
+            "headers": list(self.get_broadcaster_list_headers()),
+            "data": self.get_broadcaster_list_data(),
         }
-        return results
+        return loaders
 
     def get_broadcaster_list_headers(self):
         tmp = self.nba_dict[list(self.nba_dict.keys())[1]]["broadcasterList"][0]
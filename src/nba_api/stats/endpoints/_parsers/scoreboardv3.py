@@ -1,5 +1,52 @@
 """Parser for scoreboardv3 endpoint."""
 
+from ._flatten import compile_table, each, fields, items
+
+SCOREBOARD_INFO_TABLE = compile_table(fields("gameDate", "leagueId", "leagueName"))
+
+GAME_HEADER_TABLE = compile_table(
+    items("games"),
+    fields(
+        "gameId",
+        "gameCode",
+        "gameStatus",
+        "gameStatusText",
+        "period",
+        "gameClock",
+        "gameTimeUTC",
+        "gameEt",
+        "regulationPeriods",
+        "seriesGameNumber",
+        "gameLabel",
+        "gameSubLabel",
+        "seriesText",
+        "ifNecessary",
+        "seriesConference",
+        "poRoundDesc",
+        "gameSubtype",
+        "isNeutral",
+    ),
+)
+
+LINE_SCORE_TABLE = compile_table(
+    items("games"),
+    fields("gameId"),
+    each("homeTeam", "awayTeam"),
+    fields(
+        "teamId",
+        "teamCity",
+        "teamName",
+        "teamTricode",
+        "teamSlug",
+        "wins",
+        "losses",
+        "score",
+        "seed",
+        "inBonus",
+        "timeoutsRemaining",
+    ),
+)
+
 
 class NBAStatsScoreboardV3Parser:
     """Parser for ScoreboardV3 endpoint data.
@@ -35,11 +82,7 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             List containing one row with scoreboard info
         """
-        return [[
-            self.scoreboard.get("gameDate"),
-            self.scoreboard.get("leagueId"),
-            self.scoreboard.get("leagueName"),
-        ]]
+        return SCOREBOARD_INFO_TABLE(self.scoreboard)
 
     def get_game_header_headers(self):
         """Get headers for game-level information.
@@ -74,32 +117,7 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             List of rows, one for each game
         """
-        games = self.scoreboard.get("games", [])
-        data = []
-
-        for game in games:
-            data.append([
-                game.get("gameId"),
-                game.get("gameCode"),
-                game.get("gameStatus"),
-                game.get("gameStatusText"),
-                game.get("period"),
-                game.get("gameClock"),
-                game.get("gameTimeUTC"),
-                game.get("gameEt"),
-                game.get("regulationPeriods"),
-                game.get("seriesGameNumber"),
-                game.get("gameLabel"),
-                game.get("gameSubLabel"),
-                game.get("seriesText"),
-                game.get("ifNecessary"),
-                game.get("seriesConference"),
-                game.get("poRoundDesc"),
-                game.get("gameSubtype"),
-                game.get("isNeutral"),
-            ])
-
-        return data
+        return GAME_HEADER_TABLE(self.scoreboard)
 
     def get_line_score_headers(self):
         """Get headers for line score information.
@@ -128,47 +146,7 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             List of rows with team scoring information
         """
-        games = self.scoreboard.get("games", [])
-        data = []
-
-        for game in games:
-            game_id = game.get("gameId")
-
-            # Home team
-            home_team = game.get("homeTeam", {})
-            data.append([
-                game_id,
-                home_team.get("teamId"),
-                home_team.get("teamCity"),
-                home_team.get("teamName"),
-                home_team.get("teamTricode"),
-                home_team.get("teamSlug"),
-                home_team.get("wins"),
-                home_team.get("losses"),
-                home_team.get("score"),
-                home_team.get("seed"),
-                home_team.get("inBonus"),
-                home_team.get("timeoutsRemaining"),
-            ])
-
-            # Away team
-            away_team = game.get("awayTeam", {})
-            data.append([
-                game_id,
-                away_team.get("teamId"),
-                away_team.get("teamCity"),
-                away_team.get("teamName"),
-                away_team.get("teamTricode"),
-                away_team.get("teamSlug"),
-                away_team.get("wins"),
-                away_team.get("losses"),
-                away_team.get("score"),
-                away_team.get("seed"),
-                away_team.get("inBonus"),
-                away_team.get("timeoutsRemaining"),
-            ])
-
-        return data
+        return LINE_SCORE_TABLE(self.scoreboard)
 
     def get_game_leaders_headers(self):
         """Get headers for game leaders information.
@@ -381,28 +359,37 @@ class NBAStatsScoreboardV3Parser:
         Returns:
             Dictionary mapping dataset names to their headers and data
         """
+        return {name: load() for name, load in self.get_data_set_loaders().items()}
+
+    def get_data_set_loaders(self):
+        """Return a loader for each dataset, so datasets can be parsed on demand.
+
+        Returns:
+            Dictionary mapping dataset names to callables returning their
+            headers and data
+        """
         return {
-            "ScoreboardInfo": {
+            "ScoreboardInfo": lambda: {
                 "headers": self.get_scoreboard_info_headers(),
                 "data": self.get_scoreboard_info_data(),
             },
-            "GameHeader": {
+            "GameHeader": lambda: {
                 "headers": self.get_game_header_headers(),
                 "data": self.get_game_header_data(),
             },
-            "LineScore": {
+            "LineScore": lambda: {
                 "headers": self.get_line_score_headers(),
                 "data": self.get_line_score_data(),
             },
-            "GameLeaders": {
+            "GameLeaders": lambda: {
                 "headers": self.get_game_leaders_headers(),
                 "data": self.get_game_leaders_data(),
             },
-            "TeamLeaders": {
+            "TeamLeaders": lambda: {
                 "headers": self.get_team_leaders_headers(),
                 "data": self.get_team_leaders_data(),
             },
-            "Broadcasters": {
+            "Broadcasters": lambda: {
                 "headers": self.get_broadcasters_headers(),
                 "data": self.get_broadcasters_data(),
             },
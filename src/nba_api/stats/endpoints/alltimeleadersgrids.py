@@ -26,6 +26,87 @@ class AllTimeLeadersGrids(Endpoint):
         "STLLeaders": ["PLAYER_ID", "PLAYER_NAME", "STL", "STL_RANK"],
         "TOVLeaders": ["PLAYER_ID", "PLAYER_NAME", "TOV", "TOV_RANK"],
     }
+    expected_schema = {
+        "ASTLeaders": {
+            "PLAYER_ID": "int",
+            "AST_RANK": "int",
+        },
+        "BLKLeaders": {
+            "PLAYER_ID": "int",
+            "BLK_RANK": "int",
+        },
+        "DREBLeaders": {
+            "PLAYER_ID": "int",
+            "DREB_RANK": "int",
+        },
+        "FG3ALeaders": {
+            "PLAYER_ID": "int",
+            "FG3A_RANK": "int",
+        },
+        "FG3MLeaders": {
+            "PLAYER_ID": "int",
+            "FG3M_RANK": "int",
+        },
+        "FG3_PCTLeaders": {
+            "PLAYER_ID": "int",
+            "FG3_PCT": "float",
+            "FG3_PCT_RANK": "int",
+        },
+        "FGALeaders": {
+            "PLAYER_ID": "int",
+            "FGA_RANK": "int",
+        },
+        "FGMLeaders": {
+            "PLAYER_ID": "int",
+            "FGM_RANK": "int",
+        },
+        "FG_PCTLeaders": {
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG_PCT_RANK": "int",
+        },
+        "FTALeaders": {
+            "PLAYER_ID": "int",
+            "FTA_RANK": "int",
+        },
+        "FTMLeaders": {
+            "PLAYER_ID": "int",
+            "FTM_RANK": "int",
+        },
+        "FT_PCTLeaders": {
+            "PLAYER_ID": "int",
+            "FT_PCT": "float",
+            "FT_PCT_RANK": "int",
+        },
+        "GPLeaders": {
+            "PLAYER_ID": "int",
+            "GP_RANK": "int",
+        },
+        "OREBLeaders": {
+            "PLAYER_ID": "int",
+            "OREB_RANK": "int",
+        },
+        "PFLeaders": {
+            "PLAYER_ID": "int",
+            "PF_RANK": "int",
+        },
+        "PTSLeaders": {
+            "PLAYER_ID": "int",
+            "PTS_RANK": "int",
+        },
+        "REBLeaders": {
+            "PLAYER_ID": "int",
+            "REB_RANK": "int",
+        },
+        "STLLeaders": {
+            "PLAYER_ID": "int",
+            "STL_RANK": "int",
+        },
+        "TOVLeaders": {
+            "PLAYER_ID": "int",
+            "TOV_RANK": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -68,27 +149,23 @@ class AllTimeLeadersGrids(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.ast_leaders = Endpoint.DataSet(data=data_sets["ASTLeaders"])
-        self.blk_leaders = Endpoint.DataSet(data=data_sets["BLKLeaders"])
-        self.dreb_leaders = Endpoint.DataSet(data=data_sets["DREBLeaders"])
-        self.fg3_a_leaders = Endpoint.DataSet(data=data_sets["FG3ALeaders"])
-        self.fg3_m_leaders = Endpoint.DataSet(data=data_sets["FG3MLeaders"])
-        self.fg3_pct_leaders = Endpoint.DataSet(data=data_sets["FG3_PCTLeaders"])
-        self.fga_leaders = Endpoint.DataSet(data=data_sets["FGALeaders"])
-        self.fgm_leaders = Endpoint.DataSet(data=data_sets["FGMLeaders"])
-        self.fg_pct_leaders = Endpoint.DataSet(data=data_sets["FG_PCTLeaders"])
-        self.fta_leaders = Endpoint.DataSet(data=data_sets["FTALeaders"])
-        self.ftm_leaders = Endpoint.DataSet(data=data_sets["FTMLeaders"])
-        self.ft_pct_leaders = Endpoint.DataSet(data=data_sets["FT_PCTLeaders"])
-        self.g_p_leaders = Endpoint.DataSet(data=data_sets["GPLeaders"])
-        self.oreb_leaders = Endpoint.DataSet(data=data_sets["OREBLeaders"])
-        self.pf_leaders = Endpoint.DataSet(data=data_sets["PFLeaders"])
-        self.pts_leaders = Endpoint.DataSet(data=data_sets["PTSLeaders"])
-        self.reb_leaders = Endpoint.DataSet(data=data_sets["REBLeaders"])
-        self.stl_leaders = Endpoint.DataSet(data=data_sets["STLLeaders"])
-        self.tov_leaders = Endpoint.DataSet(data=data_sets["TOVLeaders"])
+        data_sets = self.load_data_sets()
+        self.ast_leaders = data_sets["ASTLeaders"]
+        self.blk_leaders = data_sets["BLKLeaders"]
+        self.dreb_leaders = data_sets["DREBLeaders"]
+        self.fg3_a_leaders = data_sets["FG3ALeaders"]
+        self.fg3_m_leaders = data_sets["FG3MLeaders"]
+        self.fg3_pct_leaders = data_sets["FG3_PCTLeaders"]
+        self.fga_leaders = data_sets["FGALeaders"]
+        self.fgm_leaders = data_sets["FGMLeaders"]
+        self.fg_pct_leaders = data_sets["FG_PCTLeaders"]
+        self.fta_leaders = data_sets["FTALeaders"]
+        self.ftm_leaders = data_sets["FTMLeaders"]
+        self.ft_pct_leaders = data_sets["FT_PCTLeaders"]
+        self.g_p_leaders = data_sets["GPLeaders"]
+        self.oreb_leaders = data_sets["OREBLeaders"]
+        self.pf_leaders = data_sets["PFLeaders"]
+        self.pts_leaders = data_sets["PTSLeaders"]
+        self.reb_leaders = data_sets["REBLeaders"]
+        self.stl_leaders = data_sets["STLLeaders"]
+        self.tov_leaders = data_sets["TOVLeaders"]
@@ -14,6 +14,14 @@ class AssistLeaders(Endpoint):
     expected_data = {
         "AssistLeaders": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "AST"]
     }
+    expected_schema = {
+        "AssistLeaders": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -58,9 +66,5 @@ class AssistLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assist_leaders = Endpoint.DataSet(data=data_sets["AssistLeaders"])
+        data_sets = self.load_data_sets()
+        self.assist_leaders = data_sets["AssistLeaders"]
@@ -23,6 +23,9 @@ from nba_api.stats.library.parameters import (
 class AssistTracker(Endpoint):
     endpoint = "assisttracker"
     expected_data = {"AssistTracker": ["ASSISTS"]}
+    expected_schema = {
+        "AssistTracker": {},
+    }
 
     nba_response = None
     data_sets = None
@@ -113,9 +116,5 @@ class AssistTracker(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assist_tracker = Endpoint.DataSet(data=data_sets["AssistTracker"])
+        data_sets = self.load_data_sets()
+        self.assist_tracker = data_sets["AssistTracker"]
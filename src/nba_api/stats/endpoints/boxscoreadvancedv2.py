@@ -77,6 +77,64 @@ class BoxScoreAdvancedV2(Endpoint):
             "PIE",
         ],
     }
+    expected_schema = {
+        "PlayerStats": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "PLAYER_ID": "int",
+            "START_POSITION": "category",
+            "E_OFF_RATING": "float",
+            "OFF_RATING": "float",
+            "E_DEF_RATING": "float",
+            "DEF_RATING": "float",
+            "E_NET_RATING": "float",
+            "NET_RATING": "float",
+            "AST_PCT": "float",
+            "AST_RATIO": "float",
+            "OREB_PCT": "float",
+            "DREB_PCT": "float",
+            "REB_PCT": "float",
+            "TM_TOV_PCT": "float",
+            "EFG_PCT": "float",
+            "TS_PCT": "float",
+            "USG_PCT": "float",
+            "E_USG_PCT": "float",
+            "E_PACE": "float",
+            "PACE": "float",
+            "PACE_PER40": "float",
+            "PIE": "float",
+        },
+        "TeamStats": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "E_OFF_RATING": "float",
+            "OFF_RATING": "float",
+            "E_DEF_RATING": "float",
+            "DEF_RATING": "float",
+            "E_NET_RATING": "float",
+            "NET_RATING": "float",
+            "AST_PCT": "float",
+            "AST_RATIO": "float",
+            "OREB_PCT": "float",
+            "DREB_PCT": "float",
+            "REB_PCT": "float",
+            "E_TM_TOV_PCT": "float",
+            "TM_TOV_PCT": "float",
+            "EFG_PCT": "float",
+            "TS_PCT": "float",
+            "USG_PCT": "float",
+            "E_USG_PCT": "float",
+            "E_PACE": "float",
+            "PACE": "float",
+            "PACE_PER40": "float",
+            "PIE": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -123,10 +181,6 @@ class BoxScoreAdvancedV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        data_sets = self.load_data_sets()
+        self.player_stats = data_sets["PlayerStats"]
+        self.team_stats = data_sets["TeamStats"]
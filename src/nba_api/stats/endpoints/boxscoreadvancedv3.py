@@ -84,6 +84,65 @@ class BoxScoreAdvancedV3(Endpoint):
             "PIE",
         ],
     }
+    expected_schema = {
+        "PlayerStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+            "personId": "int",
+            "position": "category",
+            "estimatedOffensiveRating": "float",
+            "offensiveRating": "float",
+            "estimatedDefensiveRating": "float",
+            "defensiveRating": "float",
+            "estimatedNetRating": "float",
+            "netRating": "float",
+            "assistPercentage": "float",
+            "assistRatio": "float",
+            "offensiveReboundPercentage": "float",
+            "defensiveReboundPercentage": "float",
+            "reboundPercentage": "float",
+            "turnoverRatio": "float",
+            "effectiveFieldGoalPercentage": "float",
+            "trueShootingPercentage": "float",
+            "usagePercentage": "float",
+            "estimatedUsagePercentage": "float",
+            "pace": "float",
+            "pacePer40": "float",
+            "PIE": "float",
+        },
+        "TeamStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+            "estimatedOffensiveRating": "float",
+            "offensiveRating": "float",
+            "estimatedDefensiveRating": "float",
+            "defensiveRating": "float",
+            "estimatedNetRating": "float",
+            "netRating": "float",
+            "assistPercentage": "float",
+            "assistRatio": "float",
+            "offensiveReboundPercentage": "float",
+            "defensiveReboundPercentage": "float",
+            "reboundPercentage": "float",
+            "estimatedTeamTurnoverPercentage": "float",
+            "turnoverRatio": "float",
+            "effectiveFieldGoalPercentage": "float",
+            "trueShootingPercentage": "float",
+            "usagePercentage": "float",
+            "estimatedUsagePercentage": "float",
+            "pace": "float",
+            "pacePer40": "float",
+            "PIE": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -130,10 +189,6 @@ class BoxScoreAdvancedV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.player_stats = data_sets["PlayerStats"]
+        self.team_stats = data_sets["TeamStats"]
@@ -48,6 +48,35 @@ class BoxScoreFourFactorsV2(Endpoint):
             "OPP_OREB_PCT",
         ],
     }
+    expected_schema = {
+        "sqlPlayersFourFactors": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "PLAYER_ID": "int",
+            "START_POSITION": "category",
+            "EFG_PCT": "float",
+            "TM_TOV_PCT": "float",
+            "OREB_PCT": "float",
+            "OPP_EFG_PCT": "float",
+            "OPP_TOV_PCT": "float",
+            "OPP_OREB_PCT": "float",
+        },
+        "sqlTeamsFourFactors": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "EFG_PCT": "float",
+            "TM_TOV_PCT": "float",
+            "OREB_PCT": "float",
+            "OPP_EFG_PCT": "float",
+            "OPP_TOV_PCT": "float",
+            "OPP_OREB_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -94,14 +123,6 @@ class BoxScoreFourFactorsV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_four_factors = Endpoint.DataSet(
-            data=data_sets["sqlPlayersFourFactors"]
-        )
-        self.sql_teams_four_factors = Endpoint.DataSet(
-            data=data_sets["sqlTeamsFourFactors"]
-        )
+        data_sets = self.load_data_sets()
+        self.sql_players_four_factors = data_sets["sqlPlayersFourFactors"]
+        self.sql_teams_four_factors = data_sets["sqlTeamsFourFactors"]
@@ -54,6 +54,19 @@ class BoxScoreMatchupsV3(Endpoint):
             "shootingFouls",
         ]
     }
+    expected_schema = {
+        "PlayerStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+            "matchupFieldGoalsPercentage": "float",
+            "matchupThreePointersPercentage": "float",
+            "helpFieldGoalsPercentage": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -81,9 +94,5 @@ class BoxScoreMatchupsV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.player_stats = data_sets["PlayerStats"]
@@ -56,6 +56,23 @@ class BoxScoreMiscV2(Endpoint):
             "PFD",
         ],
     }
+    expected_schema = {
+        "sqlPlayersMisc": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "PLAYER_ID": "int",
+            "START_POSITION": "category",
+        },
+        "sqlTeamsMisc": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -102,10 +119,6 @@ class BoxScoreMiscV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_misc = Endpoint.DataSet(data=data_sets["sqlPlayersMisc"])
-        self.sql_teams_misc = Endpoint.DataSet(data=data_sets["sqlTeamsMisc"])
+        data_sets = self.load_data_sets()
+        self.sql_players_misc = data_sets["sqlPlayersMisc"]
+        self.sql_teams_misc = data_sets["sqlTeamsMisc"]
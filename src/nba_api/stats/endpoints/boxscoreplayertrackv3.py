@@ -71,6 +71,34 @@ class BoxScorePlayerTrackV3(Endpoint):
             "defendedAtRimFieldGoalPercentage",
         ],
     }
+    expected_schema = {
+        "PlayerStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+            "personId": "int",
+            "position": "category",
+            "contestedFieldGoalPercentage": "float",
+            "uncontestedFieldGoalsPercentage": "float",
+            "fieldGoalPercentage": "float",
+            "defendedAtRimFieldGoalPercentage": "float",
+        },
+        "TeamStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+            "contestedFieldGoalPercentage": "float",
+            "uncontestedFieldGoalsPercentage": "float",
+            "fieldGoalPercentage": "float",
+            "defendedAtRimFieldGoalPercentage": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -98,10 +126,6 @@ class BoxScorePlayerTrackV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.player_stats = data_sets["PlayerStats"]
+        self.team_stats = data_sets["TeamStats"]
@@ -62,6 +62,53 @@ class BoxScoreScoringV2(Endpoint):
             "PCT_UAST_FGM",
         ],
     }
+    expected_schema = {
+        "sqlPlayersScoring": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "PLAYER_ID": "int",
+            "START_POSITION": "category",
+            "PCT_FGA_2PT": "float",
+            "PCT_FGA_3PT": "float",
+            "PCT_PTS_2PT": "float",
+            "PCT_PTS_2PT_MR": "float",
+            "PCT_PTS_3PT": "float",
+            "PCT_PTS_FB": "float",
+            "PCT_PTS_FT": "float",
+            "PCT_PTS_OFF_TOV": "float",
+            "PCT_PTS_PAINT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+        },
+        "sqlTeamsScoring": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "PCT_FGA_2PT": "float",
+            "PCT_FGA_3PT": "float",
+            "PCT_PTS_2PT": "float",
+            "PCT_PTS_2PT_MR": "float",
+            "PCT_PTS_3PT": "float",
+            "PCT_PTS_FB": "float",
+            "PCT_PTS_FT": "float",
+            "PCT_PTS_OFF_TOV": "float",
+            "PCT_PTS_PAINT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -108,10 +155,6 @@ class BoxScoreScoringV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_scoring = Endpoint.DataSet(data=data_sets["sqlPlayersScoring"])
-        self.sql_teams_scoring = Endpoint.DataSet(data=data_sets["sqlTeamsScoring"])
+        data_sets = self.load_data_sets()
+        self.sql_players_scoring = data_sets["sqlPlayersScoring"]
+        self.sql_teams_scoring = data_sets["sqlTeamsScoring"]
@@ -117,6 +117,65 @@ class BoxScoreSummaryV2(Endpoint):
             "SERIES_LEADER",
         ],
     }
+    expected_schema = {
+        "AvailableVideo": {
+            "GAME_ID": "str",
+        },
+        "GameInfo": {
+            "GAME_DATE": "date",
+        },
+        "GameSummary": {
+            "GAME_DATE_EST": "date",
+            "GAME_ID": "str",
+            "GAME_STATUS_ID": "int",
+            "GAME_STATUS_TEXT": "category",
+            "HOME_TEAM_ID": "int",
+            "VISITOR_TEAM_ID": "int",
+            "SEASON": "category",
+            "NATL_TV_BROADCASTER_ABBREVIATION": "category",
+        },
+        "InactivePlayers": {
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+        },
+        "LastMeeting": {
+            "GAME_ID": "str",
+            "LAST_GAME_ID": "str",
+            "LAST_GAME_DATE_EST": "date",
+            "LAST_GAME_HOME_TEAM_ID": "int",
+            "LAST_GAME_HOME_TEAM_CITY": "category",
+            "LAST_GAME_HOME_TEAM_NAME": "category",
+            "LAST_GAME_HOME_TEAM_ABBREVIATION": "category",
+            "LAST_GAME_VISITOR_TEAM_ID": "int",
+            "LAST_GAME_VISITOR_TEAM_CITY": "category",
+            "LAST_GAME_VISITOR_TEAM_NAME": "category",
+            "LAST_GAME_VISITOR_TEAM_CITY1": "category",
+        },
+        "LineScore": {
+            "GAME_DATE_EST": "date",
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+        },
+        "Officials": {
+            "OFFICIAL_ID": "int",
+        },
+        "OtherStats": {
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+        },
+        "SeasonSeries": {
+            "GAME_ID": "str",
+            "HOME_TEAM_ID": "int",
+            "VISITOR_TEAM_ID": "int",
+            "GAME_DATE_EST": "date",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -152,17 +211,13 @@ class BoxScoreSummaryV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
-        self.game_summary = Endpoint.DataSet(data=data_sets["GameSummary"])
-        self.inactive_players = Endpoint.DataSet(data=data_sets["InactivePlayers"])
-        self.last_meeting = Endpoint.DataSet(data=data_sets["LastMeeting"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.officials = Endpoint.DataSet(data=data_sets["Officials"])
-        self.other_stats = Endpoint.DataSet(data=data_sets["OtherStats"])
-        self.season_series = Endpoint.DataSet(data=data_sets["SeasonSeries"])
+        data_sets = self.load_data_sets()
+        self.available_video = data_sets["AvailableVideo"]
+        self.game_info = data_sets["GameInfo"]
+        self.game_summary = data_sets["GameSummary"]
+        self.inactive_players = data_sets["InactivePlayers"]
+        self.last_meeting = data_sets["LastMeeting"]
+        self.line_score = data_sets["LineScore"]
+        self.officials = data_sets["Officials"]
+        self.other_stats = data_sets["OtherStats"]
+        self.season_series = data_sets["SeasonSeries"]
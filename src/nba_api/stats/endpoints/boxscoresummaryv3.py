@@ -69,6 +69,64 @@ class BoxScoreSummaryV3(Endpoint):
 
     endpoint = "boxscoresummaryv3"
     expected_data = _EXPECTED_DATA
+    expected_schema = {
+        "GameSummary": {
+            "gameId": "str",
+            "gameStatusText": "category",
+            "awayTeamId": "int",
+            "homeTeamId": "int",
+        },
+        "GameInfo": {
+            "gameId": "str",
+            "gameDate": "date",
+        },
+        "ArenaInfo": {
+            "gameId": "str",
+            "arenaId": "int",
+        },
+        "Officials": {
+            "gameId": "str",
+            "personId": "int",
+        },
+        "LineScore": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+        },
+        "InactivePlayers": {
+            "gameId": "str",
+            "teamId": "int",
+            "personId": "int",
+        },
+        "LastFiveMeetings": {
+            "gameId": "str",
+            "gameStatusText": "category",
+            "awayTeamId": "int",
+            "awayTeamCity": "category",
+            "awayTeamName": "category",
+            "awayTeamTricode": "category",
+            "homeTeamId": "int",
+            "homeTeamCity": "category",
+            "homeTeamName": "category",
+            "homeTeamTricode": "category",
+        },
+        "OtherStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "fieldGoalsPercentage": "float",
+            "threePointersPercentage": "float",
+            "freeThrowsPercentage": "float",
+        },
+        "AvailableVideo": {
+            "gameId": "str",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -140,17 +198,13 @@ class BoxScoreSummaryV3(Endpoint):
         - OtherStats: Advanced game statistics
         - AvailableVideo: Video availability flags
         """
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_summary = Endpoint.DataSet(data=data_sets["GameSummary"])
-        self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
-        self.arena_info = Endpoint.DataSet(data=data_sets["ArenaInfo"])
-        self.officials = Endpoint.DataSet(data=data_sets["Officials"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.inactive_players = Endpoint.DataSet(data=data_sets["InactivePlayers"])
-        self.last_five_meetings = Endpoint.DataSet(data=data_sets["LastFiveMeetings"])
-        self.other_stats = Endpoint.DataSet(data=data_sets["OtherStats"])
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.game_summary = data_sets["GameSummary"]
+        self.game_info = data_sets["GameInfo"]
+        self.arena_info = data_sets["ArenaInfo"]
+        self.officials = data_sets["Officials"]
+        self.line_score = data_sets["LineScore"]
+        self.inactive_players = data_sets["InactivePlayers"]
+        self.last_five_meetings = data_sets["LastFiveMeetings"]
+        self.other_stats = data_sets["OtherStats"]
+        self.available_video = data_sets["AvailableVideo"]
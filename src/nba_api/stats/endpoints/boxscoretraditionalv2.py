@@ -126,6 +126,39 @@ class BoxScoreTraditionalV2(Endpoint):
             "PLUS_MINUS",
         ],
     }
+    expected_schema = {
+        "PlayerStats": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "PLAYER_ID": "int",
+            "START_POSITION": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "TeamStarterBenchStats": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "TeamStats": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -179,13 +212,7 @@ class BoxScoreTraditionalV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
-        self.team_starter_bench_stats = Endpoint.DataSet(
-            data=data_sets["TeamStarterBenchStats"]
-        )
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        data_sets = self.load_data_sets()
+        self.player_stats = data_sets["PlayerStats"]
+        self.team_starter_bench_stats = data_sets["TeamStarterBenchStats"]
+        self.team_stats = data_sets["TeamStats"]
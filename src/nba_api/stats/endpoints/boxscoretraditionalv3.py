@@ -105,6 +105,43 @@ class BoxScoreTraditionalV3(Endpoint):
             "plusMinusPoints",
         ],
     }
+    expected_schema = {
+        "PlayerStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+            "personId": "int",
+            "position": "category",
+            "fieldGoalsPercentage": "float",
+            "threePointersPercentage": "float",
+            "freeThrowsPercentage": "float",
+        },
+        "TeamStarterBenchStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+            "fieldGoalsPercentage": "float",
+            "threePointersPercentage": "float",
+            "freeThrowsPercentage": "float",
+        },
+        "TeamStats": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+            "fieldGoalsPercentage": "float",
+            "threePointersPercentage": "float",
+            "freeThrowsPercentage": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -151,13 +188,7 @@ class BoxScoreTraditionalV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
-        self.team_starter_bench_stats = Endpoint.DataSet(
-            data=data_sets["TeamStarterBenchStats"]
-        )
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.player_stats = data_sets["PlayerStats"]
+        self.team_starter_bench_stats = data_sets["TeamStarterBenchStats"]
+        self.team_stats = data_sets["TeamStats"]
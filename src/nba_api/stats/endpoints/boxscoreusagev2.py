@@ -68,6 +68,59 @@ class BoxScoreUsageV2(Endpoint):
             "PCT_PTS",
         ],
     }
+    expected_schema = {
+        "sqlPlayersUsage": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "PLAYER_ID": "int",
+            "START_POSITION": "category",
+            "USG_PCT": "float",
+            "PCT_FGM": "float",
+            "PCT_FGA": "float",
+            "PCT_FG3M": "float",
+            "PCT_FG3A": "float",
+            "PCT_FTM": "float",
+            "PCT_FTA": "float",
+            "PCT_OREB": "float",
+            "PCT_DREB": "float",
+            "PCT_REB": "float",
+            "PCT_AST": "float",
+            "PCT_TOV": "float",
+            "PCT_STL": "float",
+            "PCT_BLK": "float",
+            "PCT_BLKA": "float",
+            "PCT_PF": "float",
+            "PCT_PFD": "float",
+            "PCT_PTS": "float",
+        },
+        "sqlTeamsUsage": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "USG_PCT": "float",
+            "PCT_FGM": "float",
+            "PCT_FGA": "float",
+            "PCT_FG3M": "float",
+            "PCT_FG3A": "float",
+            "PCT_FTM": "float",
+            "PCT_FTA": "float",
+            "PCT_OREB": "float",
+            "PCT_DREB": "float",
+            "PCT_REB": "float",
+            "PCT_AST": "float",
+            "PCT_TOV": "float",
+            "PCT_STL": "float",
+            "PCT_BLK": "float",
+            "PCT_BLKA": "float",
+            "PCT_PF": "float",
+            "PCT_PFD": "float",
+            "PCT_PTS": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -114,10 +167,6 @@ class BoxScoreUsageV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.sql_players_usage = Endpoint.DataSet(data=data_sets["sqlPlayersUsage"])
-        self.sql_teams_usage = Endpoint.DataSet(data=data_sets["sqlTeamsUsage"])
+        data_sets = self.load_data_sets()
+        self.sql_players_usage = data_sets["sqlPlayersUsage"]
+        self.sql_teams_usage = data_sets["sqlTeamsUsage"]
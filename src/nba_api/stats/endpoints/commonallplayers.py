@@ -25,6 +25,16 @@ class CommonAllPlayers(Endpoint):
             "OTHERLEAGUE_EXPERIENCE_CH",
         ]
     }
+    expected_schema = {
+        "CommonAllPlayers": {
+            "PERSON_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_SLUG": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -65,9 +75,5 @@ class CommonAllPlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.common_all_players = Endpoint.DataSet(data=data_sets["CommonAllPlayers"])
+        data_sets = self.load_data_sets()
+        self.common_all_players = data_sets["CommonAllPlayers"]
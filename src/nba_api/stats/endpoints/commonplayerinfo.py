@@ -50,6 +50,24 @@ class CommonPlayerInfo(Endpoint):
             "PIE",
         ],
     }
+    expected_schema = {
+        "AvailableSeasons": {
+            "SEASON_ID": "category",
+        },
+        "CommonPlayerInfo": {
+            "PERSON_ID": "int",
+            "BIRTHDATE": "date",
+            "POSITION": "category",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+        },
+        "PlayerHeadlineStats": {
+            "PLAYER_ID": "int",
+            "PIE": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -85,13 +103,7 @@ class CommonPlayerInfo(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_seasons = Endpoint.DataSet(data=data_sets["AvailableSeasons"])
-        self.common_player_info = Endpoint.DataSet(data=data_sets["CommonPlayerInfo"])
-        self.player_headline_stats = Endpoint.DataSet(
-            data=data_sets["PlayerHeadlineStats"]
-        )
+        data_sets = self.load_data_sets()
+        self.available_seasons = data_sets["AvailableSeasons"]
+        self.common_player_info = data_sets["CommonPlayerInfo"]
+        self.player_headline_stats = data_sets["PlayerHeadlineStats"]
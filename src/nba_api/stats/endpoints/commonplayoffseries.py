@@ -14,6 +14,14 @@ class CommonPlayoffSeries(Endpoint):
             "GAME_NUM",
         ]
     }
+    expected_schema = {
+        "PlayoffSeries": {
+            "GAME_ID": "str",
+            "HOME_TEAM_ID": "int",
+            "VISITOR_TEAM_ID": "int",
+            "SERIES_ID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -54,9 +62,5 @@ class CommonPlayoffSeries(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.playoff_series = Endpoint.DataSet(data=data_sets["PlayoffSeries"])
+        data_sets = self.load_data_sets()
+        self.playoff_series = data_sets["PlayoffSeries"]
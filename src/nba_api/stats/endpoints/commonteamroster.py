@@ -34,6 +34,22 @@ class CommonTeamRoster(Endpoint):
             "PLAYER_ID",
         ],
     }
+    expected_schema = {
+        "Coaches": {
+            "TEAM_ID": "int",
+            "SEASON": "category",
+            "COACH_ID": "int",
+            "COACH_TYPE": "category",
+        },
+        "CommonTeamRoster": {
+            "TeamID": "int",
+            "SEASON": "category",
+            "LeagueID": "str",
+            "POSITION": "category",
+            "BIRTH_DATE": "date",
+            "PLAYER_ID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -74,13 +90,9 @@ class CommonTeamRoster(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
+        data_sets = self.load_data_sets()
         # Handle cases where Coaches dataset may not be present (#553)
-        self.coaches = Endpoint.DataSet(
-            data=data_sets.get("Coaches", {"headers": self.expected_data["Coaches"], "data": []})
+        self.coaches = data_sets.get("Coaches") or Endpoint.DataSet(
+            data={"headers": self.expected_data["Coaches"], "data": []}
         )
-        self.common_team_roster = Endpoint.DataSet(data=data_sets["CommonTeamRoster"])
+        self.common_team_roster = data_sets["CommonTeamRoster"]
@@ -8,6 +8,13 @@ class CommonTeamYears(Endpoint):
     expected_data = {
         "TeamYears": ["LEAGUE_ID", "TEAM_ID", "MIN_YEAR", "MAX_YEAR", "ABBREVIATION"]
     }
+    expected_schema = {
+        "TeamYears": {
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "ABBREVIATION": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -42,9 +49,5 @@ class CommonTeamYears(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_years = Endpoint.DataSet(data=data_sets["TeamYears"])
+        data_sets = self.load_data_sets()
+        self.team_years = data_sets["TeamYears"]
@@ -87,6 +87,20 @@ class CumeStatsPlayer(Endpoint):
             "PER_MIN_PTS",
         ],
     }
+    expected_schema = {
+        "GameByGameStats": {
+            "DATE_EST": "date",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "TotalPlayerStats": {
+            "PERSON_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -131,10 +145,6 @@ class CumeStatsPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_by_game_stats = Endpoint.DataSet(data=data_sets["GameByGameStats"])
-        self.total_player_stats = Endpoint.DataSet(data=data_sets["TotalPlayerStats"])
+        data_sets = self.load_data_sets()
+        self.game_by_game_stats = data_sets["GameByGameStats"]
+        self.total_player_stats = data_sets["TotalPlayerStats"]
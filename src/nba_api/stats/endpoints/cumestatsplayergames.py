@@ -14,6 +14,12 @@ from nba_api.stats.library.parameters import (
 class CumeStatsPlayerGames(Endpoint):
     endpoint = "cumestatsplayergames"
     expected_data = {"CumeStatsPlayerGames": ["MATCHUP", "GAME_ID"]}
+    expected_schema = {
+        "CumeStatsPlayerGames": {
+            "MATCHUP": "category",
+            "GAME_ID": "str",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -66,11 +72,5 @@ class CumeStatsPlayerGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.cume_stats_player_games = Endpoint.DataSet(
-            data=data_sets["CumeStatsPlayerGames"]
-        )
+        data_sets = self.load_data_sets()
+        self.cume_stats_player_games = data_sets["CumeStatsPlayerGames"]
@@ -96,6 +96,21 @@ class CumeStatsTeam(Endpoint):
             "DQ",
         ],
     }
+    expected_schema = {
+        "GameByGameStats": {
+            "PERSON_ID": "int",
+            "TEAM_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "TotalTeamStats": {
+            "TEAM_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -140,10 +155,6 @@ class CumeStatsTeam(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_by_game_stats = Endpoint.DataSet(data=data_sets["GameByGameStats"])
-        self.total_team_stats = Endpoint.DataSet(data=data_sets["TotalTeamStats"])
+        data_sets = self.load_data_sets()
+        self.game_by_game_stats = data_sets["GameByGameStats"]
+        self.total_team_stats = data_sets["TotalTeamStats"]
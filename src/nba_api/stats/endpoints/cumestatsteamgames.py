@@ -14,6 +14,12 @@ from nba_api.stats.library.parameters import (
 class CumeStatsTeamGames(Endpoint):
     endpoint = "cumestatsteamgames"
     expected_data = {"CumeStatsTeamGames": ["MATCHUP", "GAME_ID"]}
+    expected_schema = {
+        "CumeStatsTeamGames": {
+            "MATCHUP": "category",
+            "GAME_ID": "str",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -68,11 +74,5 @@ class CumeStatsTeamGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.cume_stats_team_games = Endpoint.DataSet(
-            data=data_sets["CumeStatsTeamGames"]
-        )
+        data_sets = self.load_data_sets()
+        self.cume_stats_team_games = data_sets["CumeStatsTeamGames"]
@@ -66,6 +66,65 @@ class DefenseHub(Endpoint):
             "DEF_RIM_PCT",
         ],
     }
+    expected_schema = {
+        "DefenseHubStat1": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "DefenseHubStat10": {},
+        "DefenseHubStat2": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "DefenseHubStat3": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "DefenseHubStat4": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "TM_DEF_RATING": "float",
+        },
+        "DefenseHubStat5": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "DefenseHubStat6": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "DefenseHubStat7": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "DefenseHubStat8": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "DefenseHubStat9": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "DEF_RIM_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -112,18 +171,14 @@ class DefenseHub(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.defense_hub_stat1 = Endpoint.DataSet(data=data_sets["DefenseHubStat1"])
-        self.defense_hub_stat10 = Endpoint.DataSet(data=data_sets["DefenseHubStat10"])
-        self.defense_hub_stat2 = Endpoint.DataSet(data=data_sets["DefenseHubStat2"])
-        self.defense_hub_stat3 = Endpoint.DataSet(data=data_sets["DefenseHubStat3"])
-        self.defense_hub_stat4 = Endpoint.DataSet(data=data_sets["DefenseHubStat4"])
-        self.defense_hub_stat5 = Endpoint.DataSet(data=data_sets["DefenseHubStat5"])
-        self.defense_hub_stat6 = Endpoint.DataSet(data=data_sets["DefenseHubStat6"])
-        self.defense_hub_stat7 = Endpoint.DataSet(data=data_sets["DefenseHubStat7"])
-        self.defense_hub_stat8 = Endpoint.DataSet(data=data_sets["DefenseHubStat8"])
-        self.defense_hub_stat9 = Endpoint.DataSet(data=data_sets["DefenseHubStat9"])
+        data_sets = self.load_data_sets()
+        self.defense_hub_stat1 = data_sets["DefenseHubStat1"]
+        self.defense_hub_stat10 = data_sets["DefenseHubStat10"]
+        self.defense_hub_stat2 = data_sets["DefenseHubStat2"]
+        self.defense_hub_stat3 = data_sets["DefenseHubStat3"]
+        self.defense_hub_stat4 = data_sets["DefenseHubStat4"]
+        self.defense_hub_stat5 = data_sets["DefenseHubStat5"]
+        self.defense_hub_stat6 = data_sets["DefenseHubStat6"]
+        self.defense_hub_stat7 = data_sets["DefenseHubStat7"]
+        self.defense_hub_stat8 = data_sets["DefenseHubStat8"]
+        self.defense_hub_stat9 = data_sets["DefenseHubStat9"]
@@ -27,6 +27,19 @@ class DraftBoard(Endpoint):
             "AGE",
         ]
     }
+    expected_schema = {
+        "DraftBoard": {
+            "PERSON_ID": "int",
+            "SEASON": "category",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "ORGANIZATION_TYPE": "category",
+            "POSITION": "category",
+            "BIRTHDATE": "date",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -77,9 +90,5 @@ class DraftBoard(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_board = Endpoint.DataSet(data=data_sets["DraftBoard"])
+        data_sets = self.load_data_sets()
+        self.draft_board = data_sets["DraftBoard"]
@@ -39,6 +39,21 @@ class DraftCombineNonStationaryShooting(Endpoint):
             "ON_MOVE_COLLEGE_PCT",
         ]
     }
+    expected_schema = {
+        "Results": {
+            "TEMP_PLAYER_ID": "int",
+            "PLAYER_ID": "int",
+            "POSITION": "category",
+            "OFF_DRIB_FIFTEEN_BREAK_LEFT_PCT": "float",
+            "OFF_DRIB_FIFTEEN_TOP_KEY_PCT": "float",
+            "OFF_DRIB_FIFTEEN_BREAK_RIGHT_PCT": "float",
+            "OFF_DRIB_COLLEGE_BREAK_LEFT_PCT": "float",
+            "OFF_DRIB_COLLEGE_TOP_KEY_PCT": "float",
+            "OFF_DRIB_COLLEGE_BREAK_RIGHT_PCT": "float",
+            "ON_MOVE_FIFTEEN_PCT": "float",
+            "ON_MOVE_COLLEGE_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -74,9 +89,5 @@ class DraftCombineNonStationaryShooting(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.results = Endpoint.DataSet(data=data_sets["Results"])
+        data_sets = self.load_data_sets()
+        self.results = data_sets["Results"]
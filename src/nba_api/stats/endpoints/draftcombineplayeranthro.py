@@ -27,6 +27,14 @@ class DraftCombinePlayerAnthro(Endpoint):
             "HAND_WIDTH",
         ]
     }
+    expected_schema = {
+        "Results": {
+            "TEMP_PLAYER_ID": "int",
+            "PLAYER_ID": "int",
+            "POSITION": "category",
+            "BODY_FAT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -62,9 +70,5 @@ class DraftCombinePlayerAnthro(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.results = Endpoint.DataSet(data=data_sets["Results"])
+        data_sets = self.load_data_sets()
+        self.results = data_sets["Results"]
@@ -60,6 +60,28 @@ class DraftCombineSpotShooting(Endpoint):
             "NBA_CORNER_RIGHT_PCT",
         ]
     }
+    expected_schema = {
+        "Results": {
+            "TEMP_PLAYER_ID": "int",
+            "PLAYER_ID": "int",
+            "POSITION": "category",
+            "FIFTEEN_CORNER_LEFT_PCT": "float",
+            "FIFTEEN_BREAK_LEFT_PCT": "float",
+            "FIFTEEN_TOP_KEY_PCT": "float",
+            "FIFTEEN_BREAK_RIGHT_PCT": "float",
+            "FIFTEEN_CORNER_RIGHT_PCT": "float",
+            "COLLEGE_CORNER_LEFT_PCT": "float",
+            "COLLEGE_BREAK_LEFT_PCT": "float",
+            "COLLEGE_TOP_KEY_PCT": "float",
+            "COLLEGE_BREAK_RIGHT_PCT": "float",
+            "COLLEGE_CORNER_RIGHT_PCT": "float",
+            "NBA_CORNER_LEFT_PCT": "float",
+            "NBA_BREAK_LEFT_PCT": "float",
+            "NBA_TOP_KEY_PCT": "float",
+            "NBA_BREAK_RIGHT_PCT": "float",
+            "NBA_CORNER_RIGHT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -95,9 +117,5 @@ class DraftCombineSpotShooting(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.results = Endpoint.DataSet(data=data_sets["Results"])
+        data_sets = self.load_data_sets()
+        self.results = data_sets["Results"]
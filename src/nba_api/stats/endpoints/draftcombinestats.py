@@ -56,6 +56,14 @@ class DraftCombineStats(Endpoint):
             "ON_MOVE_COLLEGE",
         ]
     }
+    expected_schema = {
+        "DraftCombineStats": {
+            "SEASON": "category",
+            "PLAYER_ID": "int",
+            "POSITION": "category",
+            "BODY_FAT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -91,9 +99,5 @@ class DraftCombineStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_combine_stats = Endpoint.DataSet(data=data_sets["DraftCombineStats"])
+        data_sets = self.load_data_sets()
+        self.draft_combine_stats = data_sets["DraftCombineStats"]
@@ -22,6 +22,18 @@ class DraftHistory(Endpoint):
             "ORGANIZATION_TYPE",
         ]
     }
+    expected_schema = {
+        "DraftHistory": {
+            "PERSON_ID": "int",
+            "SEASON": "category",
+            "DRAFT_TYPE": "category",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "ORGANIZATION_TYPE": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -72,9 +84,5 @@ class DraftHistory(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.draft_history = Endpoint.DataSet(data=data_sets["DraftHistory"])
+        data_sets = self.load_data_sets()
+        self.draft_history = data_sets["DraftHistory"]
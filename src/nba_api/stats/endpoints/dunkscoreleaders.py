@@ -62,6 +62,20 @@ class DunkScoreLeaders(Endpoint):
 
     endpoint = "dunkscoreleaders"
     expected_data = _EXPECTED_DATA
+    expected_schema = {
+        "Dunks": {
+            "GAME_ID": "str",
+            "GAME_DATE": "date",
+            "MATCHUP": "category",
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_CITY": "category",
+            "TEAM_ABBREVIATION": "category",
+            "PASSER_ID": "int",
+            "SHOOTER_ID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -140,9 +154,5 @@ class DunkScoreLeaders(Endpoint):
         accessible DataSet object containing all dunk records with detailed
         biomechanics and scoring information.
         """
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.dunks = Endpoint.DataSet(data=data_sets["Dunks"])
+        data_sets = self.load_data_sets()
+        self.dunks = data_sets["Dunks"]
@@ -42,6 +42,16 @@ class FantasyWidget(Endpoint):
             "FT_PCT",
         ]
     }
+    expected_schema = {
+        "FantasyWidgetResult": {
+            "PLAYER_ID": "int",
+            "PLAYER_POSITION": "category",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "FG_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -114,11 +124,5 @@ class FantasyWidget(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.fantasy_widget_result = Endpoint.DataSet(
-            data=data_sets["FantasyWidgetResult"]
-        )
+        data_sets = self.load_data_sets()
+        self.fantasy_widget_result = data_sets["FantasyWidgetResult"]
@@ -41,6 +41,22 @@ class FranchiseHistory(Endpoint):
             "LEAGUE_TITLES",
         ],
     }
+    expected_schema = {
+        "DefunctTeams": {
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "WIN_PCT": "float",
+        },
+        "FranchiseHistory": {
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "WIN_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -75,10 +91,6 @@ class FranchiseHistory(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.defunct_teams = Endpoint.DataSet(data=data_sets["DefunctTeams"])
-        self.franchise_history = Endpoint.DataSet(data=data_sets["FranchiseHistory"])
+        data_sets = self.load_data_sets()
+        self.defunct_teams = data_sets["DefunctTeams"]
+        self.franchise_history = data_sets["FranchiseHistory"]
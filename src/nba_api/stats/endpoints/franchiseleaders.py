@@ -25,6 +25,16 @@ class FranchiseLeaders(Endpoint):
             "STL_PLAYER",
         ]
     }
+    expected_schema = {
+        "FranchiseLeaders": {
+            "TEAM_ID": "int",
+            "PTS_PERSON_ID": "int",
+            "AST_PERSON_ID": "int",
+            "REB_PERSON_ID": "int",
+            "BLK_PERSON_ID": "int",
+            "STL_PERSON_ID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -60,9 +70,5 @@ class FranchiseLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.franchise_leaders = Endpoint.DataSet(data=data_sets["FranchiseLeaders"])
+        data_sets = self.load_data_sets()
+        self.franchise_leaders = data_sets["FranchiseLeaders"]
@@ -39,6 +39,17 @@ class FranchisePlayers(Endpoint):
             "PTS",
         ]
     }
+    expected_schema = {
+        "FranchisePlayers": {
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "PERSON_ID": "int",
+            "SEASON_TYPE": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -81,9 +92,5 @@ class FranchisePlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.franchise_players = Endpoint.DataSet(data=data_sets["FranchisePlayers"])
+        data_sets = self.load_data_sets()
+        self.franchise_players = data_sets["FranchisePlayers"]
@@ -35,6 +35,24 @@ class GameRotation(Endpoint):
             "USG_PCT",
         ],
     }
+    expected_schema = {
+        "AwayTeam": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "PERSON_ID": "int",
+            "USG_PCT": "float",
+        },
+        "HomeTeam": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "PERSON_ID": "int",
+            "USG_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -70,10 +88,6 @@ class GameRotation(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.away_team = Endpoint.DataSet(data=data_sets["AwayTeam"])
-        self.home_team = Endpoint.DataSet(data=data_sets["HomeTeam"])
+        data_sets = self.load_data_sets()
+        self.away_team = data_sets["AwayTeam"]
+        self.home_team = data_sets["HomeTeam"]
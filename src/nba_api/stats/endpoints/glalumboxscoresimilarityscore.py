@@ -13,6 +13,12 @@ class GLAlumBoxScoreSimilarityScore(Endpoint):
             "SIMILARITY_SCORE",
         ]
     }
+    expected_schema = {
+        "GLeagueAlumBoxScoreSimilarityScores": {
+            "PERSON_2_ID": "int",
+            "TEAM_ID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -63,11 +69,5 @@ class GLAlumBoxScoreSimilarityScore(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.g_league_alum_box_score_similarity_scores = Endpoint.DataSet(
-            data=data_sets["GLeagueAlumBoxScoreSimilarityScores"]
-        )
+        data_sets = self.load_data_sets()
+        self.g_league_alum_box_score_similarity_scores = data_sets["GLeagueAlumBoxScoreSimilarityScores"]
@@ -46,6 +46,33 @@ class HomePageLeaders(Endpoint):
             "PTS_PER48",
         ],
     }
+    expected_schema = {
+        "HomePageLeaders": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "EFG_PCT": "float",
+            "TS_PCT": "float",
+        },
+        "LeagueAverage": {
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "EFG_PCT": "float",
+            "TS_PCT": "float",
+        },
+        "LeagueMax": {
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "EFG_PCT": "float",
+            "TS_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -94,11 +121,7 @@ class HomePageLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.home_page_leaders = Endpoint.DataSet(data=data_sets["HomePageLeaders"])
-        self.league_average = Endpoint.DataSet(data=data_sets["LeagueAverage"])
-        self.league_max = Endpoint.DataSet(data=data_sets["LeagueMax"])
+        data_sets = self.load_data_sets()
+        self.home_page_leaders = data_sets["HomePageLeaders"]
+        self.league_average = data_sets["LeagueAverage"]
+        self.league_max = data_sets["LeagueMax"]
@@ -41,6 +41,59 @@ class HomePageV2(Endpoint):
         ],
         "HomePageStat8": ["RANK", "TEAM_ID", "TEAM_ABBREVIATION", "TEAM_NAME", "BLK"],
     }
+    expected_schema = {
+        "HomePageStat1": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "HomePageStat2": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "HomePageStat3": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "HomePageStat4": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "HomePageStat5": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "FG_PCT": "float",
+        },
+        "HomePageStat6": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "FT_PCT": "float",
+        },
+        "HomePageStat7": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "FG3_PCT": "float",
+        },
+        "HomePageStat8": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -89,16 +142,12 @@ class HomePageV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.home_page_stat1 = Endpoint.DataSet(data=data_sets["HomePageStat1"])
-        self.home_page_stat2 = Endpoint.DataSet(data=data_sets["HomePageStat2"])
-        self.home_page_stat3 = Endpoint.DataSet(data=data_sets["HomePageStat3"])
-        self.home_page_stat4 = Endpoint.DataSet(data=data_sets["HomePageStat4"])
-        self.home_page_stat5 = Endpoint.DataSet(data=data_sets["HomePageStat5"])
-        self.home_page_stat6 = Endpoint.DataSet(data=data_sets["HomePageStat6"])
-        self.home_page_stat7 = Endpoint.DataSet(data=data_sets["HomePageStat7"])
-        self.home_page_stat8 = Endpoint.DataSet(data=data_sets["HomePageStat8"])
+        data_sets = self.load_data_sets()
+        self.home_page_stat1 = data_sets["HomePageStat1"]
+        self.home_page_stat2 = data_sets["HomePageStat2"]
+        self.home_page_stat3 = data_sets["HomePageStat3"]
+        self.home_page_stat4 = data_sets["HomePageStat4"]
+        self.home_page_stat5 = data_sets["HomePageStat5"]
+        self.home_page_stat6 = data_sets["HomePageStat6"]
+        self.home_page_stat7 = data_sets["HomePageStat7"]
+        self.home_page_stat8 = data_sets["HomePageStat8"]
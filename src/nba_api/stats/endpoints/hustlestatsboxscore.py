@@ -58,6 +58,26 @@ class HustleStatsBoxScore(Endpoint):
             "BOX_OUTS",
         ],
     }
+    expected_schema = {
+        "HustleStatsAvailable": {
+            "GAME_ID": "str",
+        },
+        "PlayerStats": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+            "PLAYER_ID": "int",
+            "START_POSITION": "category",
+        },
+        "TeamStats": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CITY": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -85,13 +105,7 @@ class HustleStatsBoxScore(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.hustle_stats_available = Endpoint.DataSet(
-            data=data_sets["HustleStatsAvailable"]
-        )
-        self.player_stats = Endpoint.DataSet(data=data_sets["PlayerStats"])
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        data_sets = self.load_data_sets()
+        self.hustle_stats_available = data_sets["HustleStatsAvailable"]
+        self.player_stats = data_sets["PlayerStats"]
+        self.team_stats = data_sets["TeamStats"]
@@ -41,6 +41,20 @@ class InfographicFanDuelPlayer(Endpoint):
             "PLUS_MINUS",
         ]
     }
+    expected_schema = {
+        "FanDuelPlayer": {
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "PLAYER_POSITION": "category",
+            "LOCATION": "category",
+            "USG_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -68,9 +82,5 @@ class InfographicFanDuelPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.fan_duel_player = Endpoint.DataSet(data=data_sets["FanDuelPlayer"])
+        data_sets = self.load_data_sets()
+        self.fan_duel_player = data_sets["FanDuelPlayer"]
@@ -57,6 +57,37 @@ class ISTStandings(Endpoint):
             "outcome4",
         ]
     }
+    expected_schema = {
+        "Standings": {
+            "leagueId": "str",
+            "seasonYear": "category",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamAbbreviation": "category",
+            "teamSlug": "category",
+            "conference": "category",
+            "istWildcardRank": "int",
+            "istGroupRank": "int",
+            "istKnockoutRank": "int",
+            "opponentTeamAbbreviation1": "category",
+            "location1": "category",
+            "gameStatusText1": "category",
+            "outcome1": "category",
+            "opponentTeamAbbreviation2": "category",
+            "location2": "category",
+            "gameStatusText2": "category",
+            "outcome2": "category",
+            "opponentTeamAbbreviation3": "category",
+            "location3": "category",
+            "gameStatusText3": "category",
+            "outcome3": "category",
+            "opponentTeamAbbreviation4": "category",
+            "location4": "category",
+            "gameStatusText4": "category",
+            "outcome4": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -96,9 +127,5 @@ class ISTStandings(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.standings = Endpoint.DataSet(data=data_sets["Standings"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.standings = data_sets["Standings"]
@@ -31,6 +31,32 @@ class LeadersTiles(Endpoint):
             "PTS",
         ],
     }
+    expected_schema = {
+        "AllTimeSeasonHigh": {
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "SEASON_YEAR": "category",
+        },
+        "LastSeasonHigh": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "LeadersTiles": {
+            "RANK": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+        "LowSeasonHigh": {
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "SEASON_YEAR": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -79,14 +105,8 @@ class LeadersTiles(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.all_time_season_high = Endpoint.DataSet(
-            data=data_sets["AllTimeSeasonHigh"]
-        )
-        self.last_season_high = Endpoint.DataSet(data=data_sets["LastSeasonHigh"])
-        self.leaders_tiles = Endpoint.DataSet(data=data_sets["LeadersTiles"])
-        self.low_season_high = Endpoint.DataSet(data=data_sets["LowSeasonHigh"])
+        data_sets = self.load_data_sets()
+        self.all_time_season_high = data_sets["AllTimeSeasonHigh"]
+        self.last_season_high = data_sets["LastSeasonHigh"]
+        self.leaders_tiles = data_sets["LeadersTiles"]
+        self.low_season_high = data_sets["LowSeasonHigh"]
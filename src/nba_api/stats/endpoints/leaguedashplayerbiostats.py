@@ -52,6 +52,19 @@ class LeagueDashPlayerBioStats(Endpoint):
             "AST_PCT",
         ]
     }
+    expected_schema = {
+        "LeagueDashPlayerBioStats": {
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "NET_RATING": "float",
+            "OREB_PCT": "float",
+            "DREB_PCT": "float",
+            "USG_PCT": "float",
+            "TS_PCT": "float",
+            "AST_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -148,11 +161,5 @@ class LeagueDashPlayerBioStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_player_bio_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashPlayerBioStats"]
-        )
+        data_sets = self.load_data_sets()
+        self.league_dash_player_bio_stats = data_sets["LeagueDashPlayerBioStats"]
@@ -80,6 +80,9 @@ class LeagueDashPlayerShotLocations(Endpoint):
             },
         ]
     }
+    expected_schema = {
+        "ShotLocations": {},
+    }
 
     nba_response = None
     data_sets = None
@@ -186,9 +189,5 @@ class LeagueDashPlayerShotLocations(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.shot_locations = Endpoint.DataSet(data=data_sets["ShotLocations"])
+        data_sets = self.load_data_sets()
+        self.shot_locations = data_sets["ShotLocations"]
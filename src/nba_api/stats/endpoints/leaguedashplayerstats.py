@@ -98,6 +98,47 @@ class LeagueDashPlayerStats(Endpoint):
             "CFPARAMS",
         ]
     }
+    expected_schema = {
+        "LeagueDashPlayerStats": {
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -204,11 +245,5 @@ class LeagueDashPlayerStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_player_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashPlayerStats"]
-        )
+        data_sets = self.load_data_sets()
+        self.league_dash_player_stats = data_sets["LeagueDashPlayerStats"]
@@ -41,6 +41,17 @@ class LeagueDashPtDefend(Endpoint):
             "PCT_PLUSMINUS",
         ]
     }
+    expected_schema = {
+        "LeagueDashPTDefend": {
+            "CLOSE_DEF_PERSON_ID": "int",
+            "PLAYER_LAST_TEAM_ID": "int",
+            "PLAYER_LAST_TEAM_ABBREVIATION": "category",
+            "PLAYER_POSITION": "category",
+            "D_FG_PCT": "float",
+            "NORMAL_FG_PCT": "float",
+            "PCT_PLUSMINUS": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -137,11 +148,5 @@ class LeagueDashPtDefend(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_p_tdefend = Endpoint.DataSet(
-            data=data_sets["LeagueDashPTDefend"]
-        )
+        data_sets = self.load_data_sets()
+        self.league_dash_p_tdefend = data_sets["LeagueDashPTDefend"]
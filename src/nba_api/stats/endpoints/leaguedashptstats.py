@@ -42,6 +42,13 @@ class LeagueDashPtStats(Endpoint):
             "AVG_SPEED_DEF",
         ]
     }
+    expected_schema = {
+        "LeagueDashPtStats": {
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -136,11 +143,5 @@ class LeagueDashPtStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_pt_stats = Endpoint.DataSet(
-            data=data_sets["LeagueDashPtStats"]
-        )
+        data_sets = self.load_data_sets()
+        self.league_dash_pt_stats = data_sets["LeagueDashPtStats"]
@@ -35,6 +35,16 @@ class LeagueDashPtTeamDefend(Endpoint):
             "PCT_PLUSMINUS",
         ]
     }
+    expected_schema = {
+        "LeagueDashPtTeamDefend": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "D_FG_PCT": "float",
+            "NORMAL_FG_PCT": "float",
+            "PCT_PLUSMINUS": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -111,11 +121,5 @@ class LeagueDashPtTeamDefend(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_pt_team_defend = Endpoint.DataSet(
-            data=data_sets["LeagueDashPtTeamDefend"]
-        )
+        data_sets = self.load_data_sets()
+        self.league_dash_pt_team_defend = data_sets["LeagueDashPtTeamDefend"]
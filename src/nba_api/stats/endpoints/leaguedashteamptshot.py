@@ -42,6 +42,17 @@ class LeagueDashTeamPtShot(Endpoint):
             "FG3_PCT",
         ]
     }
+    expected_schema = {
+        "LeagueDashPTShots": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "FG_PCT": "float",
+            "EFG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -128,9 +139,5 @@ class LeagueDashTeamPtShot(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_dash_ptshots = Endpoint.DataSet(data=data_sets["LeagueDashPTShots"])
+        data_sets = self.load_data_sets()
+        self.league_dash_ptshots = data_sets["LeagueDashPTShots"]
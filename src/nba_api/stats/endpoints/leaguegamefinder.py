@@ -99,6 +99,21 @@ class LeagueGameFinder(Endpoint):
             "PLUS_MINUS",
         ]
     }
+    expected_schema = {
+        "LeagueGameFinderResults": {
+            "SEASON_ID": "category",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "GAME_ID": "str",
+            "GAME_DATE": "date",
+            "MATCHUP": "category",
+            "WL": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -320,11 +335,5 @@ class LeagueGameFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_game_finder_results = Endpoint.DataSet(
-            data=data_sets["LeagueGameFinderResults"]
-        )
+        data_sets = self.load_data_sets()
+        self.league_game_finder_results = data_sets["LeagueGameFinderResults"]
@@ -51,6 +51,19 @@ class LeagueHustleStatsPlayer(Endpoint):
             "PCT_BOX_OUTS_REB",
         ]
     }
+    expected_schema = {
+        "HustleStatsPlayer": {
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "PCT_LOOSE_BALLS_RECOVERED_OFF": "float",
+            "PCT_LOOSE_BALLS_RECOVERED_DEF": "float",
+            "PCT_BOX_OUTS_OFF": "float",
+            "PCT_BOX_OUTS_DEF": "float",
+            "PCT_BOX_OUTS_TEAM_REB": "float",
+            "PCT_BOX_OUTS_REB": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -135,9 +148,5 @@ class LeagueHustleStatsPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.hustle_stats_player = Endpoint.DataSet(data=data_sets["HustleStatsPlayer"])
+        data_sets = self.load_data_sets()
+        self.hustle_stats_player = data_sets["HustleStatsPlayer"]
@@ -43,6 +43,16 @@ class LeagueHustleStatsTeam(Endpoint):
             "PCT_BOX_OUTS_DEF",
         ]
     }
+    expected_schema = {
+        "HustleStatsTeam": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "PCT_LOOSE_BALLS_RECOVERED_OFF": "float",
+            "PCT_LOOSE_BALLS_RECOVERED_DEF": "float",
+            "PCT_BOX_OUTS_OFF": "float",
+            "PCT_BOX_OUTS_DEF": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -127,9 +137,5 @@ class LeagueHustleStatsTeam(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.hustle_stats_team = Endpoint.DataSet(data=data_sets["HustleStatsTeam"])
+        data_sets = self.load_data_sets()
+        self.hustle_stats_team = data_sets["HustleStatsTeam"]
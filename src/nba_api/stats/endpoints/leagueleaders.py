@@ -43,6 +43,15 @@ class LeagueLeaders(Endpoint):
             "STL_TOV",
         ]
     }
+    expected_schema = {
+        "LeagueLeaders": {
+            "PLAYER_ID": "int",
+            "RANK": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -91,9 +100,5 @@ class LeagueLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_leaders = Endpoint.DataSet(data=data_sets["LeagueLeaders"])
+        data_sets = self.load_data_sets()
+        self.league_leaders = data_sets["LeagueLeaders"]
@@ -54,6 +54,30 @@ class LeagueLineupViz(Endpoint):
             "OPP_TOV_PCT",
         ]
     }
+    expected_schema = {
+        "LeagueLineupViz": {
+            "GROUP_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "OFF_RATING": "float",
+            "DEF_RATING": "float",
+            "NET_RATING": "float",
+            "PACE": "float",
+            "TS_PCT": "float",
+            "TM_AST_PCT": "float",
+            "PCT_FGA_2PT": "float",
+            "PCT_FGA_3PT": "float",
+            "PCT_PTS_2PT_MR": "float",
+            "PCT_PTS_FB": "float",
+            "PCT_PTS_FT": "float",
+            "PCT_PTS_PAINT": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "OPP_FG3_PCT": "float",
+            "OPP_EFG_PCT": "float",
+            "OPP_TOV_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -142,9 +166,5 @@ class LeagueLineupViz(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_lineup_viz = Endpoint.DataSet(data=data_sets["LeagueLineupViz"])
+        data_sets = self.load_data_sets()
+        self.league_lineup_viz = data_sets["LeagueLineupViz"]
@@ -35,6 +35,15 @@ class LeagueSeasonMatchups(Endpoint):
             "SFL",
         ]
     }
+    expected_schema = {
+        "SeasonMatchups": {
+            "SEASON_ID": "category",
+            "OFF_PLAYER_ID": "int",
+            "DEF_PLAYER_ID": "int",
+            "MATCHUP_FG_PCT": "float",
+            "MATCHUP_FG3_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -85,9 +94,5 @@ class LeagueSeasonMatchups(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.season_matchups = Endpoint.DataSet(data=data_sets["SeasonMatchups"])
+        data_sets = self.load_data_sets()
+        self.season_matchups = data_sets["SeasonMatchups"]
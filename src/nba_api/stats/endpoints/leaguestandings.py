@@ -95,6 +95,23 @@ class LeagueStandings(Endpoint):
             "PostAS",
         ]
     }
+    expected_schema = {
+        "Standings": {
+            "LeagueID": "str",
+            "SeasonID": "category",
+            "TeamID": "int",
+            "TeamCity": "category",
+            "TeamName": "category",
+            "Conference": "category",
+            "PlayoffRank": "int",
+            "Division": "category",
+            "DivisionRank": "int",
+            "WinPCT": "float",
+            "LeagueRank": "int",
+            "EliminatedConference": "category",
+            "EliminatedDivision": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -137,9 +154,5 @@ class LeagueStandings(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.standings = Endpoint.DataSet(data=data_sets["Standings"])
+        data_sets = self.load_data_sets()
+        self.standings = data_sets["Standings"]
@@ -129,6 +129,40 @@ class LeagueStandingsV3(Endpoint):
             "Seeding_Game_8_Label",
         ]
     }
+    expected_schema = {
+        "Standings": {
+            "LeagueID": "str",
+            "SeasonID": "category",
+            "TeamID": "int",
+            "TeamCity": "category",
+            "TeamName": "category",
+            "TeamSlug": "category",
+            "Conference": "category",
+            "PlayoffRank": "int",
+            "Division": "category",
+            "DivisionRank": "int",
+            "WinPCT": "float",
+            "LeagueRank": "int",
+            "EliminatedConference": "category",
+            "EliminatedDivision": "category",
+            "Seeding_Game_1_Outcome": "category",
+            "Seeding_Game_2_Outcome": "category",
+            "Seeding_Game_3_Outcome": "category",
+            "Seeding_Game_4_Outcome": "category",
+            "Seeding_Game_5_Outcome": "category",
+            "Seeding_Game_6_Outcome": "category",
+            "Seeding_Game_7_Outcome": "category",
+            "Seeding_Game_8_Outcome": "category",
+            "Seeding_Game_1_ID": "str",
+            "Seeding_Game_2_ID": "str",
+            "Seeding_Game_3_ID": "str",
+            "Seeding_Game_4_ID": "str",
+            "Seeding_Game_5_ID": "str",
+            "Seeding_Game_6_ID": "str",
+            "Seeding_Game_7_ID": "str",
+            "Seeding_Game_8_ID": "str",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -171,9 +205,5 @@ class LeagueStandingsV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.standings = Endpoint.DataSet(data=data_sets["Standings"])
+        data_sets = self.load_data_sets()
+        self.standings = data_sets["Standings"]
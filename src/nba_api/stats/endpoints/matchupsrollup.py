@@ -31,6 +31,15 @@ class MatchupsRollup(Endpoint):
             "SFL",
         ]
     }
+    expected_schema = {
+        "MatchupsRollup": {
+            "SEASON_ID": "category",
+            "POSITION": "category",
+            "DEF_PLAYER_ID": "int",
+            "MATCHUP_FG_PCT": "float",
+            "MATCHUP_FG3_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -81,9 +90,5 @@ class MatchupsRollup(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.matchups_rollup = Endpoint.DataSet(data=data_sets["MatchupsRollup"])
+        data_sets = self.load_data_sets()
+        self.matchups_rollup = data_sets["MatchupsRollup"]
@@ -22,6 +22,14 @@ class PlayByPlay(Endpoint):
             "SCOREMARGIN",
         ],
     }
+    expected_schema = {
+        "AvailableVideo": {},
+        "PlayByPlay": {
+            "GAME_ID": "str",
+            "EVENTMSGTYPE": "category",
+            "EVENTMSGACTIONTYPE": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -62,10 +70,6 @@ class PlayByPlay(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.play_by_play = Endpoint.DataSet(data=data_sets["PlayByPlay"])
+        data_sets = self.load_data_sets()
+        self.available_video = data_sets["AvailableVideo"]
+        self.play_by_play = data_sets["PlayByPlay"]
@@ -44,6 +44,29 @@ class PlayByPlayV2(Endpoint):
             "VIDEO_AVAILABLE_FLAG",
         ],
     }
+    expected_schema = {
+        "AvailableVideo": {},
+        "PlayByPlay": {
+            "GAME_ID": "str",
+            "EVENTMSGTYPE": "category",
+            "EVENTMSGACTIONTYPE": "category",
+            "PERSON1TYPE": "category",
+            "PLAYER1_ID": "int",
+            "PLAYER1_TEAM_ID": "int",
+            "PLAYER1_TEAM_CITY": "category",
+            "PLAYER1_TEAM_ABBREVIATION": "category",
+            "PERSON2TYPE": "category",
+            "PLAYER2_ID": "int",
+            "PLAYER2_TEAM_ID": "int",
+            "PLAYER2_TEAM_CITY": "category",
+            "PLAYER2_TEAM_ABBREVIATION": "category",
+            "PERSON3TYPE": "category",
+            "PLAYER3_ID": "int",
+            "PLAYER3_TEAM_ID": "int",
+            "PLAYER3_TEAM_CITY": "category",
+            "PLAYER3_TEAM_ABBREVIATION": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -84,10 +107,6 @@ class PlayByPlayV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.play_by_play = Endpoint.DataSet(data=data_sets["PlayByPlay"])
+        data_sets = self.load_data_sets()
+        self.available_video = data_sets["AvailableVideo"]
+        self.play_by_play = data_sets["PlayByPlay"]
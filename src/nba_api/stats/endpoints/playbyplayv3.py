@@ -33,6 +33,19 @@ class PlayByPlayV3(Endpoint):
             "actionId",
         ],
     }
+    expected_schema = {
+        "AvailableVideo": {},
+        "PlayByPlay": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamTricode": "category",
+            "personId": "int",
+            "location": "category",
+            "actionType": "category",
+            "subType": "category",
+            "actionId": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -73,10 +86,6 @@ class PlayByPlayV3(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_video = Endpoint.DataSet(data=data_sets["AvailableVideo"])
-        self.play_by_play = Endpoint.DataSet(data=data_sets["PlayByPlay"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.available_video = data_sets["AvailableVideo"]
+        self.play_by_play = data_sets["PlayByPlay"]
@@ -22,6 +22,17 @@ class PlayerAwards(Endpoint):
             "SUBTYPE3",
         ]
     }
+    expected_schema = {
+        "PlayerAwards": {
+            "PERSON_ID": "int",
+            "SEASON": "category",
+            "CONFERENCE": "category",
+            "TYPE": "category",
+            "SUBTYPE1": "category",
+            "SUBTYPE2": "category",
+            "SUBTYPE3": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -51,9 +62,5 @@ class PlayerAwards(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_awards = Endpoint.DataSet(data=data_sets["PlayerAwards"])
+        data_sets = self.load_data_sets()
+        self.player_awards = data_sets["PlayerAwards"]
@@ -37,6 +37,14 @@ class PlayerCareerByCollege(Endpoint):
             "PTS",
         ]
     }
+    expected_schema = {
+        "PlayerCareerByCollege": {
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -81,11 +89,5 @@ class PlayerCareerByCollege(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_career_by_college = Endpoint.DataSet(
-            data=data_sets["PlayerCareerByCollege"]
-        )
+        data_sets = self.load_data_sets()
+        self.player_career_by_college = data_sets["PlayerCareerByCollege"]
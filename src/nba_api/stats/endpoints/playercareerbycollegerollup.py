@@ -116,6 +116,28 @@ class PlayerCareerByCollegeRollup(Endpoint):
             "PTS",
         ],
     }
+    expected_schema = {
+        "East": {
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "Midwest": {
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "South": {
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "West": {
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -158,12 +180,8 @@ class PlayerCareerByCollegeRollup(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.east = Endpoint.DataSet(data=data_sets["East"])
-        self.midwest = Endpoint.DataSet(data=data_sets["Midwest"])
-        self.south = Endpoint.DataSet(data=data_sets["South"])
-        self.west = Endpoint.DataSet(data=data_sets["West"])
+        data_sets = self.load_data_sets()
+        self.east = data_sets["East"]
+        self.midwest = data_sets["Midwest"]
+        self.south = data_sets["South"]
+        self.west = data_sets["West"]
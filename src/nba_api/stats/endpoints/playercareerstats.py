@@ -285,6 +285,131 @@ class PlayerCareerStats(Endpoint):
             "PTS",
         ],
     }
+    expected_schema = {
+        "CareerTotalsAllStarSeason": {
+            "PLAYER_ID": "int",
+            "LEAGUE_ID": "str",
+            "Team_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "CareerTotalsCollegeSeason": {
+            "PLAYER_ID": "int",
+            "LEAGUE_ID": "str",
+            "ORGANIZATION_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "CareerTotalsPostSeason": {
+            "PLAYER_ID": "int",
+            "LEAGUE_ID": "str",
+            "Team_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "CareerTotalsRegularSeason": {
+            "PLAYER_ID": "int",
+            "LEAGUE_ID": "str",
+            "Team_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "SeasonRankingsPostSeason": {
+            "PLAYER_ID": "int",
+            "SEASON_ID": "category",
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "RANK_MIN": "int",
+            "RANK_FGM": "int",
+            "RANK_FGA": "int",
+            "RANK_FG_PCT": "int",
+            "RANK_FG3M": "int",
+            "RANK_FG3A": "int",
+            "RANK_FG3_PCT": "int",
+            "RANK_FTM": "int",
+            "RANK_FTA": "int",
+            "RANK_FT_PCT": "int",
+            "RANK_OREB": "int",
+            "RANK_DREB": "int",
+            "RANK_REB": "int",
+            "RANK_AST": "int",
+            "RANK_STL": "int",
+            "RANK_BLK": "int",
+            "RANK_TOV": "int",
+            "RANK_PTS": "int",
+            "RANK_EFF": "int",
+        },
+        "SeasonRankingsRegularSeason": {
+            "PLAYER_ID": "int",
+            "SEASON_ID": "category",
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "RANK_MIN": "int",
+            "RANK_FGM": "int",
+            "RANK_FGA": "int",
+            "RANK_FG_PCT": "int",
+            "RANK_FG3M": "int",
+            "RANK_FG3A": "int",
+            "RANK_FG3_PCT": "int",
+            "RANK_FTM": "int",
+            "RANK_FTA": "int",
+            "RANK_FT_PCT": "int",
+            "RANK_OREB": "int",
+            "RANK_DREB": "int",
+            "RANK_REB": "int",
+            "RANK_AST": "int",
+            "RANK_STL": "int",
+            "RANK_BLK": "int",
+            "RANK_TOV": "int",
+            "RANK_PTS": "int",
+            "RANK_EFF": "int",
+        },
+        "SeasonTotalsAllStarSeason": {
+            "PLAYER_ID": "int",
+            "SEASON_ID": "category",
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "SeasonTotalsCollegeSeason": {
+            "PLAYER_ID": "int",
+            "SEASON_ID": "category",
+            "LEAGUE_ID": "str",
+            "ORGANIZATION_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "SeasonTotalsPostSeason": {
+            "PLAYER_ID": "int",
+            "SEASON_ID": "category",
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "SeasonTotalsRegularSeason": {
+            "PLAYER_ID": "int",
+            "SEASON_ID": "category",
+            "LEAGUE_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -325,38 +450,14 @@ class PlayerCareerStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.career_totals_all_star_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsAllStarSeason"]
-        )
-        self.career_totals_college_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsCollegeSeason"]
-        )
-        self.career_totals_post_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsPostSeason"]
-        )
-        self.career_totals_regular_season = Endpoint.DataSet(
-            data=data_sets["CareerTotalsRegularSeason"]
-        )
-        self.season_rankings_post_season = Endpoint.DataSet(
-            data=data_sets["SeasonRankingsPostSeason"]
-        )
-        self.season_rankings_regular_season = Endpoint.DataSet(
-            data=data_sets["SeasonRankingsRegularSeason"]
-        )
-        self.season_totals_all_star_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsAllStarSeason"]
-        )
-        self.season_totals_college_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsCollegeSeason"]
-        )
-        self.season_totals_post_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsPostSeason"]
-        )
-        self.season_totals_regular_season = Endpoint.DataSet(
-            data=data_sets["SeasonTotalsRegularSeason"]
-        )
+        data_sets = self.load_data_sets()
+        self.career_totals_all_star_season = data_sets["CareerTotalsAllStarSeason"]
+        self.career_totals_college_season = data_sets["CareerTotalsCollegeSeason"]
+        self.career_totals_post_season = data_sets["CareerTotalsPostSeason"]
+        self.career_totals_regular_season = data_sets["CareerTotalsRegularSeason"]
+        self.season_rankings_post_season = data_sets["SeasonRankingsPostSeason"]
+        self.season_rankings_regular_season = data_sets["SeasonRankingsRegularSeason"]
+        self.season_totals_all_star_season = data_sets["SeasonTotalsAllStarSeason"]
+        self.season_totals_college_season = data_sets["SeasonTotalsCollegeSeason"]
+        self.season_totals_post_season = data_sets["SeasonTotalsPostSeason"]
+        self.season_totals_regular_season = data_sets["SeasonTotalsRegularSeason"]
@@ -79,6 +79,20 @@ class PlayerCompare(Endpoint):
             "PLUS_MINUS",
         ],
     }
+    expected_schema = {
+        "Individual": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "OverallCompare": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -163,10 +177,6 @@ class PlayerCompare(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.individual = Endpoint.DataSet(data=data_sets["Individual"])
-        self.overall_compare = Endpoint.DataSet(data=data_sets["OverallCompare"])
+        data_sets = self.load_data_sets()
+        self.individual = data_sets["Individual"]
+        self.overall_compare = data_sets["OverallCompare"]
@@ -730,6 +730,415 @@ class PlayerDashboardByClutch(Endpoint):
             "CFPARAMS",
         ],
     }
+    expected_schema = {
+        "Last10Sec3Point2PlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last10Sec3PointPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last1Min5PointPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last1MinPlusMinus5PointPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last30Sec3Point2PlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last30Sec3PointPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last3Min5PointPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last3MinPlusMinus5PointPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last5Min5PointPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "Last5MinPlusMinus5PointPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+        "OverallPlayerDashboard": {
+            "GROUP_SET": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+            "NBA_FANTASY_PTS_RANK": "int",
+            "DD2_RANK": "int",
+            "TD3_RANK": "int",
+            "CFID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -810,41 +1219,15 @@ class PlayerDashboardByClutch(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.last10_sec3_point2_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last10Sec3Point2PlayerDashboard"]
-        )
-        self.last10_sec3_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last10Sec3PointPlayerDashboard"]
-        )
-        self.last1_min5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last1Min5PointPlayerDashboard"]
-        )
-        self.last1_min_plus_minus5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last1MinPlusMinus5PointPlayerDashboard"]
-        )
-        self.last30_sec3_point2_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last30Sec3Point2PlayerDashboard"]
-        )
-        self.last30_sec3_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last30Sec3PointPlayerDashboard"]
-        )
-        self.last3_min5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last3Min5PointPlayerDashboard"]
-        )
-        self.last3_min_plus_minus5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last3MinPlusMinus5PointPlayerDashboard"]
-        )
-        self.last5_min5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last5Min5PointPlayerDashboard"]
-        )
-        self.last5_min_plus_minus5_point_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Last5MinPlusMinus5PointPlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
+        data_sets = self.load_data_sets()
+        self.last10_sec3_point2_player_dashboard = data_sets["Last10Sec3Point2PlayerDashboard"]
+        self.last10_sec3_point_player_dashboard = data_sets["Last10Sec3PointPlayerDashboard"]
+        self.last1_min5_point_player_dashboard = data_sets["Last1Min5PointPlayerDashboard"]
+        self.last1_min_plus_minus5_point_player_dashboard = data_sets["Last1MinPlusMinus5PointPlayerDashboard"]
+        self.last30_sec3_point2_player_dashboard = data_sets["Last30Sec3Point2PlayerDashboard"]
+        self.last30_sec3_point_player_dashboard = data_sets["Last30Sec3PointPlayerDashboard"]
+        self.last3_min5_point_player_dashboard = data_sets["Last3Min5PointPlayerDashboard"]
+        self.last3_min_plus_minus5_point_player_dashboard = data_sets["Last3MinPlusMinus5PointPlayerDashboard"]
+        self.last5_min5_point_player_dashboard = data_sets["Last5Min5PointPlayerDashboard"]
+        self.last5_min_plus_minus5_point_player_dashboard = data_sets["Last5MinPlusMinus5PointPlayerDashboard"]
+        self.overall_player_dashboard = data_sets["OverallPlayerDashboard"]
@@ -285,6 +285,211 @@ class PlayerDashboardByShootingSplits(Endpoint):
             "CFPARAMS",
         ],
     }
+    expected_schema = {
+        "AssistedBy": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "AssitedShotPlayerDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "OverallPlayerDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "Shot5FTPlayerDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "Shot8FTPlayerDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "ShotAreaPlayerDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "ShotTypePlayerDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "ShotTypeSummaryPlayerDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "CFID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -365,30 +570,12 @@ class PlayerDashboardByShootingSplits(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assisted_by = Endpoint.DataSet(data=data_sets["AssistedBy"])
-        self.assited_shot_player_dashboard = Endpoint.DataSet(
-            data=data_sets["AssitedShotPlayerDashboard"]
-        )
-        self.overall_player_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallPlayerDashboard"]
-        )
-        self.shot5_ft_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Shot5FTPlayerDashboard"]
-        )
-        self.shot8_ft_player_dashboard = Endpoint.DataSet(
-            data=data_sets["Shot8FTPlayerDashboard"]
-        )
-        self.shot_area_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotAreaPlayerDashboard"]
-        )
-        self.shot_type_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotTypePlayerDashboard"]
-        )
-        self.shot_type_summary_player_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotTypeSummaryPlayerDashboard"]
-        )
+        data_sets = self.load_data_sets()
+        self.assisted_by = data_sets["AssistedBy"]
+        self.assited_shot_player_dashboard = data_sets["AssitedShotPlayerDashboard"]
+        self.overall_player_dashboard = data_sets["OverallPlayerDashboard"]
+        self.shot5_ft_player_dashboard = data_sets["Shot5FTPlayerDashboard"]
+        self.shot8_ft_player_dashboard = data_sets["Shot8FTPlayerDashboard"]
+        self.shot_area_player_dashboard = data_sets["ShotAreaPlayerDashboard"]
+        self.shot_type_player_dashboard = data_sets["ShotTypePlayerDashboard"]
+        self.shot_type_summary_player_dashboard = data_sets["ShotTypeSummaryPlayerDashboard"]
@@ -65,6 +65,30 @@ class PlayerDashPtPass(Endpoint):
             "FG3_PCT",
         ],
     }
+    expected_schema = {
+        "PassesMade": {
+            "PLAYER_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "PASS_TYPE": "category",
+            "PASS_TEAMMATE_PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "PassesReceived": {
+            "PLAYER_ID": "int",
+            "TEAM_NAME": "category",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "PASS_TYPE": "category",
+            "PASS_TEAMMATE_PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -131,10 +155,6 @@ class PlayerDashPtPass(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.passes_made = Endpoint.DataSet(data=data_sets["PassesMade"])
-        self.passes_received = Endpoint.DataSet(data=data_sets["PassesReceived"])
+        data_sets = self.load_data_sets()
+        self.passes_made = data_sets["PassesMade"]
+        self.passes_received = data_sets["PassesReceived"]
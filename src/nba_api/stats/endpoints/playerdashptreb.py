@@ -115,6 +115,33 @@ class PlayerDashPtReb(Endpoint):
             "UC_REB_PCT",
         ],
     }
+    expected_schema = {
+        "NumContestedRebounding": {
+            "PLAYER_ID": "int",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+        "OverallRebounding": {
+            "PLAYER_ID": "int",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+        "RebDistanceRebounding": {
+            "PLAYER_ID": "int",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+        "ShotDistanceRebounding": {
+            "PLAYER_ID": "int",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+        "ShotTypeRebounding": {
+            "PLAYER_ID": "int",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -185,21 +212,9 @@ class PlayerDashPtReb(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.num_contested_rebounding = Endpoint.DataSet(
-            data=data_sets["NumContestedRebounding"]
-        )
-        self.overall_rebounding = Endpoint.DataSet(data=data_sets["OverallRebounding"])
-        self.reb_distance_rebounding = Endpoint.DataSet(
-            data=data_sets["RebDistanceRebounding"]
-        )
-        self.shot_distance_rebounding = Endpoint.DataSet(
-            data=data_sets["ShotDistanceRebounding"]
-        )
-        self.shot_type_rebounding = Endpoint.DataSet(
-            data=data_sets["ShotTypeRebounding"]
-        )
+        data_sets = self.load_data_sets()
+        self.num_contested_rebounding = data_sets["NumContestedRebounding"]
+        self.overall_rebounding = data_sets["OverallRebounding"]
+        self.reb_distance_rebounding = data_sets["RebDistanceRebounding"]
+        self.shot_distance_rebounding = data_sets["ShotDistanceRebounding"]
+        self.shot_type_rebounding = data_sets["ShotTypeRebounding"]
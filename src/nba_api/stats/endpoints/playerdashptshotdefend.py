@@ -33,6 +33,14 @@ class PlayerDashPtShotDefend(Endpoint):
             "PCT_PLUSMINUS",
         ]
     }
+    expected_schema = {
+        "DefendingShots": {
+            "CLOSE_DEF_PERSON_ID": "int",
+            "D_FG_PCT": "float",
+            "NORMAL_FG_PCT": "float",
+            "PCT_PLUSMINUS": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -103,9 +111,5 @@ class PlayerDashPtShotDefend(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.defending_shots = Endpoint.DataSet(data=data_sets["DefendingShots"])
+        data_sets = self.load_data_sets()
+        self.defending_shots = data_sets["DefendingShots"]
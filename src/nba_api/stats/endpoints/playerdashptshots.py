@@ -168,6 +168,59 @@ class PlayerDashPtShots(Endpoint):
             "FG3_PCT",
         ],
     }
+    expected_schema = {
+        "ClosestDefender10ftPlusShooting": {
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "EFG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "ClosestDefenderShooting": {
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "EFG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "DribbleShooting": {
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "EFG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "GeneralShooting": {
+            "PLAYER_ID": "int",
+            "SHOT_TYPE": "category",
+            "FG_PCT": "float",
+            "EFG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "Overall": {
+            "PLAYER_ID": "int",
+            "SHOT_TYPE": "category",
+            "FG_PCT": "float",
+            "EFG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "ShotClockShooting": {
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "EFG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "TouchTimeShooting": {
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "EFG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -238,19 +291,11 @@ class PlayerDashPtShots(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.closest_defender10ft_plus_shooting = Endpoint.DataSet(
-            data=data_sets["ClosestDefender10ftPlusShooting"]
-        )
-        self.closest_defender_shooting = Endpoint.DataSet(
-            data=data_sets["ClosestDefenderShooting"]
-        )
-        self.dribble_shooting = Endpoint.DataSet(data=data_sets["DribbleShooting"])
-        self.general_shooting = Endpoint.DataSet(data=data_sets["GeneralShooting"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
-        self.shot_clock_shooting = Endpoint.DataSet(data=data_sets["ShotClockShooting"])
-        self.touch_time_shooting = Endpoint.DataSet(data=data_sets["TouchTimeShooting"])
+        data_sets = self.load_data_sets()
+        self.closest_defender10ft_plus_shooting = data_sets["ClosestDefender10ftPlusShooting"]
+        self.closest_defender_shooting = data_sets["ClosestDefenderShooting"]
+        self.dribble_shooting = data_sets["DribbleShooting"]
+        self.general_shooting = data_sets["GeneralShooting"]
+        self.overall = data_sets["Overall"]
+        self.shot_clock_shooting = data_sets["ShotClockShooting"]
+        self.touch_time_shooting = data_sets["TouchTimeShooting"]
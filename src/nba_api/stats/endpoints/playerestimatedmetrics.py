@@ -41,6 +41,37 @@ class PlayerEstimatedMetrics(Endpoint):
             "E_PACE_RANK",
         ]
     }
+    expected_schema = {
+        "PlayerEstimatedMetrics": {
+            "PLAYER_ID": "int",
+            "W_PCT": "float",
+            "E_OFF_RATING": "float",
+            "E_DEF_RATING": "float",
+            "E_NET_RATING": "float",
+            "E_AST_RATIO": "float",
+            "E_OREB_PCT": "float",
+            "E_DREB_PCT": "float",
+            "E_REB_PCT": "float",
+            "E_TOV_PCT": "float",
+            "E_USG_PCT": "float",
+            "E_PACE": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "E_OFF_RATING_RANK": "int",
+            "E_DEF_RATING_RANK": "int",
+            "E_NET_RATING_RANK": "int",
+            "E_AST_RATIO_RANK": "int",
+            "E_OREB_PCT_RANK": "int",
+            "E_DREB_PCT_RANK": "int",
+            "E_REB_PCT_RANK": "int",
+            "E_TOV_PCT_RANK": "int",
+            "E_USG_PCT_RANK": "int",
+            "E_PACE_RANK": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -81,11 +112,5 @@ class PlayerEstimatedMetrics(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_estimated_metrics = Endpoint.DataSet(
-            data=data_sets["PlayerEstimatedMetrics"]
-        )
+        data_sets = self.load_data_sets()
+        self.player_estimated_metrics = data_sets["PlayerEstimatedMetrics"]
@@ -45,6 +45,22 @@ class PlayerFantasyProfileBarGraph(Endpoint):
             "FG_PCT",
         ],
     }
+    expected_schema = {
+        "LastFiveGamesAvg": {
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "FT_PCT": "float",
+            "FG_PCT": "float",
+        },
+        "SeasonAvg": {
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "FT_PCT": "float",
+            "FG_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -87,10 +103,6 @@ class PlayerFantasyProfileBarGraph(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.last_five_games_avg = Endpoint.DataSet(data=data_sets["LastFiveGamesAvg"])
-        self.season_avg = Endpoint.DataSet(data=data_sets["SeasonAvg"])
+        data_sets = self.load_data_sets()
+        self.last_five_games_avg = data_sets["LastFiveGamesAvg"]
+        self.season_avg = data_sets["SeasonAvg"]
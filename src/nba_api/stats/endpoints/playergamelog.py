@@ -36,6 +36,19 @@ class PlayerGameLog(Endpoint):
             "VIDEO_AVAILABLE",
         ]
     }
+    expected_schema = {
+        "PlayerGameLog": {
+            "SEASON_ID": "category",
+            "Player_ID": "int",
+            "Game_ID": "str",
+            "GAME_DATE": "date",
+            "MATCHUP": "category",
+            "WL": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -82,9 +95,5 @@ class PlayerGameLog(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_game_log = Endpoint.DataSet(data=data_sets["PlayerGameLog"])
+        data_sets = self.load_data_sets()
+        self.player_game_log = data_sets["PlayerGameLog"]
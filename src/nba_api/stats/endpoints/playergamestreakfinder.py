@@ -29,6 +29,13 @@ class PlayerGameStreakFinder(Endpoint):
             "FIRSTSEASON",
         ]
     }
+    expected_schema = {
+        "PlayerGameStreakFinderResults": {
+            "PLAYER_ID": "int",
+            "STARTDATE": "date",
+            "ENDDATE": "date",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -241,11 +248,5 @@ class PlayerGameStreakFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_game_streak_finder_results = Endpoint.DataSet(
-            data=data_sets["PlayerGameStreakFinderResults"]
-        )
+        data_sets = self.load_data_sets()
+        self.player_game_streak_finder_results = data_sets["PlayerGameStreakFinderResults"]
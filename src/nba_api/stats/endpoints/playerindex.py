@@ -42,6 +42,17 @@ class PlayerIndex(Endpoint):
             "TO_YEAR",
         ]
     }
+    expected_schema = {
+        "PlayerIndex": {
+            "PERSON_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_SLUG": "category",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "POSITION": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -102,9 +113,5 @@ class PlayerIndex(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.player_index = Endpoint.DataSet(data=data_sets["PlayerIndex"])
+        data_sets = self.load_data_sets()
+        self.player_index = data_sets["PlayerIndex"]
@@ -27,6 +27,20 @@ class PlayerNextNGames(Endpoint):
             "VISITOR_WL",
         ]
     }
+    expected_schema = {
+        "NextNGames": {
+            "GAME_ID": "str",
+            "GAME_DATE": "date",
+            "HOME_TEAM_ID": "int",
+            "VISITOR_TEAM_ID": "int",
+            "HOME_TEAM_NAME": "category",
+            "VISITOR_TEAM_NAME": "category",
+            "HOME_TEAM_ABBREVIATION": "category",
+            "VISITOR_TEAM_ABBREVIATION": "category",
+            "HOME_WL": "category",
+            "VISITOR_WL": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -71,9 +85,5 @@ class PlayerNextNGames(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.next_n_games = Endpoint.DataSet(data=data_sets["NextNGames"])
+        data_sets = self.load_data_sets()
+        self.next_n_games = data_sets["NextNGames"]
@@ -199,6 +199,75 @@ class PlayerVsPlayer(Endpoint):
             "LAST_AFFILIATION",
         ],
     }
+    expected_schema = {
+        "OnOffCourt": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "VS_PLAYER_ID": "int",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "CFID": "int",
+        },
+        "Overall": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "CFID": "int",
+        },
+        "PlayerInfo": {
+            "PERSON_ID": "int",
+            "BIRTHDATE": "date",
+        },
+        "ShotAreaOffCourt": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "VS_PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "CFID": "int",
+        },
+        "ShotAreaOnCourt": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "VS_PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "CFID": "int",
+        },
+        "ShotAreaOverall": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "CFID": "int",
+        },
+        "ShotDistanceOffCourt": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "VS_PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "CFID": "int",
+        },
+        "ShotDistanceOnCourt": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "VS_PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "CFID": "int",
+        },
+        "ShotDistanceOverall": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "CFID": "int",
+        },
+        "VsPlayerInfo": {
+            "PERSON_ID": "int",
+            "BIRTHDATE": "date",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -277,24 +346,14 @@ class PlayerVsPlayer(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.on_off_court = Endpoint.DataSet(data=data_sets["OnOffCourt"])
-        self.overall = Endpoint.DataSet(data=data_sets["Overall"])
-        self.player_info = Endpoint.DataSet(data=data_sets["PlayerInfo"])
-        self.shot_area_off_court = Endpoint.DataSet(data=data_sets["ShotAreaOffCourt"])
-        self.shot_area_on_court = Endpoint.DataSet(data=data_sets["ShotAreaOnCourt"])
-        self.shot_area_overall = Endpoint.DataSet(data=data_sets["ShotAreaOverall"])
-        self.shot_distance_off_court = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOffCourt"]
-        )
-        self.shot_distance_on_court = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOnCourt"]
-        )
-        self.shot_distance_overall = Endpoint.DataSet(
-            data=data_sets["ShotDistanceOverall"]
-        )
-        self.vs_player_info = Endpoint.DataSet(data=data_sets["VsPlayerInfo"])
+        data_sets = self.load_data_sets()
+        self.on_off_court = data_sets["OnOffCourt"]
+        self.overall = data_sets["Overall"]
+        self.player_info = data_sets["PlayerInfo"]
+        self.shot_area_off_court = data_sets["ShotAreaOffCourt"]
+        self.shot_area_on_court = data_sets["ShotAreaOnCourt"]
+        self.shot_area_overall = data_sets["ShotAreaOverall"]
+        self.shot_distance_off_court = data_sets["ShotDistanceOffCourt"]
+        self.shot_distance_on_court = data_sets["ShotDistanceOnCourt"]
+        self.shot_distance_overall = data_sets["ShotDistanceOverall"]
+        self.vs_player_info = data_sets["VsPlayerInfo"]
@@ -173,6 +173,76 @@ class PlayoffPicture(Endpoint):
             "Seeding_Game_8_Label",
         ],
     }
+    expected_schema = {
+        "EastConfPlayoffPicture": {
+            "CONFERENCE": "category",
+            "HIGH_SEED_RANK": "int",
+            "HIGH_SEED_TEAM_ID": "int",
+            "LOW_SEED_RANK": "int",
+            "LOW_SEED_TEAM_ID": "int",
+        },
+        "EastConfRemainingGames": {
+            "TEAM_ID": "int",
+        },
+        "EastConfStandings": {
+            "CONFERENCE": "category",
+            "RANK": "int",
+            "TEAM_SLUG": "category",
+            "TEAM_ID": "int",
+            "CLINCHED_CONFERENCE": "category",
+            "CLINCHED_DIVISION": "category",
+            "Seeding_Game_1_Outcome": "category",
+            "Seeding_Game_2_Outcome": "category",
+            "Seeding_Game_3_Outcome": "category",
+            "Seeding_Game_4_Outcome": "category",
+            "Seeding_Game_5_Outcome": "category",
+            "Seeding_Game_6_Outcome": "category",
+            "Seeding_Game_7_Outcome": "category",
+            "Seeding_Game_8_Outcome": "category",
+            "Seeding_Game_1_ID": "str",
+            "Seeding_Game_2_ID": "str",
+            "Seeding_Game_3_ID": "str",
+            "Seeding_Game_4_ID": "str",
+            "Seeding_Game_5_ID": "str",
+            "Seeding_Game_6_ID": "str",
+            "Seeding_Game_7_ID": "str",
+            "Seeding_Game_8_ID": "str",
+        },
+        "WestConfPlayoffPicture": {
+            "CONFERENCE": "category",
+            "HIGH_SEED_RANK": "int",
+            "HIGH_SEED_TEAM_ID": "int",
+            "LOW_SEED_RANK": "int",
+            "LOW_SEED_TEAM_ID": "int",
+        },
+        "WestConfRemainingGames": {
+            "TEAM_ID": "int",
+        },
+        "WestConfStandings": {
+            "CONFERENCE": "category",
+            "RANK": "int",
+            "TEAM_SLUG": "category",
+            "TEAM_ID": "int",
+            "CLINCHED_CONFERENCE": "category",
+            "CLINCHED_DIVISION": "category",
+            "Seeding_Game_1_Outcome": "category",
+            "Seeding_Game_2_Outcome": "category",
+            "Seeding_Game_3_Outcome": "category",
+            "Seeding_Game_4_Outcome": "category",
+            "Seeding_Game_5_Outcome": "category",
+            "Seeding_Game_6_Outcome": "category",
+            "Seeding_Game_7_Outcome": "category",
+            "Seeding_Game_8_Outcome": "category",
+            "Seeding_Game_1_ID": "str",
+            "Seeding_Game_2_ID": "str",
+            "Seeding_Game_3_ID": "str",
+            "Seeding_Game_4_ID": "str",
+            "Seeding_Game_5_ID": "str",
+            "Seeding_Game_6_ID": "str",
+            "Seeding_Game_7_ID": "str",
+            "Seeding_Game_8_ID": "str",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -208,22 +278,10 @@ class PlayoffPicture(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.east_conf_playoff_picture = Endpoint.DataSet(
-            data=data_sets["EastConfPlayoffPicture"]
-        )
-        self.east_conf_remaining_games = Endpoint.DataSet(
-            data=data_sets["EastConfRemainingGames"]
-        )
-        self.east_conf_standings = Endpoint.DataSet(data=data_sets["EastConfStandings"])
-        self.west_conf_playoff_picture = Endpoint.DataSet(
-            data=data_sets["WestConfPlayoffPicture"]
-        )
-        self.west_conf_remaining_games = Endpoint.DataSet(
-            data=data_sets["WestConfRemainingGames"]
-        )
-        self.west_conf_standings = Endpoint.DataSet(data=data_sets["WestConfStandings"])
+        data_sets = self.load_data_sets()
+        self.east_conf_playoff_picture = data_sets["EastConfPlayoffPicture"]
+        self.east_conf_remaining_games = data_sets["EastConfRemainingGames"]
+        self.east_conf_standings = data_sets["EastConfStandings"]
+        self.west_conf_playoff_picture = data_sets["WestConfPlayoffPicture"]
+        self.west_conf_remaining_games = data_sets["WestConfRemainingGames"]
+        self.west_conf_standings = data_sets["WestConfStandings"]
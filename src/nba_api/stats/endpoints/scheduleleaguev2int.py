@@ -171,6 +171,75 @@ class ScheduleLeagueV2Int(Endpoint):
             "regionId",
         ],
     }
+    expected_schema = {
+        "SeasonGames": {
+            "leagueId": "str",
+            "seasonYear": "category",
+            "gameDate": "date",
+            "gameId": "str",
+            "gameStatusText": "category",
+            "gameDateEst": "date",
+            "gameDateTimeEst": "date",
+            "gameDateUTC": "date",
+            "gameDateTimeUTC": "date",
+            "gameSubtype": "category",
+            "homeTeam_teamId": "int",
+            "homeTeam_teamName": "category",
+            "homeTeam_teamCity": "category",
+            "homeTeam_teamTricode": "category",
+            "homeTeam_teamSlug": "category",
+            "awayTeam_teamId": "int",
+            "awayTeam_teamName": "category",
+            "awayTeam_teamCity": "category",
+            "awayTeam_teamTricode": "category",
+            "awayTeam_teamSlug": "category",
+            "pointsLeaders_personId": "int",
+            "pointsLeaders_teamId": "int",
+            "pointsLeaders_teamCity": "category",
+            "pointsLeaders_teamName": "category",
+            "pointsLeaders_teamTricode": "category",
+            "nationalBroadcasters_broadcasterId": "int",
+            "nationalBroadcasters_broadcasterAbbreviation": "category",
+            "nationalBroadcasters_broadcasterTeamId": "int",
+            "nationalRadioBroadcasters_broadcasterId": "int",
+            "nationalRadioBroadcasters_broadcasterAbbreviation": "category",
+            "nationalRadioBroadcasters_broadcasterTeamId": "int",
+            "nationalOttBroadcasters_broadcasterId": "int",
+            "nationalOttBroadcasters_broadcasterAbbreviation": "category",
+            "nationalOttBroadcasters_broadcasterTeamId": "int",
+            "homeTvBroadcasters_broadcasterId": "int",
+            "homeTvBroadcasters_broadcasterAbbreviation": "category",
+            "homeTvBroadcasters_broadcasterTeamId": "int",
+            "homeRadioBroadcasters_broadcasterId": "int",
+            "homeRadioBroadcasters_broadcasterAbbreviation": "category",
+            "homeRadioBroadcasters_broadcasterTeamId": "int",
+            "homeOttBroadcasters_broadcasterId": "int",
+            "homeOttBroadcasters_broadcasterAbbreviation": "category",
+            "homeOttBroadcasters_broadcasterTeamId": "int",
+            "awayTvBroadcasters_broadcasterId": "int",
+            "awayTvBroadcasters_broadcasterAbbreviation": "category",
+            "awayTvBroadcasters_broadcasterTeamId": "int",
+            "awayRadioBroadcasters_broadcasterId": "int",
+            "awayRadioBroadcasters_broadcasterAbbreviation": "category",
+            "awayRadioBroadcasters_broadcasterTeamId": "int",
+            "awayOttBroadcasters_broadcasterId": "int",
+            "awayOttBroadcasters_broadcasterAbbreviation": "category",
+            "awayOttBroadcasters_broadcasterTeamId": "int",
+        },
+        "SeasonWeeks": {
+            "leagueId": "str",
+            "seasonYear": "category",
+            "startDate": "date",
+            "endDate": "date",
+        },
+        "BroadcasterList": {
+            "leagueId": "str",
+            "seasonYear": "category",
+            "broadcasterAbbreviation": "category",
+            "broadcasterId": "int",
+            "regionId": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -209,10 +278,6 @@ class ScheduleLeagueV2Int(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.season_games = Endpoint.DataSet(data=data_sets["SeasonGames"])
-        self.season_weeks = Endpoint.DataSet(data=data_sets["SeasonWeeks"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.season_games = data_sets["SeasonGames"]
+        self.season_weeks = data_sets["SeasonWeeks"]
@@ -129,6 +129,81 @@ class ScoreboardV2(Endpoint):
         ],
         "WinProbability": [],
     }
+    expected_schema = {
+        "Available": {
+            "GAME_ID": "str",
+        },
+        "EastConfStandingsByDay": {
+            "TEAM_ID": "int",
+            "LEAGUE_ID": "str",
+            "SEASON_ID": "category",
+            "STANDINGSDATE": "date",
+            "CONFERENCE": "category",
+            "W_PCT": "float",
+        },
+        "GameHeader": {
+            "GAME_DATE_EST": "date",
+            "GAME_ID": "str",
+            "GAME_STATUS_ID": "int",
+            "GAME_STATUS_TEXT": "category",
+            "HOME_TEAM_ID": "int",
+            "VISITOR_TEAM_ID": "int",
+            "SEASON": "category",
+            "NATL_TV_BROADCASTER_ABBREVIATION": "category",
+            "HOME_TV_BROADCASTER_ABBREVIATION": "category",
+            "AWAY_TV_BROADCASTER_ABBREVIATION": "category",
+        },
+        "LastMeeting": {
+            "GAME_ID": "str",
+            "LAST_GAME_ID": "str",
+            "LAST_GAME_DATE_EST": "date",
+            "LAST_GAME_HOME_TEAM_ID": "int",
+            "LAST_GAME_HOME_TEAM_CITY": "category",
+            "LAST_GAME_HOME_TEAM_NAME": "category",
+            "LAST_GAME_HOME_TEAM_ABBREVIATION": "category",
+            "LAST_GAME_VISITOR_TEAM_ID": "int",
+            "LAST_GAME_VISITOR_TEAM_CITY": "category",
+            "LAST_GAME_VISITOR_TEAM_NAME": "category",
+            "LAST_GAME_VISITOR_TEAM_CITY1": "category",
+        },
+        "LineScore": {
+            "GAME_DATE_EST": "date",
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "FG_PCT": "float",
+            "FT_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "SeriesStandings": {
+            "GAME_ID": "str",
+            "HOME_TEAM_ID": "int",
+            "VISITOR_TEAM_ID": "int",
+            "GAME_DATE_EST": "date",
+        },
+        "TeamLeaders": {
+            "GAME_ID": "str",
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_ABBREVIATION": "category",
+            "PTS_PLAYER_ID": "int",
+            "REB_PLAYER_ID": "int",
+            "AST_PLAYER_ID": "int",
+        },
+        "TicketLinks": {
+            "GAME_ID": "str",
+        },
+        "WestConfStandingsByDay": {
+            "TEAM_ID": "int",
+            "LEAGUE_ID": "str",
+            "SEASON_ID": "category",
+            "STANDINGSDATE": "date",
+            "CONFERENCE": "category",
+            "W_PCT": "float",
+        },
+        "WinProbability": {},
+    }
 
     nba_response = None
     data_sets = None
@@ -169,23 +244,15 @@ class ScoreboardV2(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available = Endpoint.DataSet(data=data_sets["Available"])
-        self.east_conf_standings_by_day = Endpoint.DataSet(
-            data=data_sets["EastConfStandingsByDay"]
-        )
-        self.game_header = Endpoint.DataSet(data=data_sets["GameHeader"])
-        self.last_meeting = Endpoint.DataSet(data=data_sets["LastMeeting"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.series_standings = Endpoint.DataSet(data=data_sets["SeriesStandings"])
-        self.team_leaders = Endpoint.DataSet(data=data_sets["TeamLeaders"])
-        self.ticket_links = Endpoint.DataSet(data=data_sets["TicketLinks"])
-        self.west_conf_standings_by_day = Endpoint.DataSet(
-            data=data_sets["WestConfStandingsByDay"]
-        )
+        data_sets = self.load_data_sets()
+        self.available = data_sets["Available"]
+        self.east_conf_standings_by_day = data_sets["EastConfStandingsByDay"]
+        self.game_header = data_sets["GameHeader"]
+        self.last_meeting = data_sets["LastMeeting"]
+        self.line_score = data_sets["LineScore"]
+        self.series_standings = data_sets["SeriesStandings"]
+        self.team_leaders = data_sets["TeamLeaders"]
+        self.ticket_links = data_sets["TicketLinks"]
+        self.west_conf_standings_by_day = data_sets["WestConfStandingsByDay"]
         if "WinProbability" in data_sets:
-            self.win_probability = Endpoint.DataSet(data=data_sets["WinProbability"])
+            self.win_probability = data_sets["WinProbability"]
@@ -62,6 +62,48 @@ class ScoreboardV3(Endpoint):
 
     endpoint = "scoreboardv3"
     expected_data = _EXPECTED_DATA
+    expected_schema = {
+        "ScoreboardInfo": {
+            "gameDate": "date",
+            "leagueId": "str",
+        },
+        "GameHeader": {
+            "gameId": "str",
+            "gameStatusText": "category",
+            "seriesConference": "category",
+            "gameSubtype": "category",
+        },
+        "LineScore": {
+            "gameId": "str",
+            "teamId": "int",
+            "teamCity": "category",
+            "teamName": "category",
+            "teamTricode": "category",
+            "teamSlug": "category",
+        },
+        "GameLeaders": {
+            "gameId": "str",
+            "teamId": "int",
+            "leaderType": "category",
+            "personId": "int",
+            "position": "category",
+            "teamTricode": "category",
+        },
+        "TeamLeaders": {
+            "gameId": "str",
+            "teamId": "int",
+            "leaderType": "category",
+            "personId": "int",
+            "position": "category",
+            "teamTricode": "category",
+        },
+        "Broadcasters": {
+            "gameId": "str",
+            "broadcasterType": "category",
+            "broadcasterId": "int",
+            "broadcasterTeamId": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -139,14 +181,10 @@ class ScoreboardV3(Endpoint):
         - TeamLeaders: Season leader statistics
         - Broadcasters: Broadcaster information
         """
-        data_sets = self.nba_response.get_data_sets(self.endpoint)
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.scoreboard_info = Endpoint.DataSet(data=data_sets["ScoreboardInfo"])
-        self.game_header = Endpoint.DataSet(data=data_sets["GameHeader"])
-        self.line_score = Endpoint.DataSet(data=data_sets["LineScore"])
-        self.game_leaders = Endpoint.DataSet(data=data_sets["GameLeaders"])
-        self.team_leaders = Endpoint.DataSet(data=data_sets["TeamLeaders"])
-        self.broadcasters = Endpoint.DataSet(data=data_sets["Broadcasters"])
+        data_sets = self.load_data_sets(self.endpoint)
+        self.scoreboard_info = data_sets["ScoreboardInfo"]
+        self.game_header = data_sets["GameHeader"]
+        self.line_score = data_sets["LineScore"]
+        self.game_leaders = data_sets["GameLeaders"]
+        self.team_leaders = data_sets["TeamLeaders"]
+        self.broadcasters = data_sets["Broadcasters"]
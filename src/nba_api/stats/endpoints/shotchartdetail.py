@@ -66,6 +66,30 @@ class ShotChartDetail(Endpoint):
             "VTM",
         ],
     }
+    expected_schema = {
+        "LeagueAverages": {
+            "GRID_TYPE": "category",
+            "SHOT_ZONE_BASIC": "category",
+            "SHOT_ZONE_AREA": "category",
+            "SHOT_ZONE_RANGE": "category",
+            "FG_PCT": "float",
+        },
+        "Shot_Chart_Detail": {
+            "GRID_TYPE": "category",
+            "GAME_ID": "str",
+            "GAME_EVENT_ID": "int",
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "EVENT_TYPE": "category",
+            "ACTION_TYPE": "category",
+            "SHOT_TYPE": "category",
+            "SHOT_ZONE_BASIC": "category",
+            "SHOT_ZONE_AREA": "category",
+            "SHOT_ZONE_RANGE": "category",
+            "GAME_DATE": "date",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -162,10 +186,6 @@ class ShotChartDetail(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_averages = Endpoint.DataSet(data=data_sets["LeagueAverages"])
-        self.shot_chart_detail = Endpoint.DataSet(data=data_sets["Shot_Chart_Detail"])
+        data_sets = self.load_data_sets()
+        self.league_averages = data_sets["LeagueAverages"]
+        self.shot_chart_detail = data_sets["Shot_Chart_Detail"]
@@ -16,6 +16,15 @@ class ShotChartLeagueWide(Endpoint):
             "FG_PCT",
         ]
     }
+    expected_schema = {
+        "League_Wide": {
+            "GRID_TYPE": "category",
+            "SHOT_ZONE_BASIC": "category",
+            "SHOT_ZONE_AREA": "category",
+            "SHOT_ZONE_RANGE": "category",
+            "FG_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -51,9 +60,5 @@ class ShotChartLeagueWide(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.league_wide = Endpoint.DataSet(data=data_sets["League_Wide"])
+        data_sets = self.load_data_sets()
+        self.league_wide = data_sets["League_Wide"]
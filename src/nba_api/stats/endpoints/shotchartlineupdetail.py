@@ -58,6 +58,31 @@ class ShotChartLineupDetail(Endpoint):
             "FG_PCT",
         ],
     }
+    expected_schema = {
+        "ShotChartLineupDetail": {
+            "GRID_TYPE": "category",
+            "GAME_ID": "str",
+            "GAME_EVENT_ID": "int",
+            "GROUP_ID": "int",
+            "PLAYER_ID": "int",
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "EVENT_TYPE": "category",
+            "ACTION_TYPE": "category",
+            "SHOT_TYPE": "category",
+            "SHOT_ZONE_BASIC": "category",
+            "SHOT_ZONE_AREA": "category",
+            "SHOT_ZONE_RANGE": "category",
+            "GAME_DATE": "date",
+        },
+        "ShotChartLineupLeagueAverage": {
+            "GRID_TYPE": "category",
+            "SHOT_ZONE_BASIC": "category",
+            "SHOT_ZONE_AREA": "category",
+            "SHOT_ZONE_RANGE": "category",
+            "FG_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -132,14 +157,6 @@ class ShotChartLineupDetail(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.shot_chart_lineup_detail = Endpoint.DataSet(
-            data=data_sets["ShotChartLineupDetail"]
-        )
-        self.shot_chart_lineup_league_average = Endpoint.DataSet(
-            data=data_sets["ShotChartLineupLeagueAverage"]
-        )
+        data_sets = self.load_data_sets()
+        self.shot_chart_lineup_detail = data_sets["ShotChartLineupDetail"]
+        self.shot_chart_lineup_league_average = data_sets["ShotChartLineupLeagueAverage"]
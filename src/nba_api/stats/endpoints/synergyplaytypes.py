@@ -39,6 +39,23 @@ class SynergyPlayTypes(Endpoint):
             "FGMX",
         ]
     }
+    expected_schema = {
+        "SynergyPlayType": {
+            "SEASON_ID": "category",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "PLAY_TYPE": "category",
+            "POSS_PCT": "float",
+            "FG_PCT": "float",
+            "FT_POSS_PCT": "float",
+            "TOV_POSS_PCT": "float",
+            "SF_POSS_PCT": "float",
+            "PLUSONE_POSS_PCT": "float",
+            "SCORE_POSS_PCT": "float",
+            "EFG_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -87,9 +104,5 @@ class SynergyPlayTypes(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.synergy_play_type = Endpoint.DataSet(data=data_sets["SynergyPlayType"])
+        data_sets = self.load_data_sets()
+        self.synergy_play_type = data_sets["SynergyPlayType"]
@@ -164,6 +164,40 @@ class TeamAndPlayersVsPlayers(Endpoint):
             "PLUS_MINUS",
         ],
     }
+    expected_schema = {
+        "PlayersVsPlayers": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "TeamPlayersVsPlayersOff": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "TeamPlayersVsPlayersOn": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "TeamVsPlayers": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+        "TeamVsPlayersOff": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -268,17 +302,9 @@ class TeamAndPlayersVsPlayers(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.players_vs_players = Endpoint.DataSet(data=data_sets["PlayersVsPlayers"])
-        self.team_players_vs_players_off = Endpoint.DataSet(
-            data=data_sets["TeamPlayersVsPlayersOff"]
-        )
-        self.team_players_vs_players_on = Endpoint.DataSet(
-            data=data_sets["TeamPlayersVsPlayersOn"]
-        )
-        self.team_vs_players = Endpoint.DataSet(data=data_sets["TeamVsPlayers"])
-        self.team_vs_players_off = Endpoint.DataSet(data=data_sets["TeamVsPlayersOff"])
+        data_sets = self.load_data_sets()
+        self.players_vs_players = data_sets["PlayersVsPlayers"]
+        self.team_players_vs_players_off = data_sets["TeamPlayersVsPlayersOff"]
+        self.team_players_vs_players_on = data_sets["TeamPlayersVsPlayersOn"]
+        self.team_vs_players = data_sets["TeamVsPlayers"]
+        self.team_vs_players_off = data_sets["TeamVsPlayersOff"]
@@ -265,6 +265,198 @@ class TeamDashboardByShootingSplits(Endpoint):
             "CFPARAMS",
         ],
     }
+    expected_schema = {
+        "AssistedBy": {
+            "GROUP_SET": "category",
+            "PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "AssitedShotTeamDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "OverallTeamDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "Shot5FTTeamDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "Shot8FTTeamDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "ShotAreaTeamDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+        "ShotTypeTeamDashboard": {
+            "GROUP_SET": "category",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "EFG_PCT": "float",
+            "PCT_AST_2PM": "float",
+            "PCT_UAST_2PM": "float",
+            "PCT_AST_3PM": "float",
+            "PCT_UAST_3PM": "float",
+            "PCT_AST_FGM": "float",
+            "PCT_UAST_FGM": "float",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "EFG_PCT_RANK": "int",
+            "BLKA_RANK": "int",
+            "PCT_AST_2PM_RANK": "int",
+            "PCT_UAST_2PM_RANK": "int",
+            "PCT_AST_3PM_RANK": "int",
+            "PCT_UAST_3PM_RANK": "int",
+            "PCT_AST_FGM_RANK": "int",
+            "PCT_UAST_FGM_RANK": "int",
+            "CFID": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -345,27 +537,11 @@ class TeamDashboardByShootingSplits(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.assisted_by = Endpoint.DataSet(data=data_sets["AssistedBy"])
-        self.assited_shot_team_dashboard = Endpoint.DataSet(
-            data=data_sets["AssitedShotTeamDashboard"]
-        )
-        self.overall_team_dashboard = Endpoint.DataSet(
-            data=data_sets["OverallTeamDashboard"]
-        )
-        self.shot5_ft_team_dashboard = Endpoint.DataSet(
-            data=data_sets["Shot5FTTeamDashboard"]
-        )
-        self.shot8_ft_team_dashboard = Endpoint.DataSet(
-            data=data_sets["Shot8FTTeamDashboard"]
-        )
-        self.shot_area_team_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotAreaTeamDashboard"]
-        )
-        self.shot_type_team_dashboard = Endpoint.DataSet(
-            data=data_sets["ShotTypeTeamDashboard"]
-        )
+        data_sets = self.load_data_sets()
+        self.assisted_by = data_sets["AssistedBy"]
+        self.assited_shot_team_dashboard = data_sets["AssitedShotTeamDashboard"]
+        self.overall_team_dashboard = data_sets["OverallTeamDashboard"]
+        self.shot5_ft_team_dashboard = data_sets["Shot5FTTeamDashboard"]
+        self.shot8_ft_team_dashboard = data_sets["Shot8FTTeamDashboard"]
+        self.shot_area_team_dashboard = data_sets["ShotAreaTeamDashboard"]
+        self.shot_type_team_dashboard = data_sets["ShotTypeTeamDashboard"]
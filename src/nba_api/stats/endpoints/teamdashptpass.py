@@ -59,6 +59,26 @@ class TeamDashPtPass(Endpoint):
             "FG3_PCT",
         ],
     }
+    expected_schema = {
+        "PassesMade": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "PASS_TYPE": "category",
+            "PASS_TEAMMATE_PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+        "PassesReceived": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "PASS_TYPE": "category",
+            "PASS_TEAMMATE_PLAYER_ID": "int",
+            "FG_PCT": "float",
+            "FG2_PCT": "float",
+            "FG3_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -123,10 +143,6 @@ class TeamDashPtPass(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.passes_made = Endpoint.DataSet(data=data_sets["PassesMade"])
-        self.passes_received = Endpoint.DataSet(data=data_sets["PassesReceived"])
+        data_sets = self.load_data_sets()
+        self.passes_made = data_sets["PassesMade"]
+        self.passes_received = data_sets["PassesReceived"]
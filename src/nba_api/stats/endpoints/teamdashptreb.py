@@ -115,6 +115,38 @@ class TeamDashPtReb(Endpoint):
             "UC_REB_PCT",
         ],
     }
+    expected_schema = {
+        "NumContestedRebounding": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+        "OverallRebounding": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+        "RebDistanceRebounding": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+        "ShotDistanceRebounding": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+        "ShotTypeRebounding": {
+            "TEAM_ID": "int",
+            "TEAM_NAME": "category",
+            "C_REB_PCT": "float",
+            "UC_REB_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -183,21 +215,9 @@ class TeamDashPtReb(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.num_contested_rebounding = Endpoint.DataSet(
-            data=data_sets["NumContestedRebounding"]
-        )
-        self.overall_rebounding = Endpoint.DataSet(data=data_sets["OverallRebounding"])
-        self.reb_distance_rebounding = Endpoint.DataSet(
-            data=data_sets["RebDistanceRebounding"]
-        )
-        self.shot_distance_rebounding = Endpoint.DataSet(
-            data=data_sets["ShotDistanceRebounding"]
-        )
-        self.shot_type_rebounding = Endpoint.DataSet(
-            data=data_sets["ShotTypeRebounding"]
-        )
+        data_sets = self.load_data_sets()
+        self.num_contested_rebounding = data_sets["NumContestedRebounding"]
+        self.overall_rebounding = data_sets["OverallRebounding"]
+        self.reb_distance_rebounding = data_sets["RebDistanceRebounding"]
+        self.shot_distance_rebounding = data_sets["ShotDistanceRebounding"]
+        self.shot_type_rebounding = data_sets["ShotTypeRebounding"]
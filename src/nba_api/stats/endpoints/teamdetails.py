@@ -40,6 +40,29 @@ class TeamDetails(Endpoint):
         ],
         "TeamSocialSites": ["ACCOUNTTYPE", "WEBSITE_LINK"],
     }
+    expected_schema = {
+        "TeamAwardsChampionships": {},
+        "TeamAwardsConf": {},
+        "TeamAwardsDiv": {},
+        "TeamBackground": {
+            "TEAM_ID": "int",
+            "ABBREVIATION": "category",
+        },
+        "TeamHistory": {
+            "TEAM_ID": "int",
+        },
+        "TeamHof": {
+            "PLAYERID": "int",
+            "POSITION": "category",
+        },
+        "TeamRetired": {
+            "PLAYERID": "int",
+            "POSITION": "category",
+        },
+        "TeamSocialSites": {
+            "ACCOUNTTYPE": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -67,18 +90,12 @@ class TeamDetails(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_awards_championships = Endpoint.DataSet(
-            data=data_sets["TeamAwardsChampionships"]
-        )
-        self.team_awards_conf = Endpoint.DataSet(data=data_sets["TeamAwardsConf"])
-        self.team_awards_div = Endpoint.DataSet(data=data_sets["TeamAwardsDiv"])
-        self.team_background = Endpoint.DataSet(data=data_sets["TeamBackground"])
-        self.team_history = Endpoint.DataSet(data=data_sets["TeamHistory"])
-        self.team_hof = Endpoint.DataSet(data=data_sets["TeamHof"])
-        self.team_retired = Endpoint.DataSet(data=data_sets["TeamRetired"])
-        self.team_social_sites = Endpoint.DataSet(data=data_sets["TeamSocialSites"])
+        data_sets = self.load_data_sets()
+        self.team_awards_championships = data_sets["TeamAwardsChampionships"]
+        self.team_awards_conf = data_sets["TeamAwardsConf"]
+        self.team_awards_div = data_sets["TeamAwardsDiv"]
+        self.team_background = data_sets["TeamBackground"]
+        self.team_history = data_sets["TeamHistory"]
+        self.team_hof = data_sets["TeamHof"]
+        self.team_retired = data_sets["TeamRetired"]
+        self.team_social_sites = data_sets["TeamSocialSites"]
@@ -39,6 +39,36 @@ class TeamEstimatedMetrics(Endpoint):
             "E_PACE_RANK",
         ]
     }
+    expected_schema = {
+        "TeamEstimatedMetrics": {
+            "TEAM_NAME": "category",
+            "TEAM_ID": "int",
+            "W_PCT": "float",
+            "E_OFF_RATING": "float",
+            "E_DEF_RATING": "float",
+            "E_NET_RATING": "float",
+            "E_PACE": "float",
+            "E_AST_RATIO": "float",
+            "E_OREB_PCT": "float",
+            "E_DREB_PCT": "float",
+            "E_REB_PCT": "float",
+            "E_TM_TOV_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "E_OFF_RATING_RANK": "int",
+            "E_DEF_RATING_RANK": "int",
+            "E_NET_RATING_RANK": "int",
+            "E_AST_RATIO_RANK": "int",
+            "E_OREB_PCT_RANK": "int",
+            "E_DREB_PCT_RANK": "int",
+            "E_REB_PCT_RANK": "int",
+            "E_TM_TOV_PCT_RANK": "int",
+            "E_PACE_RANK": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -79,11 +109,5 @@ class TeamEstimatedMetrics(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_estimated_metrics = Endpoint.DataSet(
-            data=data_sets["TeamEstimatedMetrics"]
-        )
+        data_sets = self.load_data_sets()
+        self.team_estimated_metrics = data_sets["TeamEstimatedMetrics"]
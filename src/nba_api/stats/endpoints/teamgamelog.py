@@ -36,6 +36,19 @@ class TeamGameLog(Endpoint):
             "PTS",
         ]
     }
+    expected_schema = {
+        "TeamGameLog": {
+            "Team_ID": "int",
+            "Game_ID": "str",
+            "GAME_DATE": "date",
+            "MATCHUP": "category",
+            "WL": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -86,9 +99,5 @@ class TeamGameLog(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_game_log = Endpoint.DataSet(data=data_sets["TeamGameLog"])
+        data_sets = self.load_data_sets()
+        self.team_game_log = data_sets["TeamGameLog"]
@@ -29,6 +29,15 @@ class TeamGameStreakFinder(Endpoint):
             "ABBREVIATION",
         ]
     }
+    expected_schema = {
+        "TeamGameStreakFinderParametersResults": {
+            "TEAM_NAME": "category",
+            "TEAM_ID": "int",
+            "STARTDATE": "date",
+            "ENDDATE": "date",
+            "ABBREVIATION": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -439,11 +448,5 @@ class TeamGameStreakFinder(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_game_streak_finder_parameters_results = Endpoint.DataSet(
-            data=data_sets["TeamGameStreakFinderParametersResults"]
-        )
+        data_sets = self.load_data_sets()
+        self.team_game_streak_finder_parameters_results = data_sets["TeamGameStreakFinderParametersResults"]
@@ -26,6 +26,17 @@ class TeamHistoricalLeaders(Endpoint):
             "SEASON_YEAR",
         ]
     }
+    expected_schema = {
+        "CareerLeadersByTeam": {
+            "TEAM_ID": "int",
+            "PTS_PERSON_ID": "int",
+            "AST_PERSON_ID": "int",
+            "REB_PERSON_ID": "int",
+            "BLK_PERSON_ID": "int",
+            "STL_PERSON_ID": "int",
+            "SEASON_YEAR": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -66,11 +77,5 @@ class TeamHistoricalLeaders(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.career_leaders_by_team = Endpoint.DataSet(
-            data=data_sets["CareerLeadersByTeam"]
-        )
+        data_sets = self.load_data_sets()
+        self.career_leaders_by_team = data_sets["CareerLeadersByTeam"]
@@ -42,6 +42,31 @@ class TeamInfoCommon(Endpoint):
             "OPP_PTS_PG",
         ],
     }
+    expected_schema = {
+        "AvailableSeasons": {
+            "SEASON_ID": "category",
+        },
+        "TeamInfoCommon": {
+            "TEAM_ID": "int",
+            "SEASON_YEAR": "category",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_CONFERENCE": "category",
+            "TEAM_DIVISION": "category",
+            "CONF_RANK": "int",
+            "DIV_RANK": "int",
+        },
+        "TeamSeasonRanks": {
+            "LEAGUE_ID": "str",
+            "SEASON_ID": "category",
+            "TEAM_ID": "int",
+            "PTS_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "OPP_PTS_RANK": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -84,11 +109,7 @@ class TeamInfoCommon(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.available_seasons = Endpoint.DataSet(data=data_sets["AvailableSeasons"])
-        self.team_info_common = Endpoint.DataSet(data=data_sets["TeamInfoCommon"])
-        self.team_season_ranks = Endpoint.DataSet(data=data_sets["TeamSeasonRanks"])
+        data_sets = self.load_data_sets()
+        self.available_seasons = data_sets["AvailableSeasons"]
+        self.team_info_common = data_sets["TeamInfoCommon"]
+        self.team_season_ranks = data_sets["TeamSeasonRanks"]
@@ -114,6 +114,64 @@ class TeamPlayerOnOffSummary(Endpoint):
             "NET_RATING",
         ],
     }
+    expected_schema = {
+        "OverallTeamPlayerOnOffSummary": {
+            "GROUP_SET": "category",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "W_PCT": "float",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "GP_RANK": "int",
+            "W_RANK": "int",
+            "L_RANK": "int",
+            "W_PCT_RANK": "int",
+            "MIN_RANK": "int",
+            "FGM_RANK": "int",
+            "FGA_RANK": "int",
+            "FG_PCT_RANK": "int",
+            "FG3M_RANK": "int",
+            "FG3A_RANK": "int",
+            "FG3_PCT_RANK": "int",
+            "FTM_RANK": "int",
+            "FTA_RANK": "int",
+            "FT_PCT_RANK": "int",
+            "OREB_RANK": "int",
+            "DREB_RANK": "int",
+            "REB_RANK": "int",
+            "AST_RANK": "int",
+            "TOV_RANK": "int",
+            "STL_RANK": "int",
+            "BLK_RANK": "int",
+            "BLKA_RANK": "int",
+            "PF_RANK": "int",
+            "PFD_RANK": "int",
+            "PTS_RANK": "int",
+            "PLUS_MINUS_RANK": "int",
+        },
+        "PlayersOffCourtTeamPlayerOnOffSummary": {
+            "GROUP_SET": "category",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "VS_PLAYER_ID": "int",
+            "OFF_RATING": "float",
+            "DEF_RATING": "float",
+            "NET_RATING": "float",
+        },
+        "PlayersOnCourtTeamPlayerOnOffSummary": {
+            "GROUP_SET": "category",
+            "TEAM_ID": "int",
+            "TEAM_ABBREVIATION": "category",
+            "TEAM_NAME": "category",
+            "VS_PLAYER_ID": "int",
+            "OFF_RATING": "float",
+            "DEF_RATING": "float",
+            "NET_RATING": "float",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -190,17 +248,7 @@ class TeamPlayerOnOffSummary(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.overall_team_player_on_off_summary = Endpoint.DataSet(
-            data=data_sets["OverallTeamPlayerOnOffSummary"]
-        )
-        self.players_off_court_team_player_on_off_summary = Endpoint.DataSet(
-            data=data_sets["PlayersOffCourtTeamPlayerOnOffSummary"]
-        )
-        self.players_on_court_team_player_on_off_summary = Endpoint.DataSet(
-            data=data_sets["PlayersOnCourtTeamPlayerOnOffSummary"]
-        )
+        data_sets = self.load_data_sets()
+        self.overall_team_player_on_off_summary = data_sets["OverallTeamPlayerOnOffSummary"]
+        self.players_off_court_team_player_on_off_summary = data_sets["PlayersOffCourtTeamPlayerOnOffSummary"]
+        self.players_on_court_team_player_on_off_summary = data_sets["PlayersOnCourtTeamPlayerOnOffSummary"]
@@ -43,6 +43,20 @@ class TeamYearByYearStats(Endpoint):
             "PTS_RANK",
         ]
     }
+    expected_schema = {
+        "TeamStats": {
+            "TEAM_ID": "int",
+            "TEAM_CITY": "category",
+            "TEAM_NAME": "category",
+            "WIN_PCT": "float",
+            "CONF_RANK": "int",
+            "DIV_RANK": "int",
+            "FG_PCT": "float",
+            "FG3_PCT": "float",
+            "FT_PCT": "float",
+            "PTS_RANK": "int",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -85,9 +99,5 @@ class TeamYearByYearStats(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.team_stats = Endpoint.DataSet(data=data_sets["TeamStats"])
+        data_sets = self.load_data_sets()
+        self.team_stats = data_sets["TeamStats"]
@@ -5,6 +5,7 @@ from nba_api.stats.library.http import NBAStatsHTTP
 class VideoEventsAsset(Endpoint):
     endpoint = "videoeventsasset"
     expected_data = {}
+    expected_schema = {}
 
     nba_response = None
     data_sets = None
@@ -40,8 +41,4 @@ class VideoEventsAsset(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
+        self.load_data_sets()
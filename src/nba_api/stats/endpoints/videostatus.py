@@ -23,6 +23,21 @@ class VideoStatus(Endpoint):
             "PT_XYZ_AVAILABLE",
         ]
     }
+    expected_schema = {
+        "VideoStatus": {
+            "GAME_ID": "str",
+            "GAME_DATE": "date",
+            "VISITOR_TEAM_ID": "int",
+            "VISITOR_TEAM_CITY": "category",
+            "VISITOR_TEAM_NAME": "category",
+            "VISITOR_TEAM_ABBREVIATION": "category",
+            "HOME_TEAM_ID": "int",
+            "HOME_TEAM_CITY": "category",
+            "HOME_TEAM_NAME": "category",
+            "HOME_TEAM_ABBREVIATION": "category",
+            "GAME_STATUS_TEXT": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -58,9 +73,5 @@ class VideoStatus(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.video_status = Endpoint.DataSet(data=data_sets["VideoStatus"])
+        data_sets = self.load_data_sets()
+        self.video_status = data_sets["VideoStatus"]
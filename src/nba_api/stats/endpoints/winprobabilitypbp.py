@@ -34,6 +34,20 @@ class WinProbabilityPBP(Endpoint):
             "ISVISIBLE",
         ],
     }
+    expected_schema = {
+        "GameInfo": {
+            "GAME_ID": "str",
+            "GAME_DATE": "date",
+            "HOME_TEAM_ID": "int",
+            "VISITOR_TEAM_ID": "int",
+        },
+        "WinProbPBP": {
+            "GAME_ID": "str",
+            "HOME_PCT": "float",
+            "VISITOR_PCT": "float",
+            "LOCATION": "category",
+        },
+    }
 
     nba_response = None
     data_sets = None
@@ -69,10 +83,6 @@ class WinProbabilityPBP(Endpoint):
         self.load_response()
 
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [
-            Endpoint.DataSet(data=data_set)
-            for data_set_name, data_set in data_sets.items()
-        ]
-        self.game_info = Endpoint.DataSet(data=data_sets["GameInfo"])
-        self.win_prob_p_bp = Endpoint.DataSet(data=data_sets["WinProbPBP"])
+        data_sets = self.load_data_sets()
+        self.game_info = data_sets["GameInfo"]
+        self.win_prob_p_bp = data_sets["WinProbPBP"]
@@ -1,8 +1,8 @@
 """NBA Stats HTTP client and response handling."""
 
-import json
+from collections.abc import Mapping, Sequence
 
-from nba_api.library import http
+from nba_api.library import http, jsonbackend
 
 try:
     from nba_api.library.debug.debug import STATS_HEADERS
@@ -23,43 +23,115 @@ except ImportError:
     }
 
 
+class NormalizedRows(Sequence):
+    """Rows of a result set as dictionaries, built only when accessed."""
+
+    def __init__(self, headers, row_set):
+        self._headers = headers
+        self._row_set = row_set
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            headers = self._headers
+            return [dict(zip(headers, row)) for row in self._row_set[index]]
+        return dict(zip(self._headers, self._row_set[index]))
+
+    def __iter__(self):
+        headers = self._headers
+        return (dict(zip(headers, row)) for row in self._row_set)
+
+    def __len__(self):
+        return len(self._row_set)
+
+    def __eq__(self, other):
+        if not isinstance(other, (list, NormalizedRows)):
+            return NotImplemented
+        return list(self) == list(other)
+
+    def __repr__(self):
+        return "NormalizedRows({} rows)".format(len(self))
+
+
+class LazyDataSets(Mapping):
+    """Data sets of a V3 endpoint, each parsed the first time it is accessed.
+
+    Args:
+        loaders (dict): Data set name -> callable returning its ``headers``
+            and ``data``.
+    """
+
+    def __init__(self, loaders):
+        self._loaders = loaders
+        self._data_sets = {}
+
+    def __getitem__(self, name):
+        if name not in self._data_sets:
+            self._data_sets[name] = self._loaders[name]()
+        return self._data_sets[name]
+
+    def __iter__(self):
+        return iter(self._loaders)
+
+    def __len__(self):
+        return len(self._loaders)
+
+    def is_loaded(self, name):
+        return name in self._data_sets
+
+    def __repr__(self):
+        return "LazyDataSets({})".format(list(self._loaders))
+
+
 class NBAStatsResponse(http.NBAResponse):
     """Response handler for NBA Stats API requests."""
 
-    def get_normalized_dict(self):
+    def _get_result_sets(self):
+        # Returns the legacy result sets as a list, or the "Meta" style
+        # resultSets dictionary, which is returned as-is when normalizing.
         raw_data = self.get_dict()
+        if "resultSets" in raw_data:
+            results = raw_data["resultSets"]
+            if "Meta" in results:
+                return results
+        elif "resultSet" in raw_data:
+            results = raw_data["resultSet"]
+        else:
+            return []
+        if isinstance(results, dict):
+            results = [results]
+        return results
+
+    def get_normalized_dict(self, lazy=False):
+        """Result sets as lists of row dictionaries, keyed by name.
+
+        Args:
+            lazy (bool, optional): Return a ``NormalizedRows`` sequence per
+                result set, which builds row dictionaries on access, instead
+                of a list. Defaults to False.
+        """
+        results = self._get_result_sets()
+        if isinstance(results, dict):
+            return results
 
         data = {}
-
-        legacy_headers = ["resultSets", "resultSet"]
-        is_legacy = set(legacy_headers) & set(raw_data.keys())
-
-        if is_legacy:
-            if "resultSets" in raw_data:
-                results = raw_data["resultSets"]
-                if "Meta" in results:
-                    return results
+        for result in results:
+            headers = result["headers"]
+            row_set = result["rowSet"]
+            if lazy:
+                data[result["name"]] = NormalizedRows(headers, row_set)
             else:
-                results = raw_data["resultSet"]
-            if isinstance(results, dict):
-                results = [results]
-            for result in results:
-                name = result["name"]
-                headers = result["headers"]
-                row_set = result["rowSet"]
-
-                rows = []
-                for raw_row in row_set:
-                    row = {}
-                    for i in range(len(headers)):
-                        row[headers[i]] = raw_row[i]
-                    rows.append(row)
-                data[name] = rows
-
+                data[result["name"]] = [dict(zip(headers, row)) for row in row_set]
         return data
 
+    def get_data_set_names(self):
+        """Names of the result sets, without normalizing their rows."""
+        results = self._get_result_sets()
+        if isinstance(results, dict):
+            return results.keys()
+        return {result["name"]: None for result in results}.keys()
+
     def get_normalized_json(self):
-        return json.dumps(self.get_normalized_dict())
+        return jsonbackend.dumps(self.get_normalized_dict())
 
     def get_parameters(self):
         if not self.valid_json() or "parameters" not in self.get_dict():
@@ -93,7 +165,16 @@ class NBAStatsResponse(http.NBAResponse):
             return {results["name"]: results["headers"]}
         return {result_set["name"]: result_set["headers"] for result_set in results}
 
-    def get_data_sets(self, endpoint=None):
+    def get_data_sets(self, endpoint=None, lazy=False):
+        """Data sets of the response, keyed by name.
+
+        Args:
+            endpoint (str, optional): Endpoint name, required for V3 endpoints
+                whose responses are parsed by a custom parser.
+            lazy (bool, optional): For V3 endpoints, return a ``LazyDataSets``
+                that only parses the data sets that are accessed. Defaults to
+                False.
+        """
         raw_dict = self.get_dict()
 
         if endpoint is None:
@@ -124,6 +205,8 @@ class NBAStatsResponse(http.NBAResponse):
             from nba_api.stats.endpoints._parsers import get_parser_for_endpoint
 
             endpoint_parser = get_parser_for_endpoint(endpoint, self.get_dict())
+            if lazy:
+                return LazyDataSets(endpoint_parser.get_data_set_loaders())
             return endpoint_parser.get_data_sets()
 
 
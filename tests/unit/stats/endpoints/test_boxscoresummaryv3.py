@@ -1,11 +1,14 @@
 """Unit tests for BoxScoreSummaryV3 endpoint."""
 
+import json
+
 import pytest
 from unittest.mock import Mock, patch
 from pandas import DataFrame
 
 from nba_api.stats.endpoints import BoxScoreSummaryV3
 from nba_api.stats.endpoints._parsers import NBAStatsBoxscoreSummaryParserV3
+from nba_api.stats.library.http import NBAStatsResponse
 from .data.boxscoresummaryv3 import BOXSCORESUMMARYV3_SAMPLE
 
 
@@ -342,3 +345,34 @@ class TestBoxScoreSummaryV3Endpoint:
         assert endpoint.last_five_meetings is None
         assert endpoint.other_stats is None
         assert endpoint.available_video is None
+
+    @patch.object(
+        NBAStatsBoxscoreSummaryParserV3,
+        "get_officials_data",
+        autospec=True,
+        return_value=[],
+    )
+    @patch("nba_api.stats.library.http.NBAStatsHTTP.send_api_request")
+    def test_datasets_are_parsed_on_first_use(
+        self, mock_request, mock_officials_data, json_fixture
+    ):
+        """Test that only the datasets that are used get parsed."""
+        mock_request.return_value = NBAStatsResponse(
+            response=json.dumps(json_fixture),
+            status_code=200,
+            url="https://stats.nba.com/stats/boxscoresummaryv3",
+        )
+
+        endpoint = BoxScoreSummaryV3(game_id="0022500142")
+
+        # Named attributes and data_sets share the same DataSet objects
+        assert endpoint.line_score is endpoint.data_sets[4]
+        assert not any(data_set.is_loaded() for data_set in endpoint.data_sets)
+
+        line_score = endpoint.line_score.get_data_frame()
+        assert len(line_score) == 2
+        assert endpoint.line_score.is_loaded()
+        mock_officials_data.assert_not_called()
+
+        assert endpoint.officials.get_dict()["data"] == []
+        mock_officials_data.assert_called_once()
@@ -0,0 +1,115 @@
+"""Unit tests for the V3 table spec compiler."""
+
+import pytest
+
+from nba_api.stats.endpoints._parsers._flatten import (
+    compile_table,
+    each,
+    fields,
+    items,
+    label,
+)
+
+BOXSCORE = {
+    "boxScore": {
+        "gameId": "0022400001",
+        "homeTeam": {
+            "teamId": 1,
+            "statistics": {"points": 110},
+            "players": [
+                {"personId": 10, "statistics": {"points": 30}},
+                {"personId": 11, "statistics": {"points": 12}},
+            ],
+        },
+        "awayTeam": {
+            "teamId": 2,
+            "statistics": {"points": 99},
+            "players": [{"personId": 20}],
+        },
+    }
+}
+
+
+class TestCompileTable:
+    """Test compiled table specs."""
+
+    def test_headers_follow_fields_in_order(self):
+        table = compile_table(
+            "boxScore",
+            fields("gameId"),
+            each("homeTeam", "awayTeam"),
+            fields("teamId"),
+            fields("points", path="statistics"),
+        )
+        assert table.headers == ("gameId", "teamId", "points")
+
+    def test_each_and_items_produce_one_row_per_object(self):
+        table = compile_table(
+            "boxScore",
+            fields("gameId"),
+            each("homeTeam", "awayTeam"),
+            fields("teamId"),
+            items("players"),
+            fields("personId"),
+            fields("points", path="statistics"),
+        )
+        assert table(BOXSCORE) == [
+            ["0022400001", 1, 10, 30],
+            ["0022400001", 1, 11, 12],
+            ["0022400001", 2, 20, None],
+        ]
+
+    def test_missing_objects_and_lists_are_empty(self):
+        table = compile_table(
+            "boxScore",
+            fields("gameId"),
+            each("homeTeam", "neutralTeam"),
+            fields("teamId"),
+            fields("points", path=("statistics", "totals")),
+        )
+        assert table(BOXSCORE) == [
+            ["0022400001", 1, None],
+            ["0022400001", None, None],
+        ]
+        assert compile_table(items("players"), fields("personId"))({}) == []
+
+    def test_missing_fields_in_a_group_are_none(self):
+        table = compile_table(
+            "boxScore",
+            each("homeTeam", "awayTeam"),
+            items("players"),
+            fields("personId", "jerseyNum"),
+            fields("points", "assists", path="statistics"),
+        )
+        assert table(BOXSCORE) == [
+            [10, None, 30, None],
+            [11, None, 12, None],
+            [20, None, None, None],
+        ]
+
+    def test_label_adds_the_each_label(self):
+        table = compile_table(
+            "boxScore",
+            each("homeTeam", "awayTeam", labels=("Home", "Away")),
+            label("side"),
+            fields("teamId"),
+        )
+        assert table.headers == ("side", "teamId")
+        assert table(BOXSCORE) == [["Home", 1], ["Away", 2]]
+
+    def test_rows_are_not_shared(self):
+        table = compile_table(
+            "boxScore", fields("gameId"), each("homeTeam", "awayTeam")
+        )
+        rows = table(BOXSCORE)
+        assert rows == [["0022400001"], ["0022400001"]]
+        rows[0].append("changed")
+        assert rows[1] == ["0022400001"]
+
+    def test_invalid_specs_raise(self):
+        with pytest.raises(ValueError):
+            each("homeTeam", "awayTeam", labels=("Home",))
+        with pytest.raises(ValueError):
+            compile_table(label())
+        with pytest.raises(ValueError):
+            compile_table(1)
@@ -91,7 +91,7 @@ class TestScoreboardV3Endpoint:
         mock_request.assert_called_once()
 
         # Verify get_data_sets was called with the endpoint name
-        mock_response.get_data_sets.assert_called_once_with("scoreboardv3")
+        mock_response.get_data_sets.assert_called_once_with("scoreboardv3", lazy=True)
 
         # Verify datasets are accessible
         assert hasattr(endpoint, "scoreboard_info")
@@ -0,0 +1,58 @@
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.batch import fetch_many
+from nba_api.library.http import NBAHTTP
+from nba_api.stats.endpoints import PlayerGameLog
+
+
+def make_response(params):
+    player_id = dict(params)["PlayerID"]
+    if player_id == 0:
+        raise requests.exceptions.ConnectionError("connection reset")
+    response = Mock()
+    response.text = (
+        '{"resultSets": [{"name": "PlayerGameLog", "headers": ["Player_ID"], '
+        '"rowSet": [[%d]]}]}' % player_id
+    )
+    response.status_code = 200
+    response.url = "https://stats.nba.com/stats/playergamelog"
+    return response
+
+
+@pytest.fixture(autouse=True)
+def mock_session():
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = lambda **kwargs: make_response(kwargs["params"])
+    NBAHTTP.set_session(session)
+    yield session
+    NBAHTTP._session = None
+
+
+def test_fetch_many_yields_every_request(mock_session):
+    kwargs_list = [{"player_id": player_id} for player_id in (2544, 201939, 203999)]
+
+    results = list(fetch_many(PlayerGameLog, kwargs_list, max_workers=3))
+
+    assert mock_session.get.call_count == 3
+    assert sorted(result.index for result in results) == [0, 1, 2]
+    for result in results:
+        assert result.ok
+        assert result.endpoint.player_game_log.get_dict()["data"] == [
+            [result.kwargs["player_id"]]
+        ]
+
+
+def test_fetch_many_reports_errors_per_item():
+    kwargs_list = [{"player_id": 2544}, {"player_id": 0}, {"bad_argument": 1}]
+
+    results = {result.index: result for result in fetch_many(PlayerGameLog, kwargs_list)}
+
+    assert results[0].ok
+    assert isinstance(results[1].error, requests.exceptions.ConnectionError)
+    assert isinstance(results[2].error, TypeError)
+
+
+def test_fetch_many_raise_on_error():
+    with pytest.raises(requests.exceptions.ConnectionError):
+        list(fetch_many(PlayerGameLog, [{"player_id": 0}], raise_on_error=True))
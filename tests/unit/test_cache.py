@@ -0,0 +1,337 @@
+import json
+import time
+import pytest
+import requests
+from unittest.mock import Mock
+from datetime import datetime, timedelta, timezone
+from nba_api.library.cache import (
+    FOREVER,
+    CachePolicy,
+    FileCache,
+    MemoryCache,
+    SQLiteCache,
+    get_cache_key,
+)
+from nba_api.library.http import NBAHTTP, NBAResponse
+from nba_api.stats.endpoints import PlayerGameLog
+
+value = {
+    "response": '{"resultSets": []}',
+    "status_code": 200,
+    "url": "https://stats.nba.com/stats/playergamelog?PlayerID=2544",
+}
+
+
+@pytest.fixture(params=["memory", "file", "sqlite"])
+def cache(request, tmp_path):
+    if request.param == "memory":
+        return MemoryCache(max_entries=2)
+    if request.param == "file":
+        return FileCache(str(tmp_path / "cache"), max_entries=2)
+    return SQLiteCache(str(tmp_path / "cache.sqlite"), max_entries=2)
+
+
+def test_get_cache_key_is_canonical():
+    url = "https://stats.nba.com/stats/playergamelog"
+    key = get_cache_key(url, [("DateFrom", None), ("PlayerID", 2544)])
+    assert key == "https://stats.nba.com/stats/playergamelog?DateFrom=&PlayerID=2544"
+
+
+def test_cache_hit_and_miss(cache):
+    assert cache.get("a") is None
+    cache.set("a", value)
+    assert cache.get("a") == value
+    assert cache.get_stats() == {"hits": 1, "misses": 1, "evictions": 0, "entries": 1}
+
+
+def test_cache_ttl_expires(cache):
+    cache.set("a", value, ttl=-1)
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_cache_evicts_least_recently_used(cache):
+    cache.set("a", value)
+    time.sleep(0.01)
+    cache.set("b", value)
+    time.sleep(0.01)
+    cache.get("a")
+    time.sleep(0.01)
+    cache.set("c", value)
+
+    assert cache.get("a") == value
+    assert cache.get("b") is None
+    assert cache.get("c") == value
+    assert cache.evictions == 1
+
+
+def test_cache_delete_and_clear(cache):
+    cache.set("a", value)
+    cache.set("b", value)
+    cache.delete("a")
+    assert cache.get("a") is None
+    cache.clear()
+    assert len(cache) == 0
+
+
+@pytest.fixture
+def mock_session():
+    session = Mock(spec=requests.Session)
+    response = Mock()
+    response.text = (
+        '{"resultSets": [{"name": "PlayerGameLog", "headers": ["Player_ID"], '
+        '"rowSet": [[2544]]}]}'
+    )
+    response.status_code = 200
+    response.url = "https://stats.nba.com/stats/playergamelog?PlayerID=2544"
+    session.get.return_value = response
+    NBAHTTP.set_session(session)
+    yield session
+    NBAHTTP._session = None
+    NBAHTTP._cache = None
+
+
+def test_send_api_request_uses_cache(mock_session):
+    cache = MemoryCache()
+    NBAHTTP.set_cache(cache)
+
+    first = PlayerGameLog(player_id=2544)
+    second = PlayerGameLog(player_id=2544)
+
+    assert mock_session.get.call_count == 1
+    assert second.get_dict() == first.get_dict()
+    assert second.get_request_url() == mock_session.get.return_value.url
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_send_api_request_does_not_cache_errors(mock_session):
+    mock_session.get.return_value.status_code = 500
+    NBAHTTP.set_cache(MemoryCache())
+
+    PlayerGameLog(player_id=2544)
+    PlayerGameLog(player_id=2544)
+
+    assert mock_session.get.call_count == 2
+    assert len(NBAHTTP.get_cache()) == 0
+
+
+def game_response(game_status, started):
+    return NBAResponse(
+        response='{"game": {"gameStatus": %d, "gameTimeUTC": "%s"}}'
+        % (game_status, started.strftime("%Y-%m-%dT%H:%M:%SZ")),
+        status_code=200,
+        url=None,
+    )
+
+
+def test_cache_policy_game_state_from_payload():
+    policy = CachePolicy()
+    now = datetime.now(timezone.utc)
+    endpoint = "boxscore/boxscore_0022000180.json"
+
+    old_final = game_response(3, now - timedelta(days=3))
+    recent_final = game_response(3, now - timedelta(hours=3))
+    in_progress = game_response(2, now - timedelta(hours=1))
+
+    assert policy.get_ttl(endpoint, {}, old_final) == FOREVER
+    assert policy.get_ttl(endpoint, {}, recent_final) == policy.recent_game_ttl
+    assert policy.get_ttl(endpoint, {}, in_progress) == policy.live_ttl
+
+
+def json_response(nba_dict):
+    return NBAResponse(response=json.dumps(nba_dict), status_code=200, url=None)
+
+
+def box_score_v3(minutes, home_points=116, away_points=117):
+    return {
+        "meta": {"version": 1},
+        "boxScoreTraditional": {
+            "gameId": current_game_id(),
+            "homeTeam": {"statistics": {"minutes": minutes, "points": home_points}},
+            "awayTeam": {"statistics": {"minutes": minutes, "points": away_points}},
+        },
+    }
+
+
+def current_game_id():
+    return "002{}00005".format(str(CachePolicy.get_current_season_year())[2:])
+
+
+def test_cache_policy_stats_v3_game_state():
+    policy = CachePolicy()
+    parameters = {"GameID": current_game_id()}
+    final = json_response(box_score_v3("240:00"))
+    overtime = json_response(box_score_v3("265:00"))
+    in_progress = json_response(box_score_v3("180:00"))
+    tied = json_response(box_score_v3("240:00", 100, 100))
+
+    assert (
+        policy.get_ttl("boxscoretraditionalv3", parameters, in_progress)
+        == policy.live_ttl
+    )
+    assert policy.get_ttl("boxscoretraditionalv3", parameters, tied) == policy.live_ttl
+
+    # Nothing dates the game yet: keep it until it is surely older than
+    # final_game_age.
+    assert (
+        policy.get_ttl("boxscoretraditionalv3", parameters, final)
+        == policy.final_game_age
+    )
+    assert (
+        policy.get_ttl("boxscoretraditionalv3", parameters, overtime)
+        == policy.final_game_age
+    )
+
+    # A scoreboard dates the game as weeks old.
+    started = datetime.now(timezone.utc) - timedelta(weeks=3)
+    scoreboard = {
+        "scoreboard": {
+            "games": [
+                {
+                    "gameId": current_game_id(),
+                    "gameStatus": 3,
+                    "gameTimeUTC": started.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                }
+            ]
+        }
+    }
+    policy.get_ttl("scoreboardv3", {}, json_response(scoreboard))
+    assert policy.get_ttl("boxscoretraditionalv3", parameters, final) == FOREVER
+
+    # Undated games become permanent once seen final for final_game_age.
+    policy = CachePolicy(final_game_age=0)
+    assert policy.get_ttl("boxscoretraditionalv3", parameters, final) == FOREVER
+
+    play_by_play = {
+        "game": {
+            "gameId": current_game_id(),
+            "actions": [
+                {
+                    "actionType": "period",
+                    "subType": "end",
+                    "period": 4,
+                    "scoreHome": "116",
+                    "scoreAway": "117",
+                }
+            ],
+        }
+    }
+    assert policy.get_ttl("playbyplayv3", parameters, json_response(play_by_play)) == (
+        FOREVER
+    )
+    play_by_play["game"]["actions"][0]["period"] = 3
+    assert (
+        policy.get_ttl("playbyplayv3", parameters, json_response(play_by_play))
+        == policy.live_ttl
+    )
+
+
+def test_cache_policy_remembers_a_bounded_number_of_games():
+    policy = CachePolicy(max_games=2)
+    started = datetime.now(timezone.utc) - timedelta(weeks=3)
+    scoreboard = {
+        "scoreboard": {
+            "games": [
+                {
+                    "gameId": game_id,
+                    "gameStatus": 3,
+                    "gameTimeUTC": started.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                }
+                for game_id in ("0022600001", "0022600002", "0022600003")
+            ]
+        }
+    }
+    policy.get_ttl("scoreboardv3", {}, json_response(scoreboard))
+    assert list(policy._game_times) == ["0022600002", "0022600003"]
+
+    final = box_score_v3("240:00")
+    for game_id in ("0022600004", "0022600005", "0022600006"):
+        final["boxScoreTraditional"]["gameId"] = game_id
+        policy.get_ttl("boxscoretraditionalv3", {}, json_response(final))
+    assert list(policy._final_games) == ["0022600005", "0022600006"]
+
+
+def test_cache_policy_live_feeds():
+    policy = CachePolicy()
+    game_id = current_game_id()
+    endpoint = "playbyplay/playbyplay_{}.json".format(game_id)
+    now = datetime.now(timezone.utc)
+
+    def play_by_play(action_type, sub_type, time_actual):
+        return json_response(
+            {
+                "game": {
+                    "gameId": game_id,
+                    "actions": [
+                        {
+                            "actionType": action_type,
+                            "subType": sub_type,
+                            "period": 2,
+                            "timeActual": time_actual.strftime(
+                                "%Y-%m-%dT%H:%M:%S.1Z"
+                            ),
+                        }
+                    ],
+                }
+            }
+        )
+
+    in_progress = play_by_play("2pt", "jump-shot", now)
+    ended = play_by_play("game", "end", now - timedelta(hours=1))
+    ended_long_ago = play_by_play("game", "end", now - timedelta(weeks=2))
+
+    assert policy.get_ttl(endpoint, {}, in_progress) == policy.live_ttl
+    assert policy.get_ttl(endpoint, {}, ended) == policy.recent_game_ttl
+    assert policy.get_ttl(endpoint, {}, ended_long_ago) == FOREVER
+    # A live feed the payload does not settle is still in play.
+    assert (
+        policy.get_ttl("boxscore/boxscore_{}.json".format(game_id), {}, None)
+        == policy.live_ttl
+    )
+    assert policy.get_ttl("boxscore/boxscore_0022000180.json", {}, None) == FOREVER
+
+
+def test_cache_policy_parameters():
+    policy = CachePolicy()
+    current = policy.get_current_season_year()
+    current_season = "{}-{}".format(current, str(current + 1)[2:])
+    current_game_id = "002{}00061".format(str(current)[2:])
+
+    assert policy.get_ttl("boxscoretraditionalv3", {"GameID": "0021000061"}) == FOREVER
+    assert (
+        policy.get_ttl("boxscoretraditionalv3", {"GameID": current_game_id})
+        == policy.recent_game_ttl
+    )
+    assert policy.get_ttl("leaguegamelog", {"Season": "2010-11"}) == FOREVER
+    assert (
+        policy.get_ttl("leaguegamelog", {"Season": current_season})
+        == policy.current_season_ttl
+    )
+    assert policy.get_ttl("scoreboardv3", {"GameDate": "2015-01-01"}) == FOREVER
+    today = datetime.now().strftime("%Y-%m-%d")
+    assert policy.get_ttl("scoreboardv3", {"GameDate": today}) == policy.live_ttl
+    assert policy.get_ttl("scoreboard/todaysscoreboard_00.json", {}) == policy.live_ttl
+    assert policy.get_ttl("commonallplayers", {"LeagueID": "00"}) is None
+
+
+def test_cache_policy_rules_take_precedence():
+    policy = CachePolicy()
+    policy.add_rule("playercareerstats", FOREVER)
+    policy.add_rule("leaguegamelog", lambda endpoint, parameters, data: 0)
+
+    assert policy.get_ttl("playercareerstats", {"PlayerID": 2544}) == FOREVER
+    assert policy.get_ttl("leaguegamelog", {"Season": "2010-11"}) == 0
+
+
+def test_cache_policy_forever_and_no_cache(mock_session):
+    policy = CachePolicy()
+    policy.add_rule("playergamelog", 0)
+    cache = MemoryCache(ttl=60, policy=policy)
+    NBAHTTP.set_cache(cache)
+
+    PlayerGameLog(player_id=2544)
+    assert len(cache) == 0
+
+    policy.rules = [("playergamelog", FOREVER)]
+    PlayerGameLog(player_id=2544)
+    assert cache._entries[next(iter(cache._entries))][1] is None
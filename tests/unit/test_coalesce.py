@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import time
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.coalesce import RequestCoalescer
+from nba_api.library.http import NBAHTTP
+from nba_api.stats.endpoints import PlayerGameLog
+
+
+def wait_until(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.001)
+
+
+def test_run_shares_result_between_threads():
+    coalescer = RequestCoalescer()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def function(value):
+        calls.append(value)
+        started.set()
+        release.wait(5)
+        return value * 2
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(coalescer.run("key", function, 21)))
+    leader.start()
+    started.wait(5)
+    followers = [
+        threading.Thread(target=lambda: results.append(coalescer.run("key", function, 21)))
+        for _ in range(3)
+    ]
+    for follower in followers:
+        follower.start()
+    wait_until(lambda: coalescer.coalesced == 3)
+    release.set()
+    for thread in [leader] + followers:
+        thread.join(5)
+
+    assert calls == [21]
+    assert results == [42, 42, 42, 42]
+    assert coalescer._futures == {}
+
+
+def test_run_raises_in_every_caller():
+    coalescer = RequestCoalescer()
+
+    def function():
+        raise ValueError("boom")
+
+    with pytest.raises(ValueError):
+        coalescer.run("key", function)
+    # The failed call is not remembered.
+    assert coalescer.run("key", lambda: 1) == 1
+
+
+def test_arun_shares_result_between_tasks():
+    coalescer = RequestCoalescer()
+    calls = []
+
+    async def function(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return value * 2
+
+    async def run():
+        return await asyncio.gather(
+            *(coalescer.arun("key", function, 21) for _ in range(4))
+        )
+
+    assert asyncio.run(run()) == [42, 42, 42, 42]
+    assert calls == [21]
+    assert coalescer.coalesced == 3
+
+
+def test_concurrent_endpoints_share_one_request():
+    release = threading.Event()
+    response = Mock()
+    response.text = (
+        '{"resultSets": [{"name": "PlayerGameLog", "headers": ["Player_ID"], '
+        '"rowSet": [[2544]]}]}'
+    )
+    response.status_code = 200
+    response.url = "https://stats.nba.com/stats/playergamelog"
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = lambda **kwargs: release.wait(5) and response
+    NBAHTTP.set_session(session)
+    coalesced = NBAHTTP._coalescer.coalesced
+
+    try:
+        endpoints = []
+        threads = [
+            threading.Thread(target=lambda: endpoints.append(PlayerGameLog(player_id=2544)))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        wait_until(lambda: NBAHTTP._coalescer.coalesced == coalesced + 3)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+    finally:
+        NBAHTTP._session = None
+
+    assert session.get.call_count == 1
+    assert len(endpoints) == 4
+    assert all(endpoint.player_game_log.get_dict()["data"] == [[2544]] for endpoint in endpoints)
@@ -1,8 +1,11 @@
+import asyncio
 import pytest
 import requests
 from unittest.mock import Mock
 from nba_api.library.http import NBAHTTP
-from nba_api.stats.endpoints import AllTimeLeadersGrids
+from nba_api.live.nba.library.http import NBALiveHTTP
+from nba_api.stats.endpoints import AllTimeLeadersGrids, PlayerGameLog
+from nba_api.stats.library.http import NBAStatsHTTP
 
 @pytest.fixture
 def mock_session():
@@ -63,6 +66,106 @@ def test_session_headers_persistence():
 def cleanup():
     # Reset session before each test
     NBAHTTP._session = None
+    NBAHTTP._async_client = None
     yield
     # Clean up after each test
     NBAHTTP._session = None
+    NBAHTTP._async_client = None
+
+
+def test_asend_api_request_uses_async_client():
+    httpx = pytest.importorskip("httpx")
+    requests_seen = []
+
+    def handler(request):
+        requests_seen.append(request)
+        return httpx.Response(
+            200,
+            text='{"resource": "playergamelog", "resultSets": '
+            '[{"name": "PlayerGameLog", "headers": ["SEASON_ID"], "rowSet": [["22024"]]}]}',
+        )
+
+    async def run():
+        client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+        NBAHTTP.set_async_client(client)
+        try:
+            endpoint = PlayerGameLog(player_id=2544, get_request=False)
+            await endpoint.aget_request()
+        finally:
+            await client.aclose()
+        return endpoint
+
+    endpoint = asyncio.run(run())
+
+    assert len(requests_seen) == 1
+    assert requests_seen[0].url.params["PlayerID"] == "2544"
+    assert endpoint.player_game_log.get_dict()["data"] == [["22024"]]
+
+
+def test_async_clients_are_pooled_per_host_and_proxy():
+    pytest.importorskip("httpx")
+
+    async def run():
+        first = NBAStatsHTTP.get_async_client()
+        second = NBAStatsHTTP.get_async_client()
+        live = NBALiveHTTP.get_async_client()
+        proxied = NBAStatsHTTP.get_async_client(proxy="http://127.0.0.1:8080")
+        await NBAHTTP.close_async_clients()
+        return first, second, live, proxied
+
+    first, second, live, proxied = asyncio.run(run())
+
+    assert first is second
+    assert first is not live
+    assert first is not proxied
+
+
+def test_nba_response_parses_body_once(monkeypatch):
+    from nba_api.library import jsonbackend
+
+    calls = []
+    loads = jsonbackend.loads
+
+    def counting_loads(*args, **kwargs):
+        calls.append(args)
+        return loads(*args, **kwargs)
+
+    monkeypatch.setattr(jsonbackend, "loads", counting_loads)
+    response = NBAStatsHTTP.nba_response(
+        response='{"parameters": {"PlayerID": 2544}, "resultSets": []}',
+        status_code=200,
+        url="https://stats.nba.com/stats/playergamelog",
+    )
+
+    assert response.valid_json()
+    assert response.get_parameters() == {"PlayerID": 2544}
+    assert response.get_normalized_dict() == {}
+    assert response.get_data_sets() == {}
+    assert response.get_dict() is response.get_dict()
+    assert len(calls) == 1
+
+    response.set_response('{"resultSets": []}')
+    assert response.get_dict() == {"resultSets": []}
+    assert len(calls) == 2
+
+
+def test_nba_response_invalid_json_is_remembered():
+    response = NBAHTTP.nba_response(response="<Error/>", status_code=500, url=None)
+    assert not response.valid_json()
+    with pytest.raises(ValueError):
+        response.get_dict()
+
+
+def test_nba_response_read_only_view():
+    response = NBAHTTP.nba_response(
+        response='{"resultSets": [{"rowSet": [[1, 2]]}]}', status_code=200, url=None
+    )
+    view = response.get_dict(read_only=True)
+
+    assert view["resultSets"][0]["rowSet"][0][1] == 2
+    assert list(view) == ["resultSets"]
+    with pytest.raises(TypeError):
+        view["resultSets"] = []
+    with pytest.raises(TypeError):
+        view["resultSets"][0]["rowSet"][0][1] = 3
+    assert response.get_dict()["resultSets"][0]["rowSet"][0][1] == 2
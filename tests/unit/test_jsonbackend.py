@@ -0,0 +1,36 @@
+import json
+import pytest
+from nba_api.library import jsonbackend
+
+payload = '{"resultSets": [{"name": "PlayerGameLog", "headers": ["PTS"], "rowSet": [[25.5]]}]}'
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    yield
+    jsonbackend.set_backend(None)
+
+
+@pytest.mark.parametrize("name", jsonbackend.get_available_backends())
+def test_backends_decode_like_the_standard_library(name):
+    jsonbackend.set_backend(name)
+    assert jsonbackend.get_backend().name == name
+    assert jsonbackend.loads(payload) == json.loads(payload)
+    assert json.loads(jsonbackend.dumps(json.loads(payload))) == json.loads(payload)
+
+
+def test_default_backend_keeps_standard_output_format():
+    jsonbackend.set_backend(None)
+    assert jsonbackend.get_backend().name == jsonbackend.get_available_backends()[0]
+    assert jsonbackend.dumps({"a": [1, 2]}) == json.dumps({"a": [1, 2]})
+
+
+def test_rejected_payloads_fall_back_to_the_standard_library():
+    assert jsonbackend.loads('{"PCT": NaN}')["PCT"] != 0
+    with pytest.raises(ValueError):
+        jsonbackend.loads("<Error><Message>An error has occurred.</Message></Error>")
+
+
+def test_missing_backend_raises():
+    with pytest.raises(Exception, match="Import Missing"):
+        jsonbackend.set_backend("not-a-json-library")
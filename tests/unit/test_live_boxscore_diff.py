@@ -0,0 +1,103 @@
+import copy
+import json
+from nba_api.library.http import NBAResponse
+from nba_api.live.nba.endpoints import BoxScore
+from nba_api.live.nba.endpoints.boxscore import get_box_score_diff
+from nba_api.live.nba.library.http import NBALiveHTTP
+
+
+def make_player(person_id, points=0):
+    return {
+        "personId": person_id,
+        "status": "ACTIVE",
+        "statistics": {"points": points, "assists": 0, "minutes": "PT00M00.00S"},
+    }
+
+
+game = {
+    "gameId": "0022000180",
+    "gameStatus": 2,
+    "period": 1,
+    "gameClock": "PT11M58.00S",
+    "arena": {"arenaId": 17, "arenaName": "TD Garden"},
+    "homeTeam": {
+        "teamId": 1610612738,
+        "score": 0,
+        "periods": [{"period": 1, "score": 0}],
+        "statistics": {"points": 0, "assists": 0},
+        "players": [make_player(1627759), make_player(1628369)],
+    },
+    "awayTeam": {
+        "teamId": 1610612753,
+        "score": 0,
+        "periods": [{"period": 1, "score": 0}],
+        "statistics": {"points": 0, "assists": 0},
+        "players": [make_player(202696)],
+    },
+}
+
+
+def test_unchanged_box_score_has_an_empty_diff():
+    assert get_box_score_diff(game, copy.deepcopy(game)) == {
+        "game": {},
+        "teams": {},
+        "players": {},
+    }
+
+
+def test_only_changed_fields_are_returned():
+    new = copy.deepcopy(game)
+    new["gameClock"] = "PT11M30.00S"
+    new["homeTeam"]["score"] = 2
+    new["homeTeam"]["periods"] = [{"period": 1, "score": 2}]
+    new["homeTeam"]["statistics"]["points"] = 2
+    new["homeTeam"]["players"][0]["statistics"]["points"] = 2
+
+    assert get_box_score_diff(game, new) == {
+        "game": {"gameClock": "PT11M30.00S"},
+        "teams": {
+            1610612738: {
+                "score": 2,
+                "periods": [{"period": 1, "score": 2}],
+                "statistics": {"points": 2},
+            }
+        },
+        "players": {1627759: {"statistics": {"points": 2}}},
+    }
+
+
+def test_added_and_removed_entries():
+    new = copy.deepcopy(game)
+    new["awayTeam"]["players"] = [make_player(203932, points=3)]
+    del new["arena"]["arenaName"]
+
+    diff = get_box_score_diff(game, new)
+
+    assert diff["game"] == {"arena": {"arenaName": None}}
+    assert diff["players"] == {203932: make_player(203932, points=3), 202696: None}
+    assert get_box_score_diff(None, game)["teams"][1610612753]["score"] == 0
+    assert "players" not in get_box_score_diff(None, game)["teams"][1610612753]
+
+
+def test_box_score_get_diff(monkeypatch):
+    new = copy.deepcopy(game)
+    new["period"] = 2
+    responses = [game, new]
+
+    def send_api_request(self, endpoint, parameters, **kwargs):
+        return NBAResponse(
+            response=json.dumps({"game": responses.pop(0)}),
+            status_code=200,
+            url=NBALiveHTTP.base_url.format(endpoint=endpoint),
+        )
+
+    monkeypatch.setattr(NBALiveHTTP, "send_api_request", send_api_request)
+    box_score = BoxScore("0022000180")
+    previous = box_score.game.get_dict()
+    earlier = BoxScore("0022000180", get_request=False)
+    earlier.game = box_score.game
+    box_score.get_request()
+
+    assert box_score.get_diff(previous)["game"] == {"period": 2}
+    assert box_score.get_diff(earlier)["game"] == {"period": 2}
+    assert box_score.get_diff(None)["players"].keys() == {1627759, 1628369, 202696}
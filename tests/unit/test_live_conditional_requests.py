@@ -0,0 +1,77 @@
+import json
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.http import NBAHTTP
+from nba_api.live.nba.endpoints import PlayByPlay
+from nba_api.live.nba.library.http import NBALiveHTTP
+
+content = json.dumps(
+    {"game": {"gameId": "0022000180", "actions": [{"actionNumber": 4}]}}
+)
+
+
+def make_response(status_code, text="", headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.text = text
+    response.headers = headers or {}
+    response.url = "https://cdn.nba.com/static/json/liveData/playbyplay/playbyplay_0022000180.json"
+    return response
+
+
+@pytest.fixture
+def mock_session():
+    session = Mock(spec=requests.Session)
+    NBALiveHTTP.set_session(session)
+    yield session
+    NBALiveHTTP._session = None
+    NBAHTTP._validators.clear()
+
+
+def test_not_modified_reuses_stored_body(mock_session):
+    mock_session.get.side_effect = [
+        make_response(
+            200,
+            content,
+            {"ETag": '"abc"', "Last-Modified": "Sat, 16 Jan 2021 03:00:00 GMT"},
+        ),
+        make_response(304),
+    ]
+
+    play_by_play = PlayByPlay("0022000180")
+    assert not play_by_play.unchanged
+    actions = play_by_play.actions
+
+    play_by_play.get_request()
+
+    headers = mock_session.get.call_args.kwargs["headers"]
+    assert headers["If-None-Match"] == '"abc"'
+    assert headers["If-Modified-Since"] == "Sat, 16 Jan 2021 03:00:00 GMT"
+    assert "If-None-Match" not in NBALiveHTTP.headers
+    assert play_by_play.unchanged
+    assert play_by_play.nba_response.is_not_modified()
+    assert play_by_play.get_dict() == json.loads(content)
+    # load_response() is skipped, so the loaded data is left untouched.
+    assert play_by_play.actions is actions
+
+
+def test_new_endpoint_loads_body_of_not_modified_response(mock_session):
+    mock_session.get.side_effect = [
+        make_response(200, content, {"ETag": '"abc"'}),
+        make_response(304),
+    ]
+
+    PlayByPlay("0022000180")
+    play_by_play = PlayByPlay("0022000180")
+
+    assert not play_by_play.unchanged
+    assert play_by_play.actions.get_dict() == [{"actionNumber": 4}]
+
+
+def test_response_without_validators_is_not_conditional(mock_session):
+    mock_session.get.side_effect = [make_response(200, content), make_response(200, content)]
+
+    PlayByPlay("0022000180").get_request()
+
+    assert "If-None-Match" not in mock_session.get.call_args.kwargs["headers"]
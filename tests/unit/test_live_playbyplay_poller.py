@@ -0,0 +1,128 @@
+import asyncio
+import json
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.http import NBAHTTP, NBAResponse
+from nba_api.live.nba.endpoints import PlayByPlayPoller
+from nba_api.live.nba.library.http import NBALiveHTTP
+
+game_id = "0022000180"
+
+
+def make_action(action_number, order_number, edited="2021-01-16T00:40:31Z"):
+    return {
+        "actionNumber": action_number,
+        "orderNumber": order_number,
+        "edited": edited,
+    }
+
+
+def make_response(actions, status_code=200, headers=None):
+    response = Mock()
+    response.status_code = status_code
+    response.text = (
+        json.dumps({"game": {"gameId": game_id, "actions": actions}})
+        if actions is not None
+        else ""
+    )
+    response.headers = headers or {}
+    response.url = "https://cdn.nba.com/static/json/liveData/playbyplay/playbyplay_0022000180.json"
+    return response
+
+
+@pytest.fixture
+def mock_session():
+    session = Mock(spec=requests.Session)
+    NBALiveHTTP.set_session(session)
+    yield session
+    NBALiveHTTP._session = None
+    NBAHTTP._validators.clear()
+
+
+def test_first_poll_returns_every_action(mock_session):
+    actions = [make_action(1, 10000), make_action(2, 20000)]
+    mock_session.get.return_value = make_response(actions)
+
+    poller = PlayByPlayPoller(game_id)
+    assert mock_session.get.call_count == 0
+
+    assert poller.poll() == actions
+    assert poller.last_action_number == 2
+    assert poller.last_order_number == 20000
+
+
+def test_polls_return_only_new_and_edited_actions(mock_session):
+    mock_session.get.side_effect = [
+        make_response([make_action(1, 10000), make_action(2, 20000)]),
+        make_response(
+            [
+                make_action(1, 10000),
+                make_action(2, 20000, edited="2021-01-16T00:41:02Z"),
+                make_action(4, 40000),
+            ]
+        ),
+        make_response(
+            [
+                make_action(1, 10000),
+                make_action(2, 20000, edited="2021-01-16T00:41:02Z"),
+                make_action(4, 30000, edited="2021-01-16T00:41:30Z"),
+            ]
+        ),
+    ]
+    poller = PlayByPlayPoller(game_id)
+    poller.poll()
+
+    assert poller.poll() == [
+        make_action(2, 20000, edited="2021-01-16T00:41:02Z"),
+        make_action(4, 40000),
+    ]
+    # An action moved to another orderNumber is edited.
+    assert poller.poll() == [make_action(4, 30000, edited="2021-01-16T00:41:30Z")]
+    assert poller.last_action_number == 4
+    assert poller.last_order_number == 40000
+    assert poller.last_edited == "2021-01-16T00:41:30Z"
+    assert poller.get_changed_actions() == []
+
+
+def test_not_modified_feed_returns_nothing(mock_session):
+    actions = [make_action(1, 10000)]
+    mock_session.get.side_effect = [
+        make_response(actions, headers={"ETag": '"abc"'}),
+        make_response(None, status_code=304),
+    ]
+    poller = PlayByPlayPoller(game_id)
+
+    assert poller.poll() == actions
+    assert poller.poll() == []
+    assert poller.play_by_play.unchanged
+
+
+def test_reset_returns_every_action_again(mock_session):
+    actions = [make_action(1, 10000)]
+    mock_session.get.return_value = make_response(actions)
+    poller = PlayByPlayPoller(game_id)
+    poller.poll()
+
+    poller.reset()
+
+    assert poller.last_action_number is None
+    assert poller.last_edited is None
+    assert poller.poll() == actions
+
+
+def test_apoll(monkeypatch):
+    actions = [make_action(1, 10000)]
+
+    async def asend_api_request(self, endpoint, parameters, **kwargs):
+        return NBAResponse(
+            response=json.dumps({"game": {"gameId": game_id, "actions": actions}}),
+            status_code=200,
+            url=NBALiveHTTP.base_url.format(endpoint=endpoint),
+        )
+
+    monkeypatch.setattr(NBALiveHTTP, "asend_api_request", asend_api_request)
+    poller = PlayByPlayPoller(game_id)
+
+    assert asyncio.run(poller.apoll()) == actions
+    assert asyncio.run(poller.apoll()) == []
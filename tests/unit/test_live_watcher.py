@@ -0,0 +1,206 @@
+import asyncio
+import json
+import pytest
+from nba_api.library.http import NBAResponse
+from nba_api.live.nba import watcher
+from nba_api.live.nba.library.http import NBALiveHTTP
+from nba_api.live.nba.watcher import GameWatcher, get_game_state
+
+
+def make_scoreboard_game(game_id, game_status, game_status_text=""):
+    return {
+        "gameId": game_id,
+        "gameStatus": game_status,
+        "gameStatusText": game_status_text,
+    }
+
+
+def make_box_score(game_id, home_score=0):
+    return {
+        "game": {
+            "gameId": game_id,
+            "homeTeam": {"teamId": 1610612738, "score": home_score, "players": []},
+            "awayTeam": {"teamId": 1610612753, "score": 0, "players": []},
+        }
+    }
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, delay):
+        self.now += delay
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(watcher, "time", clock)
+    monkeypatch.setattr(watcher.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+@pytest.fixture
+def feeds(monkeypatch, clock):
+    # Endpoint prefix -> function of the clock returning the response body.
+    feeds = {}
+    requested = []
+
+    async def asend_api_request(self, endpoint, parameters, **kwargs):
+        requested.append((clock.now, endpoint))
+        body = feeds[endpoint.split("/")[0]](clock.now)
+        if isinstance(body, Exception):
+            raise body
+        return NBAResponse(
+            response=json.dumps(body),
+            status_code=200,
+            url=NBALiveHTTP.base_url.format(endpoint=endpoint),
+        )
+
+    monkeypatch.setattr(NBALiveHTTP, "asend_api_request", asend_api_request)
+    feeds["requested"] = requested
+    return feeds
+
+
+def collect(game_watcher):
+    async def run():
+        return [event async for event in game_watcher.events()]
+
+    return asyncio.run(run())
+
+
+def test_get_game_state():
+    assert get_game_state(make_scoreboard_game("1", 1)) == "pregame"
+    assert get_game_state(make_scoreboard_game("1", 2, "Q2 5:12")) == "live"
+    assert get_game_state(make_scoreboard_game("1", 2, "Half")) == "halftime"
+    assert get_game_state(make_scoreboard_game("1", 3, "Final")) == "final"
+
+
+def test_watches_live_games_until_final(feeds, clock):
+    feeds["scoreboard"] = lambda now: {
+        "scoreboard": {
+            "gameDate": "2021-01-16",
+            "games": [
+                make_scoreboard_game("A", 3 if now >= 30 else 2),
+                make_scoreboard_game("B", 3 if now >= 30 else 1),
+            ],
+        }
+    }
+    feeds["boxscore"] = lambda now: make_box_score("A", 100 if now >= 30 else 50)
+    feeds["playbyplay"] = lambda now: {
+        "game": {
+            "gameId": "A",
+            "actions": [{"actionNumber": 1, "orderNumber": 10000}]
+            + ([{"actionNumber": 2, "orderNumber": 20000}] if now >= 30 else []),
+        }
+    }
+
+    events = collect(GameWatcher(scoreboard_interval=30))
+
+    assert [(event.kind, event.game_id, event.state) for event in events] == [
+        ("game", "A", "live"),
+        ("game", "B", "pregame"),
+        ("boxscore", "A", "live"),
+        ("actions", "A", "live"),
+        ("game", "A", "final"),
+        ("game", "B", "final"),
+        ("boxscore", "A", "final"),
+        ("actions", "A", "final"),
+    ]
+    assert events[-1].data == [{"actionNumber": 2, "orderNumber": 20000}]
+    assert events[-2].data["homeTeam"]["score"] == 100
+    assert events[-2].diff["teams"] == {1610612738: {"score": 100}}
+
+    requested = feeds["requested"]
+    # The pregame game is never polled, the live game every 5 seconds, and
+    # once more after it ends.
+    assert not any("_B" in endpoint for _, endpoint in requested)
+    box_score_polls = [now for now, endpoint in requested if "boxscore" in endpoint]
+    assert box_score_polls == [0, 5, 10, 15, 20, 25, 30, 30]
+
+
+def test_halftime_uses_its_interval(feeds, clock):
+    feeds["scoreboard"] = lambda now: {
+        "scoreboard": {
+            "gameDate": "2021-01-16",
+            "games": [make_scoreboard_game("A", 3 if now >= 60 else 2, "Half")],
+        }
+    }
+    feeds["boxscore"] = lambda now: make_box_score("A")
+    feeds["playbyplay"] = lambda now: {"game": {"gameId": "A", "actions": []}}
+
+    collect(GameWatcher(scoreboard_interval=60, intervals={"halftime": 20}))
+
+    box_score_polls = [
+        now for now, endpoint in feeds["requested"] if "boxscore" in endpoint
+    ]
+    assert box_score_polls == [0, 20, 40, 60, 60]
+
+
+def test_callbacks_errors_and_game_filter(feeds, clock):
+    feeds["scoreboard"] = lambda now: {
+        "scoreboard": {
+            "gameDate": "2021-01-16",
+            "games": [
+                make_scoreboard_game("A", 3 if now >= 10 else 2),
+                make_scoreboard_game("B", 2),
+            ],
+        }
+    }
+    feeds["boxscore"] = lambda now: ValueError("403 Forbidden")
+    feeds["playbyplay"] = lambda now: {"game": {"gameId": "A", "actions": []}}
+    seen = []
+    game_watcher = GameWatcher(game_ids=["A"], scoreboard_interval=10)
+    game_watcher.add_callback(seen.append)
+
+    asyncio.run(game_watcher.run())
+
+    assert list(game_watcher.games) == ["A"]
+    errors = [event for event in seen if event.kind == "error"]
+    assert errors and all(event.game_id == "A" for event in errors)
+    assert isinstance(errors[0].data, ValueError)
+    assert seen[-1].state == "final"
+
+
+def test_stop(feeds, clock):
+    feeds["scoreboard"] = lambda now: {
+        "scoreboard": {
+            "gameDate": "2021-01-16",
+            "games": [make_scoreboard_game("A", 1)],
+        }
+    }
+    game_watcher = GameWatcher()
+    game_watcher.add_callback(lambda event: game_watcher.stop())
+
+    asyncio.run(game_watcher.run())
+
+    assert len(feeds["requested"]) == 1
+
+
+def test_waits_for_watched_games_to_be_listed(feeds, clock):
+    feeds["scoreboard"] = lambda now: {
+        "scoreboard": {
+            "gameDate": "2021-01-16",
+            "games": []
+            if now < 60
+            else [
+                make_scoreboard_game("A", 3),
+                make_scoreboard_game("B", 3 if now >= 90 else 1),
+            ],
+        }
+    }
+
+    events = collect(GameWatcher(game_ids=["B"], scoreboard_interval=30))
+
+    assert [(event.game_id, event.state) for event in events] == [
+        ("B", "pregame"),
+        ("B", "final"),
+    ]
+    scoreboard_polls = [
+        now for now, endpoint in feeds["requested"] if "scoreboard" in endpoint
+    ]
+    assert scoreboard_polls == [0, 30, 60, 90]
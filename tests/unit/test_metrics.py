@@ -0,0 +1,99 @@
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library import metrics
+from nba_api.library.cache import MemoryCache
+from nba_api.library.http import NBAHTTP
+from nba_api.library.retry import RetryPolicy
+from nba_api.stats.endpoints import PlayerGameLog
+
+contents = (
+    '{"resultSets": [{"name": "PlayerGameLog", "headers": ["Player_ID"], '
+    '"rowSet": [[2544]]}]}'
+)
+
+
+def make_response(status_code=200, text=contents):
+    response = Mock()
+    response.text = text
+    response.content = text.encode("utf-8")
+    response.raw.tell.return_value = 42
+    response.status_code = status_code
+    response.url = "https://stats.nba.com/stats/playergamelog"
+    return response
+
+
+@pytest.fixture(autouse=True)
+def mock_session():
+    session = Mock(spec=requests.Session)
+    session.get.return_value = make_response()
+    NBAHTTP.set_session(session)
+    yield session
+    NBAHTTP._session = None
+    NBAHTTP._cache = None
+    NBAHTTP._retry_policy = None
+    metrics.clear_hooks()
+
+
+def test_response_carries_metrics(mock_session):
+    game_log = PlayerGameLog(player_id=2544)
+
+    request_metrics = game_log.nba_response.metrics
+    assert request_metrics.endpoint == "playergamelog"
+    assert request_metrics.source == "network"
+    assert request_metrics.status_code == 200
+    assert request_metrics.attempts == 1
+    assert request_metrics.wire_bytes == 42
+    assert request_metrics.decoded_bytes == len(contents)
+    assert request_metrics.ttfb >= 0
+    assert request_metrics.parse > 0
+    assert request_metrics.total >= request_metrics.ttfb
+    assert mock_session.get.call_args.kwargs["stream"] is True
+
+
+def test_hooks_receive_metrics_with_parse_time():
+    seen = []
+    metrics.add_hook(seen.append)
+
+    PlayerGameLog(player_id=2544)
+
+    assert len(seen) == 1
+    assert seen[0].endpoint == "playergamelog"
+    assert seen[0].parse > 0
+
+    metrics.remove_hook(seen.append)
+    PlayerGameLog(player_id=2544)
+    assert len(seen) == 1
+
+
+def test_cache_hits_are_reported(mock_session):
+    seen = []
+    metrics.add_hook(seen.append)
+    NBAHTTP.set_cache(MemoryCache())
+
+    PlayerGameLog(player_id=2544)
+    PlayerGameLog(player_id=2544)
+
+    assert [m.source for m in seen] == ["network", "cache"]
+    assert seen[1].attempts == 0
+    assert mock_session.get.call_count == 1
+
+
+def test_retries_are_counted(mock_session, monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda delay: None)
+    mock_session.get.side_effect = [make_response(status_code=500), make_response()]
+    NBAHTTP.set_retry_policy(
+        RetryPolicy(max_retries=2, backoff_factor=0.25, jitter=False)
+    )
+
+    game_log = PlayerGameLog(player_id=2544)
+
+    assert game_log.nba_response.metrics.attempts == 2
+    assert game_log.nba_response.metrics.queue_wait >= 0.25
+
+
+def test_wire_bytes_falls_back_to_content_length():
+    response = Mock(spec=["headers"])
+    response.headers = {"Content-Length": "128"}
+    assert metrics.get_wire_bytes(response) == 128
+    assert metrics.get_wire_bytes(Mock(spec=[]), default=7) == 7
@@ -0,0 +1,81 @@
+import pytest
+import requests
+from collections import Counter
+from unittest.mock import Mock
+from nba_api.library.http import NBAHTTP
+from nba_api.library.proxy import ProxyPool
+from nba_api.stats.endpoints import PlayerGameLog
+
+fast = "http://10.0.0.1:3128"
+slow = "http://10.0.0.2:3128"
+dead = "http://10.0.0.3:3128"
+
+
+def test_select_prefers_fast_proxies():
+    pool = ProxyPool([fast, slow])
+    pool.report_success(fast, 0.1)
+    pool.report_success(slow, 1.0)
+
+    picks = Counter(pool.select() for _ in range(2000))
+
+    assert picks[fast] > picks[slow] * 5
+
+
+def test_latency_is_an_ewma():
+    pool = ProxyPool([fast], alpha=0.5)
+    pool.report_success(fast, 1.0)
+    pool.report_success(fast, 0.0)
+    assert pool.get_stats()[0]["latency"] == 0.5
+
+
+def test_failed_proxy_cools_down():
+    pool = ProxyPool([fast, dead], cooldown=60)
+    pool.report_failure(dead)
+
+    assert {pool.select() for _ in range(100)} == {fast}
+    stats = {stats["proxy"]: stats for stats in pool.get_stats()}
+    assert stats[dead]["cooling_down"]
+    assert stats[dead]["failures"] == 1
+
+
+def test_cooldown_doubles_and_resets_on_success():
+    pool = ProxyPool([dead], cooldown=10, max_cooldown=25)
+    pool.report_failure(dead)
+    first = pool._stats[dead].cooldown_until
+    pool.report_failure(dead)
+    pool.report_failure(dead)
+    assert pool._stats[dead].cooldown_until - first == pytest.approx(15, abs=1)
+
+    # With every proxy cooling down, the one that recovers first is used.
+    assert pool.select() == dead
+    pool.report_success(dead, 0.2)
+    assert pool._stats[dead].consecutive_failures == 0
+    assert not pool.get_stats()[0]["cooling_down"]
+
+
+def test_ban_status_codes_count_as_failures():
+    pool = ProxyPool([fast])
+    pool.report(fast, 429, 0.1)
+    assert pool.get_stats()[0]["failures"] == 1
+
+
+def test_empty_pool():
+    with pytest.raises(ValueError):
+        ProxyPool([])
+
+
+def test_proxy_list_uses_shared_pool():
+    session = Mock(spec=requests.Session)
+    session.get.side_effect = requests.exceptions.ProxyError("unreachable")
+    NBAHTTP.set_session(session)
+    try:
+        with pytest.raises(requests.exceptions.ProxyError):
+            PlayerGameLog(player_id=2544, proxy=[fast, dead])
+    finally:
+        NBAHTTP._session = None
+
+    used = session.get.call_args.kwargs["proxies"]["https"]
+    pool = NBAHTTP.get_proxy_pool([fast, dead])
+    stats = {stats["proxy"]: stats for stats in pool.get_stats()}
+    assert stats[used]["failures"] == 1
+    NBAHTTP._proxy_pools.clear()
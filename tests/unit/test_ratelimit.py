@@ -0,0 +1,81 @@
+import asyncio
+import time
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.http import NBAHTTP
+from nba_api.library.ratelimit import RateLimiter
+from nba_api.stats.endpoints import PlayerGameLog
+from nba_api.stats.library.http import NBAStatsHTTP
+
+
+def test_rate_limiter_allows_burst_then_paces():
+    rate_limiter = RateLimiter(rate=50, burst=2)
+
+    assert rate_limiter.acquire() == 0
+    assert rate_limiter.acquire() == 0
+    start = time.monotonic()
+    waited = rate_limiter.acquire()
+
+    assert waited == pytest.approx(0.02, abs=0.01)
+    assert time.monotonic() - start >= 0.015
+
+
+def test_rate_limiter_async_acquire():
+    rate_limiter = RateLimiter(rate=50, burst=1)
+
+    async def run():
+        return await asyncio.gather(*(rate_limiter.aacquire() for _ in range(3)))
+
+    waits = asyncio.run(run())
+
+    assert sorted(waits) == pytest.approx([0, 0.02, 0.04], abs=0.01)
+
+
+def test_rate_limiter_backs_off_and_recovers():
+    rate_limiter = RateLimiter(rate=8, min_rate=1, recovery_step=0.5)
+
+    rate_limiter.report_failure()
+    assert rate_limiter.current_rate == 4
+    for _ in range(5):
+        rate_limiter.report_failure()
+    assert rate_limiter.current_rate == 1
+
+    rate_limiter.report_success()
+    assert rate_limiter.current_rate == 5
+    rate_limiter.report_success()
+    assert rate_limiter.current_rate == 8
+
+
+def test_rate_limiter_invalid_rate():
+    with pytest.raises(ValueError):
+        RateLimiter(rate=0)
+
+
+@pytest.fixture
+def mock_session():
+    session = Mock(spec=requests.Session)
+    NBAHTTP.set_session(session)
+    yield session
+    NBAHTTP._session = None
+    NBAStatsHTTP._rate_limiter = None
+
+
+def test_send_api_request_reports_to_rate_limiter(mock_session):
+    rate_limiter = RateLimiter(rate=1000, burst=10)
+    NBAStatsHTTP.set_rate_limiter(rate_limiter)
+
+    response = Mock()
+    response.text = '{"Message":"An error has occurred."}'
+    response.status_code = 200
+    response.url = "https://stats.nba.com/stats/playergamelog"
+    mock_session.get.return_value = response
+
+    with pytest.raises(ValueError):
+        PlayerGameLog(player_id=2544)
+    assert rate_limiter.current_rate == 500
+
+    mock_session.get.side_effect = requests.exceptions.ReadTimeout()
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        PlayerGameLog(player_id=2544)
+    assert rate_limiter.current_rate == 250
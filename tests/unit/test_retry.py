@@ -0,0 +1,102 @@
+import asyncio
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.http import NBAHTTP
+from nba_api.library.retry import RetryBudget, RetryPolicy
+from nba_api.stats.endpoints import PlayerGameLog
+
+contents = (
+    '{"resultSets": [{"name": "PlayerGameLog", "headers": ["Player_ID"], '
+    '"rowSet": [[2544]]}]}'
+)
+
+
+def make_response(status_code=200, text=contents):
+    response = Mock()
+    response.text = text
+    response.status_code = status_code
+    response.url = "https://stats.nba.com/stats/playergamelog"
+    return response
+
+
+@pytest.fixture(autouse=True)
+def mock_session():
+    session = Mock(spec=requests.Session)
+    NBAHTTP.set_session(session)
+    yield session
+    NBAHTTP._session = None
+    NBAHTTP._retry_policy = None
+
+
+def test_retry_policy_backoff_without_jitter():
+    retry_policy = RetryPolicy(max_retries=4, backoff_factor=1, max_backoff=5, jitter=False)
+    delays = [retry_policy.get_delay(attempt, "url") for attempt in range(5)]
+    assert delays == [1, 2, 4, 5, None]
+
+
+def test_retry_policy_jitter_stays_in_bounds():
+    retry_policy = RetryPolicy(max_retries=10, backoff_factor=1, max_backoff=8)
+    for attempt in range(10):
+        assert 0 <= retry_policy.get_delay(attempt, "url") <= min(8, 2**attempt)
+
+
+def test_retry_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, reserve=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+def test_send_api_request_retries_transient_failures(mock_session):
+    events = []
+    retry_policy = RetryPolicy(max_retries=3, backoff_factor=0)
+    retry_policy.add_hook(events.append)
+    NBAHTTP.set_retry_policy(retry_policy)
+    mock_session.get.side_effect = [
+        requests.exceptions.ConnectionError("reset"),
+        make_response(status_code=503, text="Service Unavailable"),
+        make_response(),
+    ]
+
+    endpoint = PlayerGameLog(player_id=2544)
+
+    assert mock_session.get.call_count == 3
+    assert endpoint.player_game_log.get_dict()["data"] == [[2544]]
+    assert [event.attempt for event in events] == [1, 2]
+    assert isinstance(events[0].error, requests.exceptions.ConnectionError)
+    assert events[1].status_code == 503
+
+
+def test_send_api_request_gives_up_after_max_retries(mock_session):
+    NBAHTTP.set_retry_policy(RetryPolicy(max_retries=2, backoff_factor=0))
+    mock_session.get.side_effect = requests.exceptions.ReadTimeout()
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        PlayerGameLog(player_id=2544)
+
+    assert mock_session.get.call_count == 3
+
+
+def test_send_api_request_without_retry_policy(mock_session):
+    mock_session.get.side_effect = requests.exceptions.ReadTimeout()
+
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        PlayerGameLog(player_id=2544)
+
+    assert mock_session.get.call_count == 1
+
+
+def test_async_retries_without_httpx(monkeypatch):
+    from nba_api.library import http
+
+    monkeypatch.setattr(http, "HTTPX", False)
+    monkeypatch.setattr(http, "ASYNC_TRANSPORT_ERRORS", ())
+    monkeypatch.delattr(http, "httpx", raising=False)
+    NBAHTTP.set_retry_policy(RetryPolicy(max_retries=2, backoff_factor=0))
+    endpoint = PlayerGameLog(player_id=2544, get_request=False)
+
+    with pytest.raises(Exception, match="Import Missing"):
+        asyncio.run(endpoint.aget_request())
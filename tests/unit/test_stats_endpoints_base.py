@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 from pandas import DataFrame
 from nba_api.stats.endpoints._base import Endpoint
@@ -19,6 +21,23 @@ def test_headers_empty():
     assert result.empty
 
 
+def test_data_set_loader_runs_once_on_first_access():
+    calls = []
+
+    def loader():
+        calls.append(1)
+        return {"headers": ["A"], "data": [[1]]}
+
+    data_set = Endpoint.DataSet(loader=loader)
+    assert not data_set.is_loaded()
+    assert calls == []
+
+    assert data_set.get_dict() == {"headers": ["A"], "data": [[1]]}
+    assert data_set.get_data_frame()["A"].tolist() == [1]
+    assert data_set.is_loaded()
+    assert calls == [1]
+
+
 def test_headers_present_and_nonempty():
     data = {"headers": ["GAME_ID", "LEAG_TIX"], "data": [], }
     instance = Endpoint.DataSet(data)
@@ -26,3 +45,177 @@ def test_headers_present_and_nonempty():
     assert isinstance(result, DataFrame)
     assert result.empty
     assert list(result.columns) == ["GAME_ID", "LEAG_TIX"]
+
+
+schema_data = {
+    "headers": ["GAME_ID", "TEAM_ID", "GAME_DATE", "FG_PCT", "PTS", "WL"],
+    "data": [
+        ["0022400001", 1610612747, "APR 14, 2024", 1, 110, "W"],
+        ["0022400002", None, "APR 12, 2024", None, 98, "L"],
+    ],
+}
+schema = {
+    "GAME_ID": "str",
+    "TEAM_ID": "int",
+    "GAME_DATE": "date",
+    "FG_PCT": "float",
+    "WL": "category",
+}
+
+
+def test_data_frame_applies_schema():
+    data_frame = Endpoint.DataSet(schema_data, schema=schema).get_data_frame()
+
+    assert data_frame["GAME_ID"].tolist() == ["0022400001", "0022400002"]
+    assert str(data_frame["TEAM_ID"].dtype) == "Int64"
+    assert data_frame["TEAM_ID"].isna().tolist() == [False, True]
+    assert str(data_frame["GAME_DATE"].dtype).startswith("datetime64")
+    assert data_frame["GAME_DATE"].dt.day.tolist() == [14, 12]
+    assert data_frame["FG_PCT"].dtype == "float64"
+    assert data_frame["PTS"].dtype == "int64"
+    assert data_frame["WL"].dtype != "category"
+
+
+def test_categorical_mode_dictionary_encodes_category_columns():
+    data_set = Endpoint.DataSet(schema_data, schema=schema)
+
+    data_frame = data_set.get_data_frame(categorical=True)
+    assert data_frame["WL"].dtype == "category"
+    assert list(data_frame["WL"].cat.categories) == ["L", "W"]
+    assert data_frame["WL"].tolist() == ["W", "L"]
+    assert data_frame["GAME_ID"].dtype != "category"
+
+
+def test_schema_falls_back_to_inference_for_values_that_do_not_fit():
+    data = {"headers": ["TEAM_ID", "GAME_DATE"], "data": [["LAL", "TBD"]]}
+    schema = {"TEAM_ID": "int", "GAME_DATE": "date"}
+    data_frame = Endpoint.DataSet(data, schema=schema).get_data_frame()
+
+    assert data_frame.to_dict("records") == [{"TEAM_ID": "LAL", "GAME_DATE": "TBD"}]
+
+
+def test_schema_can_be_disabled(monkeypatch):
+    monkeypatch.setattr(Endpoint.DataSet, "use_schema", False)
+    data_frame = Endpoint.DataSet(schema_data, schema=schema).get_data_frame()
+
+    assert data_frame["TEAM_ID"].dtype == "float64"
+    assert data_frame["GAME_DATE"].tolist() == ["APR 14, 2024", "APR 12, 2024"]
+
+
+@pytest.fixture
+def columnar():
+    Endpoint.DataSet.columnar = True
+    yield
+    Endpoint.DataSet.columnar = False
+
+
+def test_column_dtypes_are_inferred_from_headers_and_values():
+    data = {
+        "headers": ["GAME_ID", "PLAYER_ID", "PTS", "FG3_PCT", "PLUS_MINUS"],
+        "data": [["0022400001", 2544, 30, 1, None], ["0022400002", 2544, 20, 0, 5]],
+    }
+    columns = Endpoint.DataSet(data).get_columns()
+    assert columns["GAME_ID"].dtype == object
+    assert columns["PLAYER_ID"].dtype == "int64"
+    assert columns["PTS"].dtype == "int64"
+    assert columns["FG3_PCT"].dtype == "float64"
+    assert columns["PLUS_MINUS"].dtype == "float64"
+    assert list(columns["GAME_ID"]) == ["0022400001", "0022400002"]
+
+
+def test_columnar_data_frame_matches_row_data_frame(columnar):
+    data = {
+        "headers": ["GAME_ID", "PLAYER_ID", "FG_PCT", "MIN"],
+        "data": [["0022400001", 2544, 0.5, "36:00"], ["0022400002", 2544, 1, "30:00"]],
+    }
+    data_set = Endpoint.DataSet(data)
+    result = data_set.get_data_frame()
+    Endpoint.DataSet.columnar = False
+    expected = Endpoint.DataSet(data).get_data_frame()
+
+    assert result.equals(expected)
+    assert data_set.get_column_arrays() is data_set.get_column_arrays()
+
+
+def test_columnar_data_frame_keeps_multiindex(columnar):
+    data = {
+        "headers": [
+            {"name": "SHOT_CATEGORY", "columnsToSkip": 1, "columnSpan": 2, "columnNames": ["A", "B"]},
+            {"name": "COLUMNS", "columnNames": ["TEAM", "FGM", "FGA", "FGM", "FGA"]},
+        ],
+        "data": [["X", 1, 2, 3, 4]],
+    }
+    data_set = Endpoint.DataSet(data)
+    result = data_set.get_data_frame()
+    assert result.columns.names == ["SHOT_CATEGORY", "COLUMNS"]
+    assert result[("A", "FGA")].tolist() == [2]
+    assert list(data_set.get_columns())[1] == ("A", "FGM")
+
+
+shot_area_data = {
+    "headers": [
+        {"name": "SHOT_CATEGORY", "columnsToSkip": 1, "columnSpan": 2, "columnNames": ["Restricted Area", "Mid-Range"]},
+        {"name": "COLUMNS", "columnNames": ["TEAM_NAME", "FGM", "FG_PCT", "FGM", "FG_PCT"]},
+    ],
+    "data": [["Cavaliers", 10, 0.5, 3, None], ["Warriors", 12, 1, 4, 0.25]],
+}
+
+
+def test_multiindex_is_reused_for_the_same_headers():
+    first = Endpoint.DataSet(shot_area_data).get_data_frame()
+    second = Endpoint.DataSet(
+        {"headers": copy.deepcopy(shot_area_data["headers"]), "data": []}
+    ).get_data_frame()
+
+    assert first.columns is not second.columns
+    assert first.columns.equals(second.columns)
+    assert first.columns.names == ["SHOT_CATEGORY", "COLUMNS"]
+    assert list(first.columns[:3]) == [
+        ("", "TEAM_NAME"),
+        ("Restricted Area", "FGM"),
+        ("Restricted Area", "FG_PCT"),
+    ]
+
+
+def test_multiindex_changes_do_not_leak_between_data_frames():
+    first = Endpoint.DataSet(shot_area_data).get_data_frame()
+    first.columns.names = ["AREA", "STAT"]
+
+    second = Endpoint.DataSet(shot_area_data).get_data_frame()
+
+    assert second.columns.names == ["SHOT_CATEGORY", "COLUMNS"]
+    assert ("Restricted Area", "FGM") in second.columns
+
+
+def test_get_arrow_table():
+    pyarrow = pytest.importorskip("pyarrow")
+    data = {"headers": ["GAME_ID", "PLAYER_ID", "FG_PCT"], "data": [["0022400001", 2544, None]]}
+    table = Endpoint.DataSet(data).get_arrow_table()
+    assert table.column_names == ["GAME_ID", "PLAYER_ID", "FG_PCT"]
+    assert table.schema.field("PLAYER_ID").type == pyarrow.int64()
+    assert table.to_pylist() == [{"GAME_ID": "0022400001", "PLAYER_ID": 2544, "FG_PCT": None}]
+
+
+def test_get_arrow_table_multiindex():
+    pytest.importorskip("pyarrow")
+    data_set = Endpoint.DataSet(shot_area_data)
+
+    flat = data_set.get_arrow_table()
+    assert flat.column_names[:3] == ["TEAM_NAME", "Restricted Area_FGM", "Restricted Area_FG_PCT"]
+
+    nested = data_set.get_arrow_table(multi_index="struct")
+    assert nested.column_names == ["TEAM_NAME", "Restricted Area", "Mid-Range"]
+    assert nested.to_pylist()[0]["Mid-Range"] == {"FGM": 3, "FG_PCT": None}
+
+
+def test_get_polars_frame_multiindex():
+    pytest.importorskip("polars")
+    data_set = Endpoint.DataSet(shot_area_data)
+
+    flat = data_set.get_polars_frame()
+    assert flat.columns[3:] == ["Mid-Range_FGM", "Mid-Range_FG_PCT"]
+    assert flat["Mid-Range_FG_PCT"].to_list() == [None, 0.25]
+
+    nested = data_set.get_polars_frame(multi_index="struct")
+    assert nested.columns == ["TEAM_NAME", "Restricted Area", "Mid-Range"]
+    assert nested["Restricted Area"].to_list()[1] == {"FGM": 12, "FG_PCT": 1.0}
@@ -792,6 +792,17 @@ class TestNBAStatsResponse:
             == response["exp_normalized_dict"]
         )
 
+    def test_get_normalized_dict_lazy(self, response):
+        assert (
+            self.nbastatsresponse(response).get_normalized_dict(lazy=True)
+            == response["exp_normalized_dict"]
+        )
+
+    def test_get_data_set_names(self, response):
+        assert list(self.nbastatsresponse(response).get_data_set_names()) == list(
+            response["exp_normalized_dict"]
+        )
+
     def test_get_normalized_json(self, response):
         assert (
             self.nbastatsresponse(response).get_normalized_json()
@@ -809,3 +820,19 @@ class TestNBAStatsResponse:
             self.nbastatsresponse(response).get_data_sets(endpoint=response["endpoint"])
             == response["exp_data_sets"]
         )
+
+
+def test_normalized_rows_are_built_on_access():
+    response = NBAStatsResponse(
+        '{"resultSets": [{"name": "PlayerGameLogs", "headers": ["PLAYER_ID", "PTS"], '
+        '"rowSet": [[2544, 30], [201939, 25], [203507, 28]]}]}',
+        200,
+        None,
+    )
+    rows = response.get_normalized_dict(lazy=True)["PlayerGameLogs"]
+
+    assert len(rows) == 3
+    assert rows[1] == {"PLAYER_ID": 201939, "PTS": 25}
+    assert rows[-1]["PTS"] == 28
+    assert rows[:1] == [{"PLAYER_ID": 2544, "PTS": 30}]
+    assert list(response.get_data_set_names()) == ["PlayerGameLogs"]
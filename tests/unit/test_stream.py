@@ -0,0 +1,92 @@
+import io
+import json
+import pytest
+import requests
+from unittest.mock import Mock
+from nba_api.library.http import NBAHTTP
+from nba_api.library.stream import iter_result_set_rows
+from nba_api.stats.endpoints import PlayerGameLog, ShotChartLeagueWide
+
+pytest.importorskip("ijson")
+
+contents = json.dumps(
+    {
+        "resource": "playergamelog",
+        "parameters": {"PlayerID": 2544, "Season": "2023-24"},
+        "resultSets": [
+            {
+                "name": "PlayerGameLog",
+                "headers": ["Player_ID", "Game_ID", "FG_PCT"],
+                "rowSet": [
+                    [2544, "0022300001", 0.5],
+                    [2544, "0022300002", None],
+                    [2544, "0022300003", 0.625],
+                ],
+            },
+            {"name": "Empty", "headers": ["A"], "rowSet": []},
+        ],
+    }
+).encode("utf-8")
+
+
+@pytest.fixture
+def mock_session():
+    session = Mock(spec=requests.Session)
+    response = Mock()
+    response.status_code = 200
+    response.raw = io.BytesIO(contents)
+    session.get.return_value = response
+    NBAHTTP.set_session(session)
+    yield session
+    NBAHTTP._session = None
+
+
+def test_iter_result_set_rows_yields_rows():
+    rows = list(iter_result_set_rows(io.BytesIO(contents)))
+    assert rows[0] == ("PlayerGameLog", ["Player_ID", "Game_ID", "FG_PCT"], [2544, "0022300001", 0.5])
+    assert [row[2][1] for row in rows] == ["0022300001", "0022300002", "0022300003"]
+    assert isinstance(rows[2][2][2], float)
+
+
+def test_iter_result_set_rows_yields_batches():
+    batches = list(iter_result_set_rows(io.BytesIO(contents), batch_size=2))
+    assert [len(rows) for _, _, rows in batches] == [2, 1]
+    assert batches[1][2] == [[2544, "0022300003", 0.625]]
+
+
+def test_iter_result_set_rows_single_result_set_and_multi_level_headers():
+    headers = [{"name": "SHOT_CATEGORY", "columnNames": ["Restricted Area"]}, {"columnNames": ["FGM"]}]
+    data = {"resultSet": {"name": "League_Wide", "headers": headers, "rowSet": [[10]]}}
+    rows = list(iter_result_set_rows(io.BytesIO(json.dumps(data).encode("utf-8"))))
+    assert rows == [("League_Wide", headers, [10])]
+
+
+def test_iter_result_set_rows_result_set_list():
+    data = {
+        "resultSet": [
+            {"name": "First", "headers": ["A"], "rowSet": [[1], [2]]},
+            {"name": "Second", "headers": ["B"], "rowSet": [[3]]},
+        ]
+    }
+    batches = list(
+        iter_result_set_rows(io.BytesIO(json.dumps(data).encode("utf-8")), batch_size=5)
+    )
+    assert batches == [("First", ["A"], [[1], [2]]), ("Second", ["B"], [[3]])]
+
+
+def test_endpoint_stream(mock_session):
+    endpoint = PlayerGameLog(player_id=2544, get_request=False)
+    batches = list(endpoint.stream(batch_size=10))
+
+    assert len(batches) == 1
+    assert batches[0][0] == "PlayerGameLog"
+    assert len(batches[0][2]) == 3
+    assert endpoint.nba_response is None
+    assert mock_session.get.call_args.kwargs["stream"] is True
+    mock_session.get.return_value.close.assert_called_once()
+
+
+def test_stream_raises_on_error_status(mock_session):
+    mock_session.get.return_value.status_code = 500
+    with pytest.raises(Exception, match="status code 500"):
+        list(ShotChartLeagueWide(get_request=False).stream())
@@ -0,0 +1,151 @@
+"""
+Micro-benchmark of the PlayByPlayV3 parser.
+
+Times ``NBAStatsPlayByPlayParserV3.get_playbyplay_data`` against the per-field
+``dict.get`` loop it replaced, on a recorded game, and checks that both build
+the same rows.
+
+Record a game once with:
+    >>> from nba_api.stats.endpoints import PlayByPlayV3
+    >>> with open('playbyplayv3.json', 'w') as f:
+    ...     f.write(PlayByPlayV3(game_id='0022400001').get_json())
+
+and run:
+    python -m tools.benchmarks.playbyplayv3 playbyplayv3.json
+
+Without a file, a synthetic game of the same size as a full game is used.
+"""
+
+import argparse
+import json
+import timeit
+
+from nba_api.stats.endpoints._parsers.playbyplayv3 import NBAStatsPlayByPlayParserV3
+
+
+def get_reference_playbyplay_data(nba_dict):
+    """Rows built with one ``dict.get`` call per field and action."""
+    game = nba_dict.get("game", {})
+    game_id = game.get("gameId")
+    actions = game.get("actions", [])
+
+    data = []
+    for action in actions:
+        row = [
+            game_id,
+            action.get("actionNumber"),
+            action.get("clock"),
+            action.get("period"),
+            action.get("teamId"),
+            action.get("teamTricode"),
+            action.get("personId"),
+            action.get("playerName"),
+            action.get("playerNameI"),
+            action.get("xLegacy"),
+            action.get("yLegacy"),
+            action.get("shotDistance"),
+            action.get("shotResult"),
+            action.get("isFieldGoal"),
+            action.get("scoreHome"),
+            action.get("scoreAway"),
+            action.get("pointsTotal"),
+            action.get("location"),
+            action.get("description"),
+            action.get("actionType"),
+            action.get("subType"),
+            action.get("videoAvailable"),
+            action.get("shotValue"),
+            action.get("actionId"),
+        ]
+        data.append(row)
+
+    return data
+
+
+def get_synthetic_game(action_count=650):
+    """A response with ``action_count`` actions shaped like a real game."""
+    action_types = ("2pt", "3pt", "rebound", "foul", "turnover", "substitution")
+    actions = []
+    for number in range(1, action_count + 1):
+        action_type = action_types[number % len(action_types)]
+        is_shot = action_type in ("2pt", "3pt")
+        actions.append(
+            {
+                "actionNumber": number,
+                "clock": "PT{:02d}M{:02d}.00S".format(11 - number % 12, number % 60),
+                "period": 1 + number * 4 // action_count,
+                "teamId": 1610612739 if number % 2 else 1610612752,
+                "teamTricode": "CLE" if number % 2 else "NYK",
+                "personId": 1629000 + number % 26,
+                "playerName": "Player {}".format(number % 26),
+                "playerNameI": "P. {}".format(number % 26),
+                "xLegacy": number % 250,
+                "yLegacy": number % 300,
+                "shotDistance": number % 28 if is_shot else 0,
+                "shotResult": ("Made" if number % 3 else "Missed") if is_shot else "",
+                "isFieldGoal": int(is_shot),
+                "scoreHome": str(number // 6),
+                "scoreAway": str(number // 7),
+                "pointsTotal": number // 6 + number // 7,
+                "location": "h" if number % 2 else "v",
+                "description": "Description of action {}".format(number),
+                "actionType": action_type,
+                "subType": "jump-shot" if is_shot else "",
+                "videoAvailable": 1,
+                "shotValue": 3 if action_type == "3pt" else 2 if is_shot else 0,
+                "actionId": number,
+            }
+        )
+    return {"game": {"gameId": "0022400001", "videoAvailable": 1, "actions": actions}}
+
+
+def run(nba_dict, number=200, repeat=10):
+    """Time both extractors, returning ``(reference, compiled)`` seconds per game."""
+    parser = NBAStatsPlayByPlayParserV3(nba_dict)
+    if parser.get_playbyplay_data() != get_reference_playbyplay_data(nba_dict):
+        raise AssertionError("The parser and the reference build different rows.")
+
+    # Alternate the two so that load on the machine affects both alike.
+    reference = compiled = float("inf")
+    for _ in range(repeat):
+        reference = min(
+            reference,
+            timeit.timeit(
+                lambda: get_reference_playbyplay_data(nba_dict), number=number
+            ),
+        )
+        compiled = min(
+            compiled, timeit.timeit(parser.get_playbyplay_data, number=number)
+        )
+    return reference / number, compiled / number
+
+
+def main():
+    argument_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    argument_parser.add_argument(
+        "payload", nargs="?", help="A recorded playbyplayv3 response (JSON)."
+    )
+    argument_parser.add_argument("--number", type=int, default=200)
+    argument_parser.add_argument("--repeat", type=int, default=10)
+    args = argument_parser.parse_args()
+
+    if args.payload:
+        with open(args.payload, "r", encoding="utf-8") as f:
+            nba_dict = json.load(f)
+    else:
+        nba_dict = get_synthetic_game()
+
+    action_count = len(nba_dict.get("game", {}).get("actions", []))
+    reference, compiled = run(nba_dict, number=args.number, repeat=args.repeat)
+    print("actions per game: {}".format(action_count))
+    for name, seconds in (("dict.get loop", reference), ("compiled", compiled)):
+        print(
+            "{:<14} {:8.1f} us/game {:12,.0f} actions/s".format(
+                name, seconds * 1e6, action_count / seconds
+            )
+        )
+    print("speedup: {:.2f}x".format(reference / compiled))
+
+
+if __name__ == "__main__":
+    main()
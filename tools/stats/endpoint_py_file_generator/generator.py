@@ -1,12 +1,120 @@
 import os
+import re
 
 from .template import argument_template, no_default_argument_template
 from .template import parameter_template, data_set_template, imports_template
-from .template import file_template
+from .template import file_template, load_data_sets_template, no_data_sets_template
+from .template import column_type_template, data_set_schema_template
+from .template import data_set_schemas_template, empty_data_set_schema_template
+from .template import no_data_set_schemas_template
 from tools.stats.endpoint_analysis.analysis import load_endpoint_file
 from tools.library.functions import get_python_variable_name
 from tools.stats.library.mapping import parameter_variations, parameter_map
 
+# Header fragments of columns holding fractions, matched against the
+# upper-cased, underscore separated column name.
+float_column_suffixes = ("_PCT", "_PERCENTAGE", "_RATING", "_RATIO")
+float_column_prefixes = ("PCT_", "E_", "PACE", "PIE", "USG")
+
+# Columns repeating a handful of values across rows, which are dictionary
+# encoded when DataFrames are built in categorical mode.
+category_column_names = ("WL", "MATCHUP", "SEASON", "SEASON_ID")
+category_column_suffixes = (
+    "ABBREVIATION",
+    "TRICODE",
+    "TEAM_CITY",
+    "TEAM_NAME",
+    "TEAM_SLUG",
+    "_WL",
+    "CONFERENCE",
+    "DIVISION",
+    "POSITION",
+    "SEASON_YEAR",
+    "TYPE",
+    "SHOT_ZONE_AREA",
+    "SHOT_ZONE_BASIC",
+    "SHOT_ZONE_RANGE",
+    "STATUS_TEXT",
+    "LOCATION",
+    "OUTCOME",
+    "GROUP_SET",
+)
+
+
+def get_column_type(column_name):
+    """Schema type of a result set column, or None to infer it from the values.
+
+    Low-cardinality columns such as TEAM_ABBREVIATION, MATCHUP, teamTricode
+    or actionType are categories. IDs and ranks (W_PCT_RANK, RANK_FG_PCT) are
+    integers, except game and league IDs, which keep their leading zeros as
+    strings. Columns such as GAME_DATE, gameDateTimeUTC or BIRTHDATE are
+    dates, and percentages and ratings are floats. Counting stats are not typed: depending on PerMode
+    they hold totals or averages.
+    """
+    if not isinstance(column_name, str):
+        return None
+    # personId -> PERSON_ID, Game_ID -> GAME_ID, LeagueID -> LEAGUE_ID
+    name = re.sub(r"(?<=[a-z0-9])(?=[A-Z])", "_", column_name).upper()
+    # Ranks are whole numbers, even of percentages (FG_PCT_RANK, RANK_FG_PCT).
+    if name == "RANK" or name.endswith("_RANK") or name.startswith("RANK_"):
+        return "int"
+    # location1, SUBTYPE2... -> LOCATION, SUBTYPE
+    base_name = name.rstrip("0123456789")
+    if base_name in category_column_names or base_name.endswith(
+        category_column_suffixes
+    ):
+        return "category"
+    if (
+        name in ("GAME_ID", "LEAGUE_ID")
+        or name.endswith("_GAME_ID")
+        or re.fullmatch(r".*GAME_\d+_ID", name)
+    ):
+        return "str"
+    if name.endswith("ID"):
+        return "int"
+    if name.endswith("DATE") or "DATE" in name.split("_"):
+        return "date"
+    if name.endswith(float_column_suffixes) or name.startswith(float_column_prefixes):
+        return "float"
+    return None
+
+
+def get_data_set_schemas(data_sets):
+    schemas = {}
+    for data_set_name, column_names in data_sets.items():
+        schema = {}
+        for column_name in column_names:
+            column_type = get_column_type(column_name)
+            if column_type is not None:
+                schema[column_name] = column_type
+        schemas[data_set_name] = schema
+    return schemas
+
+
+def get_data_set_schemas_source(schemas):
+    """Source of an ``expected_schema`` dict, one column per line."""
+    if not schemas:
+        return no_data_set_schemas_template
+    data_set_schemas = []
+    for data_set_name, schema in schemas.items():
+        if not schema:
+            data_set_schemas.append(
+                empty_data_set_schema_template.format(data_set_name=data_set_name)
+            )
+            continue
+        column_types = "\n".join(
+            column_type_template.format(column_name=column_name, column_type=column_type)
+            for column_name, column_type in schema.items()
+        )
+        data_set_schemas.append(
+            data_set_schema_template.format(
+                data_set_name=data_set_name, column_types=column_types
+            )
+        )
+    return data_set_schemas_template.format(
+        data_set_schemas="\n".join(data_set_schemas)
+    )
+
 
 def get_endpoint_contents(endpoint, endpoint_analysis):
     arguments_list = []
@@ -95,7 +203,12 @@ def get_endpoint_contents(endpoint, endpoint_analysis):
 
     arguments = ",\n".join(arguments_list)
     parameters = ",\n".join(parameters_list)
-    data_set_variables = "\n".join(data_set_lists)
+    if data_set_lists:
+        load_data_sets = load_data_sets_template.format(
+            data_set_variables="\n".join(data_set_lists)
+        )
+    else:
+        load_data_sets = no_data_sets_template
     imports = ""
     if imports_list:
         imports = imports_template.format(imports_list=", ".join(imports_list))
@@ -105,9 +218,10 @@ def get_endpoint_contents(endpoint, endpoint_analysis):
         endpoint=endpoint,
         endpoint_lowercase=endpoint.lower(),
         data_sets=data_sets,
+        data_set_schemas=get_data_set_schemas_source(get_data_set_schemas(data_sets)),
         arguments=arguments,
         parameters=parameters,
-        data_set_variables=data_set_variables,
+        load_data_sets=load_data_sets,
     )
 
     return file_contents
@@ -5,6 +5,7 @@ from nba_api.stats.library.http import NBAStatsHTTP{imports}
 class {endpoint}(Endpoint):
     endpoint = '{endpoint_lowercase}'
     expected_data = {data_sets}
+    expected_schema = {data_set_schemas}
 
     nba_response = None
     data_sets = None
@@ -39,13 +40,30 @@ class {endpoint}(Endpoint):
         self.load_response()
         
     def load_response(self):
-        data_sets = self.nba_response.get_data_sets()
-        self.data_sets = [Endpoint.DataSet(data=data_set) for data_set_name, data_set in data_sets.items()]
-{data_set_variables}
+{load_data_sets}
 """
 
+load_data_sets_template = """        data_sets = self.load_data_sets()
+{data_set_variables}"""
+
+no_data_sets_template = """        self.load_data_sets()"""
+
+no_data_set_schemas_template = """{}"""
+
+data_set_schemas_template = """{{
+{data_set_schemas}
+    }}"""
+
+data_set_schema_template = """        '{data_set_name}': {{
+{column_types}
+        }},"""
+
+empty_data_set_schema_template = """        '{data_set_name}': {{}},"""
+
+column_type_template = """            '{column_name}': '{column_type}',"""
+
 data_set_template = (
-    """        self.{variable_name} = Endpoint.DataSet(data=data_sets['{key_name}'])"""
+    """        self.{variable_name} = data_sets['{key_name}']"""
 )
 
 imports_template = """\nfrom nba_api.stats.library.parameters import {imports_list}"""